@@ -7,21 +7,30 @@ st.set_page_config(page_title="MLB 선수 분석 대시보드", page_icon="⚾
 from streamlit_option_menu import option_menu
 import time
 import datetime
-from home import run_home
-from search import run_search
-from predict import run_predict
-from trend import run_trend
-from data_status import show_data_status
+import importlib
 from PIL import Image
-from utils import set_chart_style, load_logo_image # load_logo_image 추가
+from utils import load_logo_image # load_logo_image 추가
 from app_metrics import init_metrics, timing_decorator
 from i18n import get_text, get_languages
 from config import MLB_LOGO_PATH # 설정 파일에서 로고 경로 가져오기
 
-# 테마와 메트릭 초기화
-set_chart_style()
+# 메트릭 초기화 (차트 스타일은 차트를 그리는 페이지에서 처음 적용)
 metric_tracker = init_metrics()
 
+# 페이지 레지스트리: 페이지 모듈(과 모듈이 로드하는 데이터)은 처음 이동할 때만 import
+PAGES = {
+    "home": ("home", "run_home"),
+    "search": ("search", "run_search"),
+    "predict": ("predict", "run_predict"),
+    "trend": ("trend", "run_trend"),
+    "data_status": ("data_status", "show_data_status"),
+}
+
+def load_page(page):
+    """페이지 실행 함수를 반환합니다. 모듈은 프로세스당 한 번만 import됩니다."""
+    module_name, func_name = PAGES[page]
+    return getattr(importlib.import_module(module_name), func_name)
+
 @timing_decorator
 def main():
     """MLB 선수 분석 대시보드 메인 함수"""
@@ -86,15 +95,15 @@ def main():
     trend_text = get_text("trend_analysis", lang)
     
     if selected == home_text:
-        run_home(lang)
+        load_page("home")(lang)
     elif selected == search_text:
-        run_search(lang)
+        load_page("search")(lang)
     elif selected == predict_text:
-        run_predict(lang)
+        load_page("predict")(lang)
     elif selected == trend_text:
-        run_trend(lang)
+        load_page("trend")(lang)
     elif selected == "📊 데이터 상태":
-        show_data_status()
+        load_page("data_status")()
 
     # 성능 모니터링 - 사이드바 하단에 표시
     with st.sidebar.expander("📊 앱 성능 메트릭"):
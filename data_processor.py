@@ -10,8 +10,8 @@ import time
 from datetime import datetime, timedelta
 import logging
 from typing import List, Dict, Optional
-import os
 from config import DATA_DIR, BATTER_STATS_FILE, PITCHER_STATS_FILE
+from predict_mlb.data.partitioned_store import upsert_dataset
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -183,28 +183,17 @@ class MLBDataProcessor:
         
         return pd.DataFrame(all_pitching_data)
     
-    def merge_with_existing_data(self, new_data: pd.DataFrame, existing_file: str) -> pd.DataFrame:
-        """새 데이터를 기존 데이터와 병합"""
-        try:
-            if os.path.exists(existing_file):
-                existing_data = pd.read_csv(existing_file)
-                
-                # 중복 제거를 위해 PlayerID, Season 기준으로 병합
-                combined_data = pd.concat([existing_data, new_data], ignore_index=True)
-                combined_data = combined_data.drop_duplicates(
-                    subset=['PlayerID', 'Season'], 
-                    keep='last'
-                ).sort_values(['PlayerName', 'Season'])
-                
-                return combined_data
-            else:
-                return new_data
-        except Exception as e:
-            logger.error(f"데이터 병합 실패: {e}")
-            return new_data
-    
-    def update_data(self, start_year: int = 2024, end_year: int = None):
-        """데이터 업데이트 실행"""
+    def update_data(self, start_year: int = 2024, end_year: int = None, export_csv: bool = False):
+        """
+        데이터 업데이트 실행
+        
+        새 데이터는 시즌 파티션 저장소에 병합되며, 새 데이터에 포함된 시즌 파일만 다시 씁니다.
+        
+        Args:
+            start_year: 시작 연도
+            end_year: 끝 연도
+            export_csv: 병합 후 단일 CSV 파일도 전체 재작성할지 여부 (CSV를 직접 읽는 도구용)
+        """
         seasons = self.get_seasons_list(start_year, end_year)
         logger.info(f"데이터 업데이트 시작: {seasons}")
         
@@ -212,20 +201,14 @@ class MLBDataProcessor:
         logger.info("타자 데이터 수집 시작...")
         new_batting_data = self.collect_batting_stats(seasons)
         if not new_batting_data.empty:
-            updated_batting_data = self.merge_with_existing_data(
-                new_batting_data, BATTER_STATS_FILE
-            )
-            updated_batting_data.to_csv(BATTER_STATS_FILE, index=False)
+            upsert_dataset(new_batting_data, BATTER_STATS_FILE, export_csv=export_csv)
             logger.info(f"타자 데이터 업데이트 완료: {len(new_batting_data)}개 레코드 추가")
         
         # 투수 데이터 수집 및 업데이트
         logger.info("투수 데이터 수집 시작...")
         new_pitching_data = self.collect_pitching_stats(seasons)
         if not new_pitching_data.empty:
-            updated_pitching_data = self.merge_with_existing_data(
-                new_pitching_data, PITCHER_STATS_FILE
-            )
-            updated_pitching_data.to_csv(PITCHER_STATS_FILE, index=False)
+            upsert_dataset(new_pitching_data, PITCHER_STATS_FILE, export_csv=export_csv)
             logger.info(f"투수 데이터 업데이트 완료: {len(new_pitching_data)}개 레코드 추가")
         
         logger.info("데이터 업데이트 완료!")
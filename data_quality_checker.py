@@ -10,6 +10,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Tuple, Any
 from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+from predict_mlb.data.partitioned_store import dataset_exists, read_dataset
+from predict_mlb.data.schema import BATTER_SCHEMA, PITCHER_SCHEMA, apply_schema
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,6 +26,7 @@ class DataQualityChecker:
     def __init__(self):
         self.batter_file = BATTER_STATS_FILE
         self.pitcher_file = PITCHER_STATS_FILE
+        self._frames = {}
         
         # 예상 컬럼 정의
         self.expected_batter_columns = [
@@ -60,13 +63,20 @@ class DataQualityChecker:
             'InningsPitched': (0, 300)
         }
     
+    def _load_frame(self, player_type: str) -> pd.DataFrame:
+        """선언된 스키마로 원본 데이터를 로드합니다 (결측치는 그대로 유지, 검증기당 1회, 시즌 파티션 우선)"""
+        if player_type not in self._frames:
+            if player_type == 'batter':
+                self._frames[player_type] = apply_schema(read_dataset(self.batter_file), BATTER_SCHEMA)
+            else:
+                self._frames[player_type] = apply_schema(read_dataset(self.pitcher_file), PITCHER_SCHEMA)
+        return self._frames[player_type]
+    
     def check_file_existence(self) -> Dict[str, bool]:
-        """파일 존재 여부 확인"""
-        import os
-        
+        """파일 존재 여부 확인 (시즌 파티션 저장소 또는 CSV)"""
         result = {
-            'batter_file_exists': os.path.exists(self.batter_file),
-            'pitcher_file_exists': os.path.exists(self.pitcher_file)
+            'batter_file_exists': dataset_exists(self.batter_file),
+            'pitcher_file_exists': dataset_exists(self.pitcher_file)
         }
         
         logger.info(f"파일 존재 확인: {result}")
@@ -78,7 +88,7 @@ class DataQualityChecker:
         
         try:
             # 타자 데이터 검증
-            batter_df = pd.read_csv(self.batter_file)
+            batter_df = self._load_frame('batter')
             result['batter'] = {
                 'total_records': len(batter_df),
                 'columns': list(batter_df.columns),
@@ -91,7 +101,7 @@ class DataQualityChecker:
             }
             
             # 투수 데이터 검증
-            pitcher_df = pd.read_csv(self.pitcher_file)
+            pitcher_df = self._load_frame('pitcher')
             result['pitcher'] = {
                 'total_records': len(pitcher_df),
                 'columns': list(pitcher_df.columns),
@@ -115,7 +125,7 @@ class DataQualityChecker:
         
         try:
             # 타자 데이터 품질 검증
-            batter_df = pd.read_csv(self.batter_file)
+            batter_df = self._load_frame('batter')
             batter_issues = []
             
             # 중복 레코드 검사
@@ -142,7 +152,7 @@ class DataQualityChecker:
             }
             
             # 투수 데이터 품질 검증
-            pitcher_df = pd.read_csv(self.pitcher_file)
+            pitcher_df = self._load_frame('pitcher')
             pitcher_issues = []
             
             # 중복 레코드 검사
@@ -182,7 +192,7 @@ class DataQualityChecker:
         
         try:
             # 타자 데이터 시즌별 통계
-            batter_df = pd.read_csv(self.batter_file)
+            batter_df = self._load_frame('batter')
             batter_season_stats = batter_df.groupby('Season').agg({
                 'PlayerID': 'count',
                 'BattingAverage': ['mean', 'std'],
@@ -193,7 +203,7 @@ class DataQualityChecker:
             result['batter_by_season'] = batter_season_stats.to_dict()
             
             # 투수 데이터 시즌별 통계
-            pitcher_df = pd.read_csv(self.pitcher_file)
+            pitcher_df = self._load_frame('pitcher')
             pitcher_season_stats = pitcher_df.groupby('Season').agg({
                 'PlayerID': 'count',
                 'EarnedRunAverage': ['mean', 'std'],
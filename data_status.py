@@ -4,22 +4,24 @@
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import os
 from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
 from i18n import get_text
+from predict_mlb.data.partitioned_store import dataset_exists, dataset_stat, read_dataset
+from predict_mlb.utils.lazy_import import lazy_import
+
+# plotly는 차트를 그릴 때 로드
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
 
 def show_data_status():
     """데이터 상태 대시보드"""
     
     st.title("📊 " + get_text("data_status_title", "데이터 상태 모니터링"))
     
-    # 데이터 파일 존재 여부 확인
-    batter_exists = os.path.exists(BATTER_STATS_FILE)
-    pitcher_exists = os.path.exists(PITCHER_STATS_FILE)
+    # 데이터 존재 여부 확인 (시즌 파티션 저장소 또는 CSV)
+    batter_exists = dataset_exists(BATTER_STATS_FILE)
+    pitcher_exists = dataset_exists(PITCHER_STATS_FILE)
     
     # 상태 표시
     col1, col2 = st.columns(2)
@@ -43,8 +45,9 @@ def show_data_status():
     
     # 데이터 로딩
     try:
-        batter_df = pd.read_csv(BATTER_STATS_FILE)
-        pitcher_df = pd.read_csv(PITCHER_STATS_FILE)
+        # 업데이트는 시즌 파티션에만 기록되므로 파티션이 있으면 파티션을 읽음 (결측치 검사용 원본 값)
+        batter_df = read_dataset(BATTER_STATS_FILE)
+        pitcher_df = read_dataset(PITCHER_STATS_FILE)
     except Exception as e:
         st.error(f"데이터 로딩 실패: {e}")
         return
@@ -247,9 +250,9 @@ def show_data_status():
     
     with col1:
         if batter_exists:
-            batter_stat = os.stat(BATTER_STATS_FILE)
-            batter_size = batter_stat.st_size / (1024 * 1024)  # MB
-            batter_modified = datetime.fromtimestamp(batter_stat.st_mtime)
+            batter_bytes, batter_mtime = dataset_stat(BATTER_STATS_FILE)
+            batter_size = batter_bytes / (1024 * 1024)  # MB
+            batter_modified = datetime.fromtimestamp(batter_mtime)
             
             st.write("**타자 데이터 파일**")
             st.write(f"크기: {batter_size:.2f} MB")
@@ -257,9 +260,9 @@ def show_data_status():
     
     with col2:
         if pitcher_exists:
-            pitcher_stat = os.stat(PITCHER_STATS_FILE)
-            pitcher_size = pitcher_stat.st_size / (1024 * 1024)  # MB
-            pitcher_modified = datetime.fromtimestamp(pitcher_stat.st_mtime)
+            pitcher_bytes, pitcher_mtime = dataset_stat(PITCHER_STATS_FILE)
+            pitcher_size = pitcher_bytes / (1024 * 1024)  # MB
+            pitcher_modified = datetime.fromtimestamp(pitcher_mtime)
             
             st.write("**투수 데이터 파일**")
             st.write(f"크기: {pitcher_size:.2f} MB")
@@ -1,23 +1,167 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import numpy as np
-from prophet import Prophet
-from utils import load_data, load_pitcher_data
-from matplotlib import rc
+from contextlib import closing
+from itertools import chain
+from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+from utils import load_batter_index, load_pitcher_index, set_chart_style, get_font_properties, get_data_version, load_marcel_projections
 from streamlit_option_menu import option_menu
 from i18n import get_text
+from predict_mlb.config.settings import (FORECAST_BACKEND, PREDICT_LATENCY_BUDGET, PREDICT_MAX_PERIODS, PREDICT_METRIC_RANGES,
+                                         PREDICT_PERIODS, PREDICT_REQUIRED_SEASONS)
+from predict_mlb.models.batch_forecaster import make_jobs
+from predict_mlb.models.forecast_cache import get_forecast_cache
+from predict_mlb.models.forecast_store import get_forecast_store
+from predict_mlb.services.compute_worker import get_compute_service, get_interactive_forecaster
+from predict_mlb.utils.lazy_import import lazy_import
+
+# matplotlib은 차트를 처음 그릴 때 로드 (모델 훈련은 일괄 예측기에서 실행)
+plt = lazy_import("matplotlib.pyplot")
 
 path = 'font/H2GTRM.TTF'
-fontprop = fm.FontProperties(fname=path, size=12)
-rc('font', family=fontprop.get_name())
+
+
+def render_metric_forecast(player, metric, min_val, max_val, player_metric_data, forecast, lang="ko", periods=PREDICT_PERIODS):
+    """
+    지표 하나의 예측 그래프와 결과 표를 그립니다.
+    
+    Args:
+        player: 선수 이름
+        metric: 예측한 지표
+        min_val: Y축 최소값
+        max_val: Y축 최대값
+        player_metric_data: 실제 기록 ('ds', 'y')
+        forecast: 예측 결과 ('ds', 'yhat', 'yhat_lower', 'yhat_upper')
+        lang: 언어 코드 (기본값: 'ko')
+        periods: 표시할 미래 기간 (연도 수, 예측 결과의 앞부분만 사용)
+    """
+    # 예측 결과 시각화
+    predict_title = {
+        'ko': f"{metric} 예측",
+        'en': f"{metric} Prediction",
+        'ja': f"{metric} 予測"
+    }
+    st.subheader(predict_title.get(lang, predict_title['ko']))
+
+    set_chart_style()
+    plt.rc('font', family=get_font_properties(path).get_name())
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # 라벨 텍스트 정의
+    label_text = {
+        'ko': {'actual': '실제 기록', 'predict': '예측', 'interval': '95% 신뢰 구간'},
+        'en': {'actual': 'Actual Records', 'predict': 'Prediction', 'interval': '95% Confidence Interval'},
+        'ja': {'actual': '実績', 'predict': '予測', 'interval': '95% 信頼区間'}
+    }
+
+    # 현재 언어에 맞는 라벨 선택
+    current_labels = label_text.get(lang, label_text['ko'])
+
+    # 실제 데이터 플롯
+    ax.plot(player_metric_data['ds'].dt.year, player_metric_data['y'], 'ko-', label=current_labels['actual'])
+
+    # 예측 데이터 플롯
+    future_forecast = forecast[forecast['ds'] > player_metric_data['ds'].max()].head(periods)
+    ax.plot(future_forecast['ds'].dt.year, future_forecast['yhat'], 'b-', label=current_labels['predict'])
+    ax.fill_between(future_forecast['ds'].dt.year, future_forecast['yhat_lower'], future_forecast['yhat_upper'], alpha=0.2, label=current_labels['interval'])
+
+    title_text = {
+        'ko': f"{player}의 향후 {periods}년 {metric} 예측 그래프",
+        'en': f"{player}'s {periods}-Year {metric} Prediction Graph",
+        'ja': f"{player}の今後{periods}年間の{metric}予測グラフ"
+    }
+    xlabel_text = {
+        'ko': "시즌",
+        'en': "Season",
+        'ja': "シーズン"
+    }
+
+    ax.set_title(title_text.get(lang, title_text['ko']), fontproperties=get_font_properties(path))
+    ax.set_xlabel(xlabel_text.get(lang, xlabel_text['ko']), fontproperties=get_font_properties(path))
+    ax.set_ylabel(metric, fontproperties=get_font_properties(path))
+    ax.legend(prop=get_font_properties(path))
+    plt.xticks(rotation=45)
+
+    # Y축 범위 설정 (지표에 따라 적절한 범위 설정)
+    ax.set_ylim(min_val, max_val)
+
+    st.pyplot(fig)
+
+    # 예측 결과 표 형태로 보여주기
+    result_title = {
+        'ko': f"{metric} 예측 결과",
+        'en': f"{metric} Prediction Results",
+        'ja': f"{metric} 予測結果"
+    }
+
+    column_names = {
+        'ko': ['Season', '예측값', '하한값', '상한값'],
+        'en': ['Season', 'Prediction', 'Lower Bound', 'Upper Bound'],
+        'ja': ['シーズン', '予測値', '下限値', '上限値']
+    }
+
+    st.subheader(result_title.get(lang, result_title['ko']))
+    future_result = future_forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
+    future_result.columns = column_names.get(lang, column_names['ko'])
+    future_result['Season'] = future_result['Season'].dt.year
+
+    # 자릿수 형식 지정
+    if metric in ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Whip']:
+        st.dataframe(future_result.style.format({
+            '예측값': "{:.3f}",
+            '하한값': "{:.3f}",
+            '상한값': "{:.3f}"
+        }))
+    else:
+        st.dataframe(future_result.style.format({
+            '예측값': "{:.1f}",
+            '하한값': "{:.1f}",
+            '상한값': "{:.1f}"
+        }))
+
+
+def render_marcel_projection(player_id, metrics, player_type, lang="ko"):
+    """
+    Prophet 예측이 불가능한 선수에게 Marcel 방식 다음 시즌 예측을 보여줍니다.
+    
+    Args:
+        player_id: 선수 ID
+        metrics: 예측 지표 목록
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
+        lang: 언어 코드 (기본값: 'ko')
+    """
+    projections = load_marcel_projections(player_type)
+    row = projections[projections['PlayerID'] == player_id]
+    if row.empty:
+        return
+    row = row.iloc[0]
+    season = int(row['Season'])
+    title_text = {
+        'ko': f"{season} 시즌 기본 예측 (Marcel)",
+        'en': f"{season} Season Baseline Projection (Marcel)",
+        'ja': f"{season}シーズン基本予測 (Marcel)"
+    }
+    caption_text = {
+        'ko': f"최근 3시즌 가중 평균을 리그 평균 쪽으로 보정한 예측입니다. 신뢰도: {row['Reliability']:.0%}",
+        'en': f"Weighted 3-season average regressed toward the league mean. Reliability: {row['Reliability']:.0%}",
+        'ja': f"直近3シーズンの加重平均をリーグ平均に回帰させた予測です。信頼度: {row['Reliability']:.0%}"
+    }
+    st.subheader(title_text.get(lang, title_text['ko']))
+    st.caption(caption_text.get(lang, caption_text['ko']))
+    projected = pd.DataFrame([{metric: row[metric] for metric in metrics if metric in row.index}])
+    st.dataframe(projected.style.format({
+        metric: "{:.3f}" if metric in ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Whip'] else "{:.1f}"
+        for metric in projected.columns
+    }))
 
 
 def run_predict(lang="ko"):
     """선수별 기록을 입력받아 미래 시즌의 성적을 예측하고 시각화합니다."""
     st.title(get_text('predict_title', lang))
 
+    # Prophet 백엔드면 선수를 고르는 동안 계산 작업자를 띄워 예열 (감쇠 추세는 작업자를 쓰지 않음)
+    if FORECAST_BACKEND == 'prophet':
+        get_compute_service()
+
     # 다국어 메뉴 옵션 정의
     menu_options = {
         'ko': ['타자', '투수'],
@@ -46,31 +190,14 @@ def run_predict(lang="ko"):
     batter_options = {'ko': '타자', 'en': 'Batters', 'ja': '打者'}
     batter_option = batter_options.get(lang, '타자')
     
-    if selected == batter_option:
-        df = load_data()
-        player_names = [""] + sorted(df['PlayerName'].unique())
-        metrics = {
-            'BattingAverage': (0, 0.4),
-            'OnBasePercentage': (0, 0.7),
-            'SluggingPercentage': (0, 0.8),
-            'OPS': (0, 1.4)
-        }
-    else:
-        df = load_pitcher_data()
-        player_names = [""] + sorted(df['PlayerName'].unique())
-        metrics = {
-            'EarnedRunAverage': (0, 5),
-            'Wins': (0, 35),
-            'Losses': (0, 30),
-            'StrikeOuts': (0, 400),
-            'Whip': (0, 4),
-            'InningsPitched': (0, 400)
-        }
+    player_type = 'batter' if selected == batter_option else 'pitcher'
+    index = load_batter_index() if player_type == 'batter' else load_pitcher_index()
+    metrics = PREDICT_METRIC_RANGES[player_type]
 
     st.header(get_text("player_option", lang))
-    player = st.selectbox(get_text("select_player", lang), player_names, index=0)
+    player = st.selectbox(get_text("select_player", lang), [""] + index.players, index=0)
 
-    player_data = df[df['PlayerName'] == player]
+    player_data = index.get_player(player)
 
     if not player_data.empty:
         tab1, tab2 = st.tabs([get_text("player_info", lang), get_text("prediction_tab", lang)])
@@ -118,110 +245,63 @@ def run_predict(lang="ko"):
         with tab2:
             st.subheader(get_text("prediction_tab", lang))
 
-            seasons_required = [2022, 2023]
+            seasons_required = PREDICT_REQUIRED_SEASONS
             available_seasons = player_data['Season'].unique()
 
             if all(season in available_seasons for season in seasons_required):
-                player_data['Season'] = pd.to_datetime(player_data['Season'], format='%Y')
-
-                forecasts = {}
-
-                for metric, (min_val, max_val) in metrics.items():
-                    if metric not in player_data.columns:
-                        continue
-
-                    player_metric_data = player_data[['Season', metric]]
-                    player_metric_data.columns = ['ds', 'y']
-
-                    model = Prophet()
-                    model.fit(player_metric_data)
-                    future = model.make_future_dataframe(periods=5, freq='Y')
-                    forecast = model.predict(future)
-                    
-                    # 예측 결과 저장
-                    forecasts[metric] = forecast
-                    
-                    # 예측 결과 시각화
-                    predict_title = {
-                        'ko': f"{metric} 예측",
-                        'en': f"{metric} Prediction",
-                        'ja': f"{metric} 予測"
-                    }
-                    st.subheader(predict_title.get(lang, predict_title['ko']))
-                    
-                    fig, ax = plt.subplots(figsize=(10, 6))
-                    
-                    # 라벨 텍스트 정의
-                    label_text = {
-                        'ko': {'actual': '실제 기록', 'predict': '예측', 'interval': '95% 신뢰 구간'},
-                        'en': {'actual': 'Actual Records', 'predict': 'Prediction', 'interval': '95% Confidence Interval'},
-                        'ja': {'actual': '実績', 'predict': '予測', 'interval': '95% 信頼区間'}
-                    }
-                    
-                    # 현재 언어에 맞는 라벨 선택
-                    current_labels = label_text.get(lang, label_text['ko'])
-                    
-                    # 실제 데이터 플롯
-                    ax.plot(player_metric_data['ds'].dt.year, player_metric_data['y'], 'ko-', label=current_labels['actual'])
-                    
-                    # 예측 데이터 플롯
-                    future_forecast = forecast[forecast['ds'] > player_metric_data['ds'].max()]
-                    ax.plot(future_forecast['ds'].dt.year, future_forecast['yhat'], 'b-', label=current_labels['predict'])
-                    ax.fill_between(future_forecast['ds'].dt.year, future_forecast['yhat_lower'], future_forecast['yhat_upper'], alpha=0.2, label=current_labels['interval'])
-
-                    title_text = {
-                        'ko': f"{player}의 향후 5년 {metric} 예측 그래프",
-                        'en': f"{player}'s 5-Year {metric} Prediction Graph",
-                        'ja': f"{player}の今後5年間の{metric}予測グラフ"
-                    }
-                    xlabel_text = {
-                        'ko': "시즌",
-                        'en': "Season",
-                        'ja': "シーズン"
-                    }
-                    
-                    ax.set_title(title_text.get(lang, title_text['ko']), fontproperties=fontprop)
-                    ax.set_xlabel(xlabel_text.get(lang, xlabel_text['ko']), fontproperties=fontprop)
-                    ax.set_ylabel(metric, fontproperties=fontprop)
-                    ax.legend(prop=fontprop)
-                    plt.xticks(rotation=45)
-                    
-                    # Y축 범위 설정 (지표에 따라 적절한 범위 설정)
-                    ax.set_ylim(min_val, max_val)
-                    
-                    st.pyplot(fig)
-                    
-                    # 예측 결과 표 형태로 보여주기
-                    result_title = {
-                        'ko': f"{metric} 예측 결과",
-                        'en': f"{metric} Prediction Results",
-                        'ja': f"{metric} 予測結果"
-                    }
-                    
-                    column_names = {
-                        'ko': ['Season', '예측값', '하한값', '상한값'],
-                        'en': ['Season', 'Prediction', 'Lower Bound', 'Upper Bound'],
-                        'ja': ['シーズン', '予測値', '下限値', '上限値']
-                    }
-                    
-                    st.subheader(result_title.get(lang, result_title['ko']))
-                    future_result = future_forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
-                    future_result.columns = column_names.get(lang, column_names['ko'])
-                    future_result['Season'] = future_result['Season'].dt.year
-                    
-                    # 자릿수 형식 지정
-                    if metric in ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Whip']:
-                        st.dataframe(future_result.style.format({
-                            '예측값': "{:.3f}",
-                            '하한값': "{:.3f}",
-                            '상한값': "{:.3f}"
-                        }))
+                metric_ranges = {metric: value_range for metric, value_range in metrics.items()
+                                 if metric in player_data.columns}
+                horizon_label = {
+                    'ko': "예측 기간 (년)",
+                    'en': "Forecast horizon (years)",
+                    'ja': "予測期間 (年)"
+                }
+                periods = st.slider(horizon_label.get(lang, horizon_label['ko']), 1, PREDICT_MAX_PERIODS, PREDICT_PERIODS)
+                # 항상 최대 기간으로 예측해 두고 표시할 때 잘라 쓰므로, 기간을 바꿔도 다시 훈련하지 않고 캐시에서 조회
+                jobs = make_jobs(player_data, list(metric_ranges), periods=PREDICT_MAX_PERIODS)
+
+                # 야간 일괄 예측 결과가 있으면 바로 사용하고, 없는 지표만 실시간으로 훈련
+                store = get_forecast_store(BATTER_STATS_FILE if player_type == 'batter' else PITCHER_STATS_FILE)
+                data_version = get_data_version(player_type)
+                cached_results, pending_jobs = [], []
+                for job in jobs:
+                    cached = store.lookup_job(job, data_version)
+                    if cached is not None:
+                        cached_results.append(cached)
                     else:
-                        st.dataframe(future_result.style.format({
-                            '예측값': "{:.1f}",
-                            '하한값': "{:.1f}",
-                            '상한값': "{:.1f}"
-                        }))
+                        pending_jobs.append(job)
+
+                # 인덱스가 공유하는 원본 프레임을 건드리지 않도록 새 프레임으로 변환
+                player_data = player_data.assign(Season=pd.to_datetime(player_data['Season'], format='%Y'))
+
+                # 지표 순서대로 자리를 잡아 두고, 계산 작업자에서 끝나는 순서대로 채움
+                # (재실행/페이지 이동으로 스크립트가 중단되면 closing이 남은 작업을 취소)
+                # 응답 시간 예산을 넘긴 지표는 감쇠 추세 예측을 먼저 보여주고, 훈련은 뒤에서 계속해 캐시를 채움
+                slots = {metric: st.container() for metric in metric_ranges}
+                forecaster = get_interactive_forecaster()
+                if PREDICT_LATENCY_BUDGET > 0:
+                    live_results = forecaster.iter_results_within(pending_jobs, PREDICT_LATENCY_BUDGET, cache=get_forecast_cache())
+                else:
+                    live_results = forecaster.iter_results(pending_jobs, cache=get_forecast_cache())
+                fallback_msg = {
+                    'ko': "정밀 예측이 아직 계산 중이라 빠른 예측을 먼저 보여줍니다. 잠시 후 다시 열면 정밀 예측이 표시됩니다.",
+                    'en': "The full forecast is still being computed, so a quick forecast is shown. Reopen shortly to see the full forecast.",
+                    'ja': "詳細な予測を計算中のため、簡易予測を先に表示しています。しばらくしてから再度開くと詳細な予測が表示されます。"
+                }
+                with st.spinner(get_text("prediction_tab", lang)), closing(live_results):
+                    for result in chain(cached_results, live_results):
+                        metric = result.job.metric
+                        with slots[metric]:
+                            if not result.ok:
+                                st.error(f"{metric}: {result.error}")
+                                continue
+                            player_metric_data = player_data[['Season', metric]]
+                            player_metric_data.columns = ['ds', 'y']
+                            min_val, max_val = metric_ranges[metric]
+                            render_metric_forecast(player, metric, min_val, max_val,
+                                                   player_metric_data, result.forecast, lang, periods)
+                            if result.source == "fallback":
+                                st.caption(fallback_msg.get(lang, fallback_msg['ko']))
             else:
                 warning_msg = {
                     'ko': f"{player}의 최근 2개년(2022, 2023) 시즌 데이터가 없어 예측이 불가능합니다.",
@@ -229,6 +309,8 @@ def run_predict(lang="ko"):
                     'ja': f"{player}は予測に必要な最近のデータ（2022年、2023年）がありません。"
                 }
                 st.warning(warning_msg.get(lang, warning_msg['ko']))
+                # 최근 3시즌 기록이 있으면 Marcel 기본 예측은 제공
+                render_marcel_projection(player_data.iloc[0]['PlayerID'], list(metrics), player_type, lang)
     else:
         no_data_msg = {
             'ko': "선수 데이터가 존재하지 않습니다.",
@@ -0,0 +1,245 @@
+"""
+예측 백테스트 모듈: 과거 시점(origin)까지의 기록으로 훈련하고 이후 시즌 실제 기록과 비교합니다.
+
+여러 기준 시즌에 대해 그 시즌에 뛴 모든 선수/지표의 예측 작업을 만들고, 일괄 예측기로 백엔드별로
+실행한 뒤 h년 뒤 예측값을 실제값과 비교해 MAE, MAPE, 예측 구간 포함률과 적합 시간을 집계합니다.
+정확도와 CPU 시간을 함께 보고 기본 예측 백엔드를 고를 때 사용합니다.
+
+사용 예:
+    python -m predict_mlb.backtest                                  # 타자, damped/prophet
+    python -m predict_mlb.backtest --player-type pitcher --origins 2012 2015 2018 --horizon 3
+    python -m predict_mlb.backtest --backends damped --output backtest.csv
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config.settings import PREDICT_METRIC_RANGES
+from .data.registry import get_registry
+from .data.schema import get_schema
+from .models.batch_forecaster import BatchForecaster, ForecastJob, ForecastResult, make_jobs
+from .models.forecasters import FORECASTER_BACKENDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORIGINS = (2010, 2015, 2018)
+DEFAULT_HORIZON = 5
+
+# 예측 오차 테이블 컬럼
+ERROR_COLUMNS = ['backend', 'origin', 'PlayerID', 'metric', 'step', 'Season',
+                 'actual', 'yhat', 'yhat_lower', 'yhat_upper', 'fit_seconds']
+
+
+def backtest_jobs(data: pd.DataFrame, metrics: List[str], origin: int, horizon: int, backend: str,
+                  min_seasons: int = 2, limit: Optional[int] = None) -> List[ForecastJob]:
+    """
+    기준 시즌 하나의 예측 작업을 만듭니다.
+
+    기준 시즌에 뛰었고 그때까지 min_seasons 이상 기록이 있는 선수만 대상으로 해서,
+    h번째 미래 예측이 항상 (기준 시즌 + h) 시즌에 대응하도록 합니다.
+
+    Args:
+        data: 선수 유형별 전체 데이터
+        metrics: 예측할 지표 목록
+        origin: 훈련 마지막 시즌
+        horizon: 예측할 미래 기간 (연도 수)
+        backend: 예측 모델 백엔드
+        min_seasons: 필요한 최소 시즌 수
+        limit: 최대 선수 수 (None이면 전체)
+
+    Returns:
+        List[ForecastJob]: 예측 작업 목록
+    """
+    history = data[data['Season'] <= origin]
+    counts = history.groupby('PlayerID', observed=True)['Season'].agg(['max', 'size'])
+    players = counts.index[(counts['max'] == origin) & (counts['size'] >= min_seasons)]
+    # 이후 시즌 실제 기록이 있는 선수만 (평가할 값이 없는 작업은 만들지 않음)
+    future = data[(data['Season'] > origin) & (data['Season'] <= origin + horizon)]
+    players = players[players.isin(future['PlayerID'].unique())]
+    if limit is not None:
+        players = players[:limit]
+
+    jobs = []
+    for _, player_data in history[history['PlayerID'].isin(players)].groupby('PlayerID', observed=True):
+        jobs.extend(make_jobs(player_data, metrics, horizon, backend))
+    return jobs
+
+
+def results_to_errors(results: Iterable[ForecastResult], origin: int, actuals: pd.DataFrame) -> pd.DataFrame:
+    """
+    예측 결과의 미래 구간을 실제 기록과 결합합니다.
+
+    Args:
+        results: 예측 결과 목록 (실패한 결과는 제외)
+        origin: 훈련 마지막 시즌
+        actuals: PlayerID, Season, metric, actual 컬럼의 실제 기록 (긴 형식)
+
+    Returns:
+        pd.DataFrame: ERROR_COLUMNS 형식의 예측 오차 테이블 (실제 기록이 없는 시즌은 제외)
+    """
+    frames = []
+    last_training = pd.Timestamp(year=origin, month=1, day=1)
+    for result in results:
+        if not result.ok:
+            continue
+        job = result.job
+        future = result.forecast[result.forecast['ds'] > last_training].head(job.periods)
+        steps = np.arange(1, len(future) + 1)
+        frames.append(pd.DataFrame({
+            'backend': job.backend,
+            'origin': origin,
+            'PlayerID': job.player_id,
+            'metric': job.metric,
+            'step': steps,
+            'Season': origin + steps,
+            'yhat': future['yhat'].to_numpy(),
+            'yhat_lower': future['yhat_lower'].to_numpy(),
+            'yhat_upper': future['yhat_upper'].to_numpy(),
+            'fit_seconds': result.fit_seconds,
+        }))
+    if not frames:
+        return pd.DataFrame(columns=ERROR_COLUMNS)
+    errors = pd.concat(frames, ignore_index=True)
+    errors = errors.merge(actuals, on=['PlayerID', 'Season', 'metric'], how='inner')
+    return errors[ERROR_COLUMNS]
+
+
+def summarize(errors: pd.DataFrame, timings: Dict[str, Dict[str, float]]) -> pd.DataFrame:
+    """
+    백엔드/지표별 정확도와 적합 시간을 집계합니다.
+
+    Args:
+        errors: results_to_errors() 결과를 합친 테이블
+        timings: 백엔드 → {'jobs': 작업 수, 'fit_seconds': 적합 시간 합, 'wall_seconds': 경과 시간}
+
+    Returns:
+        pd.DataFrame: backend, metric, n, MAE, MAPE, coverage, fit_ms_per_job 컬럼
+    """
+    errors = errors.assign(
+        abs_error=(errors['yhat'] - errors['actual']).abs(),
+        covered=(errors['actual'] >= errors['yhat_lower']) & (errors['actual'] <= errors['yhat_upper']),
+    )
+    # 실제값이 0인 경우는 MAPE에서 제외
+    errors['ape'] = (errors['abs_error'] / errors['actual'].abs()).where(errors['actual'] != 0)
+    summary = errors.groupby(['backend', 'metric']).agg(
+        n=('abs_error', 'size'),
+        MAE=('abs_error', 'mean'),
+        MAPE=('ape', 'mean'),
+        coverage=('covered', 'mean'),
+    ).reset_index()
+    summary['fit_ms_per_job'] = summary['backend'].map(
+        lambda backend: 1000 * timings[backend]['fit_seconds'] / max(timings[backend]['jobs'], 1))
+    return summary
+
+
+def recommend_backend(summary: pd.DataFrame, timings: Dict[str, Dict[str, float]],
+                      tolerance: float = 0.05) -> str:
+    """
+    측정된 정확도와 CPU 시간으로 기본 백엔드를 고릅니다.
+
+    지표마다 가장 낮은 MAE에 대한 비율을 구해 백엔드별로 평균내고, 가장 정확한 백엔드보다
+    tolerance 이내로만 나쁜 백엔드들 중 작업당 적합 시간이 가장 짧은 백엔드를 고릅니다.
+
+    Args:
+        summary: summarize() 결과
+        timings: 백엔드별 시간 정보
+        tolerance: 허용하는 상대 MAE 차이
+
+    Returns:
+        str: 추천 백엔드
+    """
+    relative = summary['MAE'] / summary.groupby('metric')['MAE'].transform('min')
+    score = relative.groupby(summary['backend']).mean()
+    candidates = score[score <= score.min() * (1 + tolerance)].index
+    return min(candidates, key=lambda backend: timings[backend]['fit_seconds'] / max(timings[backend]['jobs'], 1))
+
+
+def run_backtest(player_type: str, csv_path: str, backends: List[str], origins: Iterable[int],
+                 horizon: int = DEFAULT_HORIZON, forecaster: Optional[BatchForecaster] = None,
+                 limit: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Dict[str, float]]]:
+    """
+    선수 유형 하나의 백테스트를 실행합니다.
+
+    Args:
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
+        csv_path: 원본 CSV 파일 경로
+        backends: 비교할 예측 백엔드 목록
+        origins: 훈련 마지막 시즌 목록
+        horizon: 예측할 미래 기간 (연도 수)
+        forecaster: 일괄 예측기 (None이면 새로 만들고 끝나면 종료)
+        limit: 기준 시즌별 최대 선수 수 (None이면 전체)
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Dict[str, float]]]: 예측 오차 테이블, 요약, 백엔드별 시간
+    """
+    data = get_registry().get(csv_path, get_schema(player_type)).frame
+    metrics = [metric for metric in PREDICT_METRIC_RANGES[player_type] if metric in data.columns]
+    actuals = data[['PlayerID', 'Season'] + metrics].melt(
+        id_vars=['PlayerID', 'Season'], var_name='metric', value_name='actual').dropna(subset=['actual'])
+    actuals = actuals.astype({'PlayerID': 'int64', 'Season': 'int64', 'metric': 'object', 'actual': 'float64'})
+
+    owns_forecaster = forecaster is None
+    forecaster = forecaster or BatchForecaster()
+    frames = []
+    timings = {backend: {'jobs': 0, 'fit_seconds': 0.0, 'wall_seconds': 0.0} for backend in backends}
+    try:
+        for backend in backends:
+            for origin in origins:
+                jobs = backtest_jobs(data, metrics, origin, horizon, backend, limit=limit)
+                start = time.perf_counter()
+                results = list(forecaster.iter_results(jobs))
+                timings[backend]['wall_seconds'] += time.perf_counter() - start
+                timings[backend]['jobs'] += len(jobs)
+                timings[backend]['fit_seconds'] += sum(result.fit_seconds for result in results)
+                failed = sum(not result.ok for result in results)
+                logger.info(f"{player_type} {backend} {origin}: {len(jobs)}개 작업 ({failed}개 실패)")
+                frames.append(results_to_errors(results, origin, actuals))
+    finally:
+        if owns_forecaster:
+            forecaster.shutdown()
+
+    errors = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=ERROR_COLUMNS)
+    return errors, summarize(errors, timings), timings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+
+    parser = argparse.ArgumentParser(description="예측 백엔드 백테스트 (rolling origin)")
+    parser.add_argument("--player-type", choices=["batter", "pitcher"], default="batter")
+    parser.add_argument("--backends", nargs="+", choices=sorted(FORECASTER_BACKENDS), default=sorted(FORECASTER_BACKENDS))
+    parser.add_argument("--origins", nargs="+", type=int, default=list(DEFAULT_ORIGINS), help="훈련 마지막 시즌 목록")
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON, help="예측할 미래 기간 (연도 수)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: 사용 가능한 코어 수, 최대 4)")
+    parser.add_argument("--limit", type=int, default=None, help="기준 시즌별 최대 선수 수 (테스트용)")
+    parser.add_argument("--output", default=None, help="예측 오차 테이블을 저장할 CSV 경로")
+    args = parser.parse_args(argv)
+
+    csv_path = BATTER_STATS_FILE if args.player_type == "batter" else PITCHER_STATS_FILE
+    forecaster = BatchForecaster(max_workers=args.workers)
+    try:
+        errors, summary, timings = run_backtest(args.player_type, csv_path, args.backends, args.origins,
+                                                args.horizon, forecaster, args.limit)
+    finally:
+        forecaster.shutdown()
+
+    if args.output:
+        errors.to_csv(args.output, index=False)
+    with pd.option_context("display.width", 120, "display.max_columns", None):
+        print(summary.round(4).to_string(index=False))
+    for backend, timing in timings.items():
+        print(f"{backend}: {timing['jobs']}개 작업, 적합 {timing['fit_seconds']:.1f}초, 경과 {timing['wall_seconds']:.1f}초")
+    if not summary.empty:
+        print(f"추천 백엔드: {recommend_backend(summary, timings)}")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -98,7 +98,8 @@ class ChartComponents:
         upper = prediction_result['upper']
         
         # 실제 데이터와 예측 데이터의 경계 찾기
-        last_actual_idx = next((i for i, val in enumerate(actual) if val is None), len(actual)) - 1
+        missing = np.flatnonzero(np.isnan(np.asarray(actual, dtype='float64')))
+        last_actual_idx = (missing[0] if len(missing) else len(actual)) - 1
         
         # 실제 데이터 플롯
         ax.plot(seasons[:last_actual_idx+1], actual[:last_actual_idx+1], 
@@ -111,3 +111,64 @@ FONT_PATH = os.path.join(BASE_DIR, "..", "font", "H2GTRM.TTF")
 MLB_LOGO_PATH = os.path.join(BASE_DIR, "..", "mlb_logo.png")
 MLB_PLAYERS_IMAGE_PATH = os.path.join(BASE_DIR, "..", "mlb_players.jpg")
 LOG_DIR = os.path.join(BASE_DIR, "..", "logs")
+
+# DataManager의 기본 조회 백엔드 ('memory' 또는 'sqlite')와 SQLite 파일 경로
+# 라이브러리 전용 설정: 앱 페이지는 DataManager를 거치지 않고 레지스트리의 메모리 데이터를 읽으므로 영향을 받지 않음
+DATA_BACKEND = os.environ.get("PREDICT_MLB_DATA_BACKEND", "memory")
+SQLITE_DB_PATH = os.path.join(DATA_DIR, "mlb_stats.sqlite")
+
+# 일괄 예측 작업 프로세스 수 (0이면 사용 가능한 코어 수, 최대 4)
+FORECAST_MAX_WORKERS = int(os.environ.get("PREDICT_MLB_FORECAST_WORKERS", "0"))
+
+# 예측 페이지 계산 작업자 프로세스 수 (0이면 사용 가능한 코어 수, 최대 4)와 작업당 제한 시간 (초)
+COMPUTE_WORKERS = int(os.environ.get("PREDICT_MLB_COMPUTE_WORKERS", "0"))
+COMPUTE_JOB_TIMEOUT = float(os.environ.get("PREDICT_MLB_COMPUTE_JOB_TIMEOUT", "120"))
+# 계산 작업자 시작 시 예열 적합 여부, 유휴 작업자 상태 확인 주기와 응답 제한 시간 (초)
+COMPUTE_WARM_UP = int(os.environ.get("PREDICT_MLB_COMPUTE_WARM_UP", "1"))
+COMPUTE_HEALTH_CHECK_INTERVAL = float(os.environ.get("PREDICT_MLB_COMPUTE_HEALTH_INTERVAL", "30"))
+COMPUTE_HEALTH_CHECK_TIMEOUT = float(os.environ.get("PREDICT_MLB_COMPUTE_HEALTH_TIMEOUT", "10"))
+
+# 예측 모델 백엔드 ('damped': 감쇠 추세 지수평활, 'prophet': Prophet)
+FORECAST_BACKEND = os.environ.get("PREDICT_MLB_FORECAST_BACKEND", "damped")
+
+# Prophet 예측 구간 계산 방식 ('analytic': 잡음/추세 분산으로 해석적 계산, 'sampled': 1000개 경로 시뮬레이션)
+PROPHET_INTERVALS = os.environ.get("PREDICT_MLB_PROPHET_INTERVALS", "analytic")
+
+# 예측 응답 시간 예산 (초, 0이면 제한 없음)과 예산을 넘긴 지표에 대신 보여줄 빠른 백엔드
+# (전체 훈련은 뒤에서 계속 진행되어 다음 요청부터 캐시에서 조회)
+PREDICT_LATENCY_BUDGET = float(os.environ.get("PREDICT_MLB_LATENCY_BUDGET", "3"))
+FALLBACK_BACKEND = "damped"
+
+# 예측 페이지 지표와 그래프 Y축 범위 (predict.py와 일괄 예측 작업이 함께 사용)
+PREDICT_METRIC_RANGES = {
+    'batter': {
+        'BattingAverage': (0, 0.4),
+        'OnBasePercentage': (0, 0.7),
+        'SluggingPercentage': (0, 0.8),
+        'OPS': (0, 1.4)
+    },
+    'pitcher': {
+        'EarnedRunAverage': (0, 5),
+        'Wins': (0, 35),
+        'Losses': (0, 30),
+        'StrikeOuts': (0, 400),
+        'Whip': (0, 4),
+        'InningsPitched': (0, 400)
+    }
+}
+
+# 예측에 필요한 최근 시즌과 예측 기간 (연도 수, 기본값과 선택 가능한 최대값)
+PREDICT_REQUIRED_SEASONS = (2022, 2023)
+PREDICT_PERIODS = 5
+PREDICT_MAX_PERIODS = 10
+
+# 예측 캐시 (메모리 LRU 항목 수, 디스크 계층 경로/최대 용량 MB - 경로가 빈 문자열이면 메모리만 사용)
+FORECAST_CACHE_MAX_ENTRIES = int(os.environ.get("PREDICT_MLB_FORECAST_CACHE_ENTRIES", "512"))
+FORECAST_CACHE_DIR = os.environ.get("PREDICT_MLB_FORECAST_CACHE_DIR", os.path.join(BASE_DIR, "..", "data", "forecast_cache"))
+FORECAST_CACHE_MAX_DISK_MB = float(os.environ.get("PREDICT_MLB_FORECAST_CACHE_MAX_MB", "256"))
+
+# 적합된 모델 저장소 경로 (빈 문자열이면 저장하지 않음)
+MODEL_REGISTRY_DIR = os.environ.get("PREDICT_MLB_MODEL_REGISTRY_DIR", os.path.join(BASE_DIR, "..", "data", "models"))
+# 모델 저장소 최대 용량 (MB)과 마지막 사용 후 항목 보관 기간 (일, 0이면 기간 제한 없음)
+MODEL_REGISTRY_MAX_MB = float(os.environ.get("PREDICT_MLB_MODEL_REGISTRY_MAX_MB", "512"))
+MODEL_REGISTRY_MAX_AGE_DAYS = float(os.environ.get("PREDICT_MLB_MODEL_REGISTRY_MAX_AGE_DAYS", "30"))
@@ -0,0 +1,269 @@
+"""
+리그 집계 모듈: 시즌별 지표 합계/개수/제곱합을 보관하는 집계 저장소를 제공합니다.
+
+리그 평균이 필요할 때마다 전체 프레임에 groupby('Season').mean()을 실행하는 대신,
+(시즌, 지표)별 count/sum/sumsq(와 가중 합계)를 한 번 만들어 두고 평균, 표준편차,
+가중 평균을 원본 행 없이 계산합니다. 새 행이 병합되면 바뀐 행만 빼고 더해서 갱신합니다.
+"""
+import json
+import logging
+import os
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_FORMAT_VERSION = 1
+
+# 집계 통계 종류 (가중 통계는 가중치 컬럼이 있을 때만 사용)
+STATS = ['count', 'sum', 'sumsq', 'wsum', 'wcount']
+
+# 선수 유형별 가중치 컬럼 (타석/이닝)
+WEIGHT_COLUMNS = ['AtBats', 'InningsPitched']
+
+# 집계 대상에서 제외하는 식별 컬럼
+_ID_COLUMNS = {'Season', 'PlayerID'}
+
+
+def infer_weight_column(columns: Iterable[str]) -> Optional[str]:
+    """
+    데이터 컬럼에서 가중 평균용 가중치 컬럼을 찾습니다.
+
+    Args:
+        columns: 데이터 컬럼 목록
+
+    Returns:
+        Optional[str]: 타자는 AtBats, 투수는 InningsPitched, 없으면 None
+    """
+    columns = set(columns)
+    return next((column for column in WEIGHT_COLUMNS if column in columns), None)
+
+
+class LeagueAggregateStore:
+    """시즌별 리그 집계 저장소 클래스"""
+
+    def __init__(self, metrics: List[str], weight_column: Optional[str] = None,
+                 table: Optional[pd.DataFrame] = None, source_version: Any = None):
+        """
+        LeagueAggregateStore 클래스 초기화
+
+        Args:
+            metrics: 집계할 지표 목록
+            weight_column: 가중 평균용 가중치 컬럼
+            table: 기존 집계 테이블 (인덱스: Season, 컬럼: (통계, 지표))
+            source_version: 집계가 반영하는 원본 데이터 버전
+        """
+        self.metrics = list(metrics)
+        self.weight_column = weight_column
+        self.source_version = source_version
+        if table is None:
+            columns = pd.MultiIndex.from_product([STATS, self.metrics])
+            table = pd.DataFrame(columns=columns, dtype='float64', index=pd.Index([], name='Season', dtype='int64'))
+        self.table = table
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, metrics: Optional[List[str]] = None,
+                   weight_column: Optional[str] = None, source_version: Any = None) -> 'LeagueAggregateStore':
+        """
+        데이터프레임 전체를 한 번 훑어 집계 저장소를 만듭니다.
+
+        Args:
+            df: 원본 데이터프레임
+            metrics: 집계할 지표 목록 (None이면 식별 컬럼을 제외한 모든 숫자형 컬럼)
+            weight_column: 가중치 컬럼 (None이면 컬럼 이름으로 추론)
+            source_version: 원본 데이터 버전
+
+        Returns:
+            LeagueAggregateStore: 집계 저장소
+        """
+        if metrics is None:
+            metrics = [column for column in df.select_dtypes(include=[np.number, 'boolean']).columns
+                       if column not in _ID_COLUMNS]
+        if weight_column is None:
+            weight_column = infer_weight_column(df.columns)
+        store = cls(metrics, weight_column, source_version=source_version)
+        store.add(df)
+        return store
+
+    def _season_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+        """행들을 시즌별 (통계, 지표) 합계로 줄입니다."""
+        metrics = [metric for metric in self.metrics if metric in df.columns]
+        values = df[metrics].astype('float64')
+        seasons = df['Season'].astype('int64').rename('Season')
+
+        parts = {
+            'count': values.notna().astype('float64'),
+            'sum': values,
+            'sumsq': values ** 2,
+        }
+        if self.weight_column and self.weight_column in df.columns:
+            weights = df[self.weight_column].astype('float64')
+            parts['wsum'] = values.mul(weights, axis=0)
+            parts['wcount'] = values.notna().mul(weights.fillna(0), axis=0)
+
+        # groupby().sum()은 NaN을 건너뜀
+        return pd.concat({stat: part.groupby(seasons).sum() for stat, part in parts.items()}, axis=1)
+
+    def _apply(self, df: pd.DataFrame, sign: int) -> None:
+        """집계 테이블에 행들을 더하거나 뺍니다."""
+        if df.empty:
+            return
+        stats = self._season_stats(df)
+        if sign < 0:
+            stats = -stats
+        table = self.table.add(stats, fill_value=0)
+        # 모든 행이 빠진 시즌은 제거
+        table = table[table['count'].sum(axis=1) > 0]
+        self.table = table.reindex(columns=self.table.columns, fill_value=0.0).sort_index()
+
+    def add(self, df: pd.DataFrame) -> None:
+        """
+        행들을 집계에 더합니다.
+
+        Args:
+            df: 추가할 행 (Season 컬럼 필요)
+        """
+        self._apply(df, 1)
+
+    def subtract(self, df: pd.DataFrame) -> None:
+        """
+        행들을 집계에서 뺍니다. (병합으로 교체되는 기존 행)
+
+        Args:
+            df: 제거할 행 (Season 컬럼 필요)
+        """
+        self._apply(df, -1)
+
+    @property
+    def seasons(self) -> List[int]:
+        """집계된 시즌 목록"""
+        return [int(season) for season in self.table.index]
+
+    def _frame(self, values: pd.DataFrame, seasons: Optional[Iterable[int]]) -> pd.DataFrame:
+        """(시즌 × 지표) 결과를 Season 컬럼이 있는 데이터프레임으로 반환합니다."""
+        if seasons is not None:
+            values = values[values.index.isin(list(seasons))]
+        values = values.copy()
+        values.index.name = 'Season'
+        values.columns.name = None
+        return values.reset_index()
+
+    def mean(self, metrics: List[str], seasons: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        시즌별 평균을 계산합니다.
+
+        Args:
+            metrics: 지표 목록
+            seasons: 시즌 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: Season 컬럼과 지표별 평균 컬럼
+        """
+        counts = self.table['count'][metrics].replace(0, np.nan)
+        return self._frame(self.table['sum'][metrics] / counts, seasons)
+
+    def std(self, metrics: List[str], seasons: Optional[Iterable[int]] = None, ddof: int = 1) -> pd.DataFrame:
+        """
+        시즌별 표준편차를 계산합니다.
+
+        Args:
+            metrics: 지표 목록
+            seasons: 시즌 목록 (None이면 전체)
+            ddof: 자유도 보정 (pandas 기본값과 같은 1)
+
+        Returns:
+            pd.DataFrame: Season 컬럼과 지표별 표준편차 컬럼
+        """
+        counts = self.table['count'][metrics]
+        sums = self.table['sum'][metrics]
+        variance = (self.table['sumsq'][metrics] - sums ** 2 / counts.replace(0, np.nan)) / (counts - ddof).where(counts > ddof)
+        return self._frame(np.sqrt(variance.clip(lower=0)), seasons)
+
+    def weighted_mean(self, metrics: List[str], seasons: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        시즌별 가중 평균을 계산합니다. (타자는 타석, 투수는 이닝 가중)
+
+        Args:
+            metrics: 지표 목록
+            seasons: 시즌 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: Season 컬럼과 지표별 가중 평균 컬럼 (가중치 합이 0인 시즌은 NaN)
+
+        Raises:
+            ValueError: 가중치 컬럼이 없는 저장소인 경우
+        """
+        if not self.weight_column:
+            raise ValueError("가중치 컬럼이 없는 집계 저장소입니다.")
+        weights = self.table['wcount'][metrics].replace(0, np.nan)
+        return self._frame(self.table['wsum'][metrics] / weights, seasons)
+
+    def counts(self, metrics: List[str], seasons: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        시즌별 표본 수를 반환합니다.
+
+        Args:
+            metrics: 지표 목록
+            seasons: 시즌 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: Season 컬럼과 지표별 표본 수 컬럼
+        """
+        return self._frame(self.table['count'][metrics], seasons)
+
+    def save(self, path: str) -> None:
+        """
+        집계를 JSON 파일로 저장합니다.
+
+        Args:
+            path: 저장 경로
+        """
+        payload = {
+            'format_version': AGGREGATE_FORMAT_VERSION,
+            'source_version': self.source_version,
+            'metrics': self.metrics,
+            'weight_column': self.weight_column,
+            'seasons': self.seasons,
+            'stats': {stat: {metric: self.table[(stat, metric)].tolist() for metric in self.metrics}
+                      for stat in STATS},
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['LeagueAggregateStore']:
+        """
+        JSON 파일에서 집계를 읽습니다.
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            Optional[LeagueAggregateStore]: 집계 저장소, 파일이 없거나 형식이 다르면 None
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('format_version') != AGGREGATE_FORMAT_VERSION:
+                return None
+            index = pd.Index(payload['seasons'], name='Season', dtype='int64')
+            table = pd.DataFrame(
+                {(stat, metric): values for stat, by_metric in payload['stats'].items()
+                 for metric, values in by_metric.items()},
+                index=index, dtype='float64',
+            )
+            table.columns = pd.MultiIndex.from_tuples(table.columns)
+            return cls(payload['metrics'], payload['weight_column'], table, payload.get('source_version'))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"집계 파일 읽기 실패 ({path}): {e}")
+            return None
@@ -0,0 +1,202 @@
+"""
+컬럼형 캐시 모듈: CSV 통계 파일 앞단에 Parquet 캐시 계층을 제공합니다.
+
+각 CSV 옆에 정제가 끝난 Parquet 사본을 만들고, 원본 파일의 수정 시각(mtime)과
+내용 해시를 메타데이터로 함께 저장합니다. 이후 로드는 원본이 바뀌지 않은 한
+CSV 파싱 없이 Parquet 사본에서 바로 제공됩니다.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .schema import ColumnSchema, apply_schema, schema_fingerprint
+
+# pyarrow가 설치되어 있지 않은 경우를 대비한 import
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 캐시 형식이나 정제 규칙이 바뀌면 올려서 기존 캐시를 무효화합니다.
+CACHE_FORMAT_VERSION = 1
+CACHE_METADATA_KEY = b"predict_mlb.columnar_cache"
+CACHE_SUFFIX = ".parquet"
+
+
+def clean_stats_frame(df: pd.DataFrame, schema: Optional[ColumnSchema] = None) -> pd.DataFrame:
+    """
+    통계 데이터프레임을 정제합니다.
+
+    Args:
+        df: 원본 데이터프레임
+        schema: 적용할 컬럼 스키마 (None이면 추론된 dtype 유지)
+
+    Returns:
+        pd.DataFrame: 컬럼명 공백이 제거되고 숫자형 NaN이 0으로 채워진 데이터프레임
+    """
+    df = df.rename(columns=lambda x: x.strip())  # 컬럼명 공백 제거
+    numeric_cols = df.select_dtypes(include=np.number).columns
+    df[numeric_cols] = df[numeric_cols].fillna(0)  # 숫자형 컬럼 NaN 0으로 채우기
+    if schema:
+        df = apply_schema(df, schema)
+    return df
+
+
+def read_stats_csv(csv_path: str, schema: Optional[ColumnSchema] = None) -> pd.DataFrame:
+    """
+    CSV 파일을 읽고 정제합니다.
+
+    Args:
+        csv_path: CSV 파일 경로
+        schema: 적용할 컬럼 스키마
+
+    Returns:
+        pd.DataFrame: 정제된 데이터프레임
+    """
+    return clean_stats_frame(pd.read_csv(csv_path), schema)
+
+
+def get_cache_path(csv_path: str) -> str:
+    """
+    CSV 파일에 대응하는 Parquet 캐시 경로를 반환합니다.
+
+    Args:
+        csv_path: CSV 파일 경로
+
+    Returns:
+        str: 캐시 파일 경로 (CSV와 같은 디렉토리)
+    """
+    return os.path.splitext(csv_path)[0] + CACHE_SUFFIX
+
+
+def compute_file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+
+    Args:
+        path: 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_cache_metadata(cache_path: str) -> Optional[Dict[str, Any]]:
+    """
+    캐시 파일의 메타데이터를 읽습니다. 데이터 본문은 읽지 않습니다.
+
+    Args:
+        cache_path: 캐시 파일 경로
+
+    Returns:
+        Optional[Dict[str, Any]]: 메타데이터, 캐시가 없거나 읽을 수 없으면 None
+    """
+    if not PYARROW_AVAILABLE or not os.path.exists(cache_path):
+        return None
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+        raw = metadata.get(CACHE_METADATA_KEY)
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"캐시 메타데이터 읽기 실패 ({cache_path}): {e}")
+        return None
+
+
+def _write_cache(df: pd.DataFrame, cache_path: str, metadata: Dict[str, Any]) -> None:
+    """
+    데이터프레임을 메타데이터와 함께 Parquet 캐시로 저장합니다.
+
+    임시 파일에 먼저 쓴 뒤 교체하므로, 동시에 읽는 프로세스가 반쯤 쓰인 파일을 보지 않습니다.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[CACHE_METADATA_KEY] = json.dumps(metadata).encode("utf-8")
+    table = table.replace_schema_metadata(schema_metadata)
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_stats_frame(csv_path: str, schema: Optional[ColumnSchema] = None) -> pd.DataFrame:
+    """
+    컬럼형 캐시를 거쳐 통계 데이터를 로드합니다.
+
+    캐시의 mtime과 크기가 원본과 같으면 해시 계산 없이 캐시를 사용하고,
+    다르면 내용 해시를 비교해 실제로 내용이 바뀐 경우에만 CSV를 다시 읽습니다.
+    pyarrow가 없거나 캐시를 쓸 수 없는 환경에서는 CSV를 직접 읽습니다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+        schema: 적용할 컬럼 스키마 (스키마가 바뀌면 캐시도 다시 생성됨)
+
+    Returns:
+        pd.DataFrame: 정제된 데이터프레임
+
+    Raises:
+        FileNotFoundError: 원본 CSV 파일이 없는 경우
+    """
+    stat = os.stat(csv_path)
+    if not PYARROW_AVAILABLE:
+        return read_stats_csv(csv_path, schema)
+
+    cache_path = get_cache_path(csv_path)
+    schema_key = schema_fingerprint(schema)
+    cached = read_cache_metadata(cache_path)
+    if cached and (cached.get("format_version") != CACHE_FORMAT_VERSION
+                   or cached.get("schema") != schema_key):
+        cached = None
+
+    # 빠른 경로: 원본 파일이 캐시 생성 시점 그대로인 경우
+    if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+        try:
+            return pq.read_table(cache_path).to_pandas()
+        except Exception as e:
+            logger.warning(f"캐시 읽기 실패, CSV를 다시 읽습니다 ({cache_path}): {e}")
+            cached = None
+
+    content_hash = compute_file_hash(csv_path)
+    metadata = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "source": os.path.basename(csv_path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": content_hash,
+        "schema": schema_key,
+    }
+
+    df = None
+    if cached and cached.get("sha256") == content_hash:
+        # 내용은 같고 mtime만 바뀐 경우 (복사, touch 등): 캐시를 재사용하고 키만 갱신
+        try:
+            df = pq.read_table(cache_path).to_pandas()
+        except Exception as e:
+            logger.warning(f"캐시 읽기 실패, CSV를 다시 읽습니다 ({cache_path}): {e}")
+    if df is None:
+        df = read_stats_csv(csv_path, schema)
+
+    try:
+        _write_cache(df, cache_path, metadata)
+    except Exception as e:
+        logger.warning(f"컬럼형 캐시 저장 실패 ({cache_path}): {e}")
+
+    return df
@@ -3,30 +3,50 @@
 """
 import pandas as pd
 import numpy as np
-import os
 import streamlit as st
 from typing import List, Dict, Any, Tuple, Optional
 
+from ..config.settings import BATTER_STATS_FILE, PITCHER_STATS_FILE, DATA_BACKEND, SQLITE_DB_PATH
+from .schema import BATTER_SCHEMA, PITCHER_SCHEMA
+from .aggregates import LeagueAggregateStore
+from .frame_index import FrameIndex
+from .registry import dataset_version, get_registry
+from .rolling_views import RollingViews
+from .sql_store import SQLiteStatsStore
+
 class DataManager:
     """통합 데이터 관리 클래스"""
-    def __init__(self, batter_file: str, pitcher_file: str):
+    def __init__(self, batter_file: str = BATTER_STATS_FILE, pitcher_file: str = PITCHER_STATS_FILE,
+                 backend: str = DATA_BACKEND, db_path: Optional[str] = None):
         """
         DataManager 클래스 초기화
         
         Args:
             batter_file: 타자 데이터 파일 경로
             pitcher_file: 투수 데이터 파일 경로
+            backend: 조회 백엔드 ('memory' 또는 'sqlite', 기본값은 설정의 DATA_BACKEND)
+            db_path: SQLite 파일 경로 (None이면 설정의 SQLITE_DB_PATH)
         """
         self.batter_file = batter_file
         self.pitcher_file = pitcher_file
         self.batter_data = None
         self.pitcher_data = None
+        self._indexes: Dict[str, FrameIndex] = {}
+        self._aggregates: Dict[str, Tuple[pd.DataFrame, LeagueAggregateStore]] = {}
+        
+        # SQL 백엔드: 선수/시즌 조회와 리그 평균을 디스크 인덱스 쿼리로 처리
+        self.sql_store: Optional[SQLiteStatsStore] = None
+        self._synced_sources: Dict[str, str] = {}
+        if backend == 'sqlite':
+            self.sql_store = SQLiteStatsStore(db_path or SQLITE_DB_PATH)
         
-    @st.cache_data(ttl=3600, show_spinner=True)
     def load_all_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         모든 데이터를 로드하고 전처리합니다.
         
+        데이터는 프로세스 전역 레지스트리에서 공유되므로 인스턴스나 세션 수와 관계없이
+        원본 파일 버전당 한 번만 로드됩니다.
+        
         Returns:
             Tuple[pd.DataFrame, pd.DataFrame]: 타자 데이터와 투수 데이터
         """
@@ -42,12 +62,7 @@ class DataManager:
             pd.DataFrame: 전처리된 타자 데이터
         """
         try:
-            df = pd.read_csv(self.batter_file)
-            # 데이터 클리닝 및 전처리
-            df = df.rename(columns=lambda x: x.strip())  # 컬럼명 공백 제거
-            numeric_cols = df.select_dtypes(include=np.number).columns
-            df[numeric_cols] = df[numeric_cols].fillna(0)  # 숫자형 컬럼 NaN 0으로 채우기
-            return df
+            return get_registry().get_frame(self.batter_file, BATTER_SCHEMA)
         except FileNotFoundError:
             st.error(f"타자 데이터 파일을 찾을 수 없습니다: {self.batter_file}")
             st.info("샘플 데이터를 대신 사용합니다.")
@@ -65,12 +80,7 @@ class DataManager:
             pd.DataFrame: 전처리된 투수 데이터
         """
         try:
-            df = pd.read_csv(self.pitcher_file)
-            # 데이터 클리닝 및 전처리
-            df = df.rename(columns=lambda x: x.strip())  # 컬럼명 공백 제거
-            numeric_cols = df.select_dtypes(include=np.number).columns
-            df[numeric_cols] = df[numeric_cols].fillna(0)  # 숫자형 컬럼 NaN 0으로 채우기
-            return df
+            return get_registry().get_frame(self.pitcher_file, PITCHER_SCHEMA)
         except FileNotFoundError:
             st.error(f"투수 데이터 파일을 찾을 수 없습니다: {self.pitcher_file}")
             st.info("샘플 데이터를 대신 사용합니다.")
@@ -80,6 +90,96 @@ class DataManager:
             st.info("샘플 데이터를 대신 사용합니다.")
             return self._create_sample_pitcher_data()
     
+    def _get_store(self, player_type: str = 'batter') -> Optional[SQLiteStatsStore]:
+        """
+        SQL 백엔드를 반환합니다. 데이터셋 버전(파티션 매니페스트 또는 CSV)이 바뀐 경우에만 테이블을 동기화합니다.
+        
+        Args:
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+            
+        Returns:
+            Optional[SQLiteStatsStore]: SQL 백엔드, 사용하지 않거나 동기화에 실패하면 None
+        """
+        if self.sql_store is None:
+            return None
+            
+        key = 'batter' if player_type.lower() == 'batter' else 'pitcher'
+        source = self.batter_file if key == 'batter' else self.pitcher_file
+        try:
+            version = dataset_version(source)
+            if self._synced_sources.get(key) != version:
+                self.sql_store.sync_from_csv(source, key)
+                self._synced_sources[key] = version
+            return self.sql_store
+        except Exception as e:
+            # 동기화 실패 시 메모리 조회로 대체
+            st.warning(f"SQL 저장소를 사용할 수 없어 메모리 데이터로 조회합니다: {e}")
+            return None
+    
+    def get_index(self, player_type: str = 'batter') -> FrameIndex:
+        """
+        선수 유형별 인덱스를 반환합니다. 데이터가 다시 로드된 경우에만 새로 만듭니다.
+        
+        Args:
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+            
+        Returns:
+            FrameIndex: PlayerName/PlayerID/Season → 행 위치 인덱스
+        """
+        if self.batter_data is None or self.pitcher_data is None:
+            self.load_all_data()
+            
+        key = 'batter' if player_type.lower() == 'batter' else 'pitcher'
+        data = self.batter_data if key == 'batter' else self.pitcher_data
+        source = self.batter_file if key == 'batter' else self.pitcher_file
+        schema = BATTER_SCHEMA if key == 'batter' else PITCHER_SCHEMA
+        try:
+            # 레지스트리 데이터면 공유 인덱스를 사용
+            entry = get_registry().get(source, schema)
+            if entry.frame is data:
+                return entry.index
+        except Exception:
+            pass
+            
+        # 샘플 데이터 등 레지스트리 밖의 데이터는 인스턴스별 인덱스 사용
+        index = self._indexes.get(key)
+        if index is None or index.frame is not data:
+            index = FrameIndex(data)
+            self._indexes[key] = index
+        return index
+    
+    def get_aggregates(self, player_type: str = 'batter') -> LeagueAggregateStore:
+        """
+        선수 유형별 시즌 리그 집계를 반환합니다. 데이터가 다시 로드된 경우에만 새로 만듭니다.
+        
+        Args:
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+            
+        Returns:
+            LeagueAggregateStore: 시즌별 count/sum/sumsq 집계
+        """
+        if self.batter_data is None or self.pitcher_data is None:
+            self.load_all_data()
+            
+        key = 'batter' if player_type.lower() == 'batter' else 'pitcher'
+        data = self.batter_data if key == 'batter' else self.pitcher_data
+        source = self.batter_file if key == 'batter' else self.pitcher_file
+        schema = BATTER_SCHEMA if key == 'batter' else PITCHER_SCHEMA
+        try:
+            # 레지스트리 데이터면 공유 집계를 사용
+            entry = get_registry().get(source, schema)
+            if entry.frame is data:
+                return entry.aggregates
+        except Exception:
+            pass
+            
+        # 샘플 데이터는 인스턴스별로 집계
+        cached = self._aggregates.get(key)
+        if cached is None or cached[0] is not data:
+            cached = (data, LeagueAggregateStore.from_frame(data))
+            self._aggregates[key] = cached
+        return cached[1]
+    
     def get_player_data(self, player_name: str, player_type: str = 'batter') -> pd.DataFrame:
         """
         특정 선수의 데이터를 조회합니다.
@@ -91,13 +191,59 @@ class DataManager:
         Returns:
             pd.DataFrame: 해당 선수의 데이터
         """
-        if not self.batter_data or not self.pitcher_data:
-            self.load_all_data()
+        store = self._get_store(player_type)
+        if store is not None:
+            return store.get_player_data(player_name, player_type)
+        return self.get_index(player_type).get_player(player_name)
+    
+    def get_player_data_by_id(self, player_id: int, player_type: str = 'batter') -> pd.DataFrame:
+        """
+        선수 ID로 특정 선수의 데이터를 조회합니다.
+        
+        Args:
+            player_id: 선수 ID
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+            
+        Returns:
+            pd.DataFrame: 해당 선수의 데이터
+        """
+        store = self._get_store(player_type)
+        if store is not None:
+            return store.get_player_data_by_id(player_id, player_type)
+        return self.get_index(player_type).get_player_by_id(player_id)
+    
+    def get_season_data(self, season: int, player_type: str = 'batter') -> pd.DataFrame:
+        """
+        특정 시즌의 데이터를 조회합니다.
+        
+        Args:
+            season: 시즌
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
             
+        Returns:
+            pd.DataFrame: 해당 시즌의 데이터
+        """
+        store = self._get_store(player_type)
+        if store is not None:
+            return store.get_season_data(season, player_type)
+        return self.get_index(player_type).get_season(season)
+    
+    def load_season_range(self, start_season: int, end_season: int,
+                          player_type: str = 'batter') -> pd.DataFrame:
+        """
+        시즌 범위의 데이터만 로드합니다. 시즌 파티션이 있으면 해당 파티션만 읽습니다.
+        
+        Args:
+            start_season: 시작 시즌
+            end_season: 끝 시즌 (포함)
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+            
+        Returns:
+            pd.DataFrame: 해당 시즌 범위의 데이터
+        """
         if player_type.lower() == 'batter':
-            return self.batter_data[self.batter_data['PlayerName'] == player_name]
-        else:
-            return self.pitcher_data[self.pitcher_data['PlayerName'] == player_name]
+            return get_registry().get_season_range(self.batter_file, BATTER_SCHEMA, (start_season, end_season))
+        return get_registry().get_season_range(self.pitcher_file, PITCHER_SCHEMA, (start_season, end_season))
     
     def calculate_league_averages(self, metrics: List[str], player_type: str = 'batter') -> pd.DataFrame:
         """
@@ -110,13 +256,12 @@ class DataManager:
         Returns:
             pd.DataFrame: 시즌별 리그 평균 데이터프레임
         """
-        if not self.batter_data or not self.pitcher_data:
-            self.load_all_data()
+        store = self._get_store(player_type)
+        if store is not None:
+            return store.calculate_league_averages(metrics, player_type)
             
-        if player_type.lower() == 'batter':
-            return self.batter_data.groupby('Season')[metrics].mean().reset_index()
-        else:
-            return self.pitcher_data.groupby('Season')[metrics].mean().reset_index()
+        # 전체 데이터를 다시 groupby하지 않고 시즌 집계에서 평균을 구함
+        return self.get_aggregates(player_type).mean(metrics)
     
     def calculate_moving_average(self, df: pd.DataFrame, metrics: List[str], window: int) -> pd.DataFrame:
         """
@@ -128,13 +273,33 @@ class DataManager:
             window: 이동평균 윈도우 크기
             
         Returns:
-            pd.DataFrame: 이동평균이 계산된 데이터프레임
+            pd.DataFrame: 이동평균이 계산된 데이터프레임 (입력의 복사본, 행 순서대로 계산)
         """
         moving_avg = df.copy()
+        if 'Season' in df.columns and df['Season'].is_unique and df['Season'].is_monotonic_increasing:
+            # 시즌 키 프레임(예: 리그 평균)은 누적합 뷰로 모든 지표를 한 번에 계산
+            views = self.get_rolling_views(df, metrics).frame(window)
+            for metric in metrics:
+                moving_avg[metric] = views[metric].to_numpy()
+            return moving_avg
         for metric in metrics:
             moving_avg[metric] = moving_avg[metric].rolling(window=window, min_periods=1).mean()
         return moving_avg
     
+    def get_rolling_views(self, df: pd.DataFrame, metrics: List[str], windows: List[int] = ()) -> RollingViews:
+        """
+        여러 윈도우의 이동평균을 한 번에 계산하는 뷰를 반환합니다.
+        
+        Args:
+            df: 시즌별 데이터프레임
+            metrics: 계산할 지표 리스트
+            windows: 미리 계산할 윈도우 크기 리스트
+            
+        Returns:
+            RollingViews: (window, metric, Season) 이동평균 뷰
+        """
+        return RollingViews(df, metrics, windows)
+    
     def get_all_players(self, player_type: str = 'batter') -> List[str]:
         """
         모든 선수 이름 목록을 반환합니다.
@@ -145,13 +310,10 @@ class DataManager:
         Returns:
             List[str]: 선수 이름 목록
         """
-        if not self.batter_data or not self.pitcher_data:
-            self.load_all_data()
-            
-        if player_type.lower() == 'batter':
-            return sorted(self.batter_data['PlayerName'].unique())
-        else:
-            return sorted(self.pitcher_data['PlayerName'].unique())
+        store = self._get_store(player_type)
+        if store is not None:
+            return store.get_all_players(player_type)
+        return self.get_index(player_type).players
     
     def get_all_seasons(self) -> List[int]:
         """
@@ -160,10 +322,10 @@ class DataManager:
         Returns:
             List[int]: 시즌 목록
         """
-        if not self.batter_data:
-            self.load_all_data()
-            
-        return sorted(self.batter_data['Season'].unique())
+        store = self._get_store('batter')
+        if store is not None:
+            return store.get_all_seasons('batter')
+        return self.get_index('batter').seasons
     
     def _create_sample_batter_data(self) -> pd.DataFrame:
         """
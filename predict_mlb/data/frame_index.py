@@ -0,0 +1,113 @@
+"""
+프레임 인덱스 모듈: 선수/시즌별 행 위치 인덱스를 제공합니다.
+
+매 Streamlit 재실행마다 전체 프레임에 불리언 마스크를 적용하는 대신,
+데이터 버전당 한 번 PlayerName/PlayerID/Season → 행 위치 매핑을 만들어 두고
+조회 시에는 해당 위치만 잘라냅니다.
+"""
+from typing import Any, Dict, Hashable, List
+
+import numpy as np
+import pandas as pd
+
+
+def _group_positions(df: pd.DataFrame, column: str) -> Dict[Hashable, np.ndarray]:
+    """
+    컬럼 값별 행 위치(정수 위치) 배열을 만듭니다.
+
+    Args:
+        df: 인덱싱할 데이터프레임
+        column: 기준 컬럼
+
+    Returns:
+        Dict[Hashable, np.ndarray]: 값 → 행 위치 배열
+    """
+    if column not in df.columns:
+        return {}
+    return df.groupby(column, observed=True, sort=False).indices
+
+
+class FrameIndex:
+    """선수/시즌 인덱스 클래스"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        FrameIndex 클래스 초기화 (전체 프레임을 한 번만 스캔합니다)
+
+        Args:
+            df: 인덱싱할 데이터프레임 (인덱스가 유지되는 동안 변경하면 안 됨)
+        """
+        self.frame = df
+        self.player_positions = _group_positions(df, 'PlayerName')
+        self.player_id_positions = _group_positions(df, 'PlayerID')
+        self.season_positions = _group_positions(df, 'Season')
+        self.players: List[str] = sorted(self.player_positions)
+        self.seasons: List[int] = sorted(int(season) for season in self.season_positions)
+
+    def _take(self, positions: Any) -> pd.DataFrame:
+        """행 위치 배열에 해당하는 행을 반환합니다. 위치가 없으면 빈 프레임을 반환합니다."""
+        if positions is None:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[positions]
+
+    def get_player(self, player_name: str) -> pd.DataFrame:
+        """
+        선수 이름으로 해당 선수의 행을 조회합니다.
+
+        Args:
+            player_name: 선수 이름
+
+        Returns:
+            pd.DataFrame: 해당 선수의 데이터
+        """
+        return self._take(self.player_positions.get(player_name))
+
+    def get_player_by_id(self, player_id: int) -> pd.DataFrame:
+        """
+        선수 ID로 해당 선수의 행을 조회합니다.
+
+        Args:
+            player_id: 선수 ID
+
+        Returns:
+            pd.DataFrame: 해당 선수의 데이터
+        """
+        return self._take(self.player_id_positions.get(player_id))
+
+    def get_season(self, season: int) -> pd.DataFrame:
+        """
+        특정 시즌의 행을 조회합니다.
+
+        Args:
+            season: 시즌
+
+        Returns:
+            pd.DataFrame: 해당 시즌의 데이터
+        """
+        return self._take(self.season_positions.get(season))
+
+    def get_player_season(self, player_name: str, season: int) -> pd.DataFrame:
+        """
+        특정 선수의 특정 시즌 행을 조회합니다.
+
+        Args:
+            player_name: 선수 이름
+            season: 시즌
+
+        Returns:
+            pd.DataFrame: 해당 선수의 해당 시즌 데이터
+        """
+        player_data = self.get_player(player_name)
+        return player_data[player_data['Season'] == season]
+
+    def get_season_players(self, season: int) -> List[str]:
+        """
+        특정 시즌에 기록이 있는 선수 이름 목록을 반환합니다.
+
+        Args:
+            season: 시즌
+
+        Returns:
+            List[str]: 정렬된 선수 이름 목록
+        """
+        return sorted(self.get_season(season)['PlayerName'].unique())
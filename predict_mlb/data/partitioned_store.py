@@ -0,0 +1,375 @@
+"""
+시즌 파티션 저장소 모듈: 선수 유형별 데이터를 시즌당 파일 하나로 나눠 저장합니다.
+
+레이아웃 (CSV 파일 옆 partitions 디렉토리):
+    data/partitions/<CSV 파일명>/season=2023.parquet
+    data/partitions/<CSV 파일명>/manifest.json
+
+업데이트는 새 데이터에 포함된 시즌의 파티션만 다시 쓰므로, 시즌 중 일일 업데이트 비용이
+전체 25년치가 아니라 한 시즌 분량으로 줄어듭니다. 로더는 필요한 시즌 범위만 읽을 수 있습니다.
+리그 집계(aggregates.json)도 교체된 행만 빼고 새 행을 더하는 방식으로 함께 갱신됩니다.
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .aggregates import LeagueAggregateStore
+from .columnar_cache import PYARROW_AVAILABLE, clean_stats_frame
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+AGGREGATES_NAME = "aggregates.json"
+MANIFEST_FORMAT_VERSION = 1
+PARTITIONS_DIRNAME = "partitions"
+
+# 중복 판단 키 (새 데이터 우선)
+KEY_COLUMNS = ['PlayerID', 'Season']
+
+
+def get_partition_dir(csv_path: str) -> str:
+    """
+    CSV 파일에 대응하는 파티션 디렉토리 경로를 반환합니다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+
+    Returns:
+        str: 파티션 디렉토리 경로
+    """
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(csv_path)), PARTITIONS_DIRNAME, stem)
+
+
+def _atomic_write(path: str, write_func) -> None:
+    """임시 파일에 쓴 뒤 교체해서, 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 합니다."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write_func(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class PartitionedStore:
+    """시즌 파티션 저장소 클래스"""
+
+    def __init__(self, root_dir: str):
+        """
+        PartitionedStore 클래스 초기화
+
+        Args:
+            root_dir: 파티션 디렉토리 (데이터셋 하나당 하나)
+        """
+        self.root_dir = root_dir
+        self.manifest_path = os.path.join(root_dir, MANIFEST_NAME)
+        self.aggregates_path = os.path.join(root_dir, AGGREGATES_NAME)
+        # pyarrow가 없으면 시즌별 CSV 파일로 저장
+        self.file_format = 'parquet' if PYARROW_AVAILABLE else 'csv'
+
+    @classmethod
+    def for_csv(cls, csv_path: str) -> 'PartitionedStore':
+        """
+        CSV 파일에 대응하는 파티션 저장소를 반환합니다.
+
+        Args:
+            csv_path: 원본 CSV 파일 경로
+
+        Returns:
+            PartitionedStore: 파티션 저장소
+        """
+        return cls(get_partition_dir(csv_path))
+
+    def exists(self) -> bool:
+        """파티션 저장소(매니페스트)가 있는지 확인합니다."""
+        return os.path.exists(self.manifest_path)
+
+    def read_manifest(self) -> Dict[str, Any]:
+        """
+        매니페스트를 읽습니다.
+
+        Returns:
+            Dict[str, Any]: 매니페스트 (없으면 빈 매니페스트)
+        """
+        if not self.exists():
+            return {"format_version": MANIFEST_FORMAT_VERSION, "version": 0, "partitions": {}}
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """매니페스트를 원자적으로 저장합니다."""
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
+        _atomic_write(self.manifest_path, write)
+
+    @property
+    def version(self) -> int:
+        """업데이트마다 1씩 증가하는 저장소 버전"""
+        return int(self.read_manifest().get("version", 0))
+
+    def load_aggregates(self) -> Optional[LeagueAggregateStore]:
+        """
+        저장된 리그 집계를 읽습니다.
+
+        Returns:
+            Optional[LeagueAggregateStore]: 현재 매니페스트 버전과 일치하는 집계, 없으면 None
+        """
+        aggregates = LeagueAggregateStore.load(self.aggregates_path)
+        if aggregates is None or aggregates.source_version != self.version:
+            return None
+        return aggregates
+
+    def seasons(self) -> List[int]:
+        """
+        저장된 시즌 목록을 반환합니다.
+
+        Returns:
+            List[int]: 정렬된 시즌 목록
+        """
+        return sorted(int(season) for season in self.read_manifest()["partitions"])
+
+    def _partition_path(self, filename: str) -> str:
+        """파티션 파일 경로를 반환합니다."""
+        return os.path.join(self.root_dir, filename)
+
+    def _read_partition(self, entry: Dict[str, Any]) -> pd.DataFrame:
+        """파티션 파일 하나를 읽습니다."""
+        path = self._partition_path(entry["file"])
+        if entry.get("format", 'parquet') == 'parquet':
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+
+    def _write_partition(self, season: int, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        시즌 파티션 하나를 저장하고 매니페스트 항목을 반환합니다.
+
+        Args:
+            season: 시즌
+            df: 해당 시즌 데이터
+
+        Returns:
+            Dict[str, Any]: 매니페스트 항목
+        """
+        filename = f"season={season}.{self.file_format}"
+        if self.file_format == 'parquet':
+            _atomic_write(self._partition_path(filename), lambda path: df.to_parquet(path, index=False))
+        else:
+            _atomic_write(self._partition_path(filename), lambda path: df.to_csv(path, index=False))
+        return {"file": filename, "format": self.file_format, "rows": int(len(df)), "updated_at": time.time()}
+
+    def read(self, seasons: Optional[Iterable[int]] = None,
+             season_range: Optional[Tuple[int, int]] = None) -> pd.DataFrame:
+        """
+        파티션을 읽어 하나의 데이터프레임으로 반환합니다. 요청한 시즌 파일만 읽습니다.
+
+        Args:
+            seasons: 읽을 시즌 목록 (None이면 전체)
+            season_range: 읽을 시즌 범위 (시작, 끝) - 양끝 포함
+
+        Returns:
+            pd.DataFrame: 시즌순으로 이어 붙인 데이터 (원본 CSV와 같은 컬럼)
+        """
+        partitions = self.read_manifest()["partitions"]
+        selected = sorted(int(season) for season in partitions)
+        if seasons is not None:
+            wanted = {int(season) for season in seasons}
+            selected = [season for season in selected if season in wanted]
+        if season_range is not None:
+            start, end = season_range
+            selected = [season for season in selected if start <= season <= end]
+
+        frames = [self._read_partition(partitions[str(season)]) for season in selected]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def upsert(self, new_data: pd.DataFrame) -> List[int]:
+        """
+        새 데이터를 병합합니다. 새 데이터에 포함된 시즌의 파티션만 다시 씁니다.
+
+        Args:
+            new_data: 새 데이터 (PlayerID, Season 기준으로 기존 데이터보다 우선)
+
+        Returns:
+            List[int]: 다시 쓴 시즌 목록
+        """
+        if new_data.empty:
+            return []
+
+        os.makedirs(self.root_dir, exist_ok=True)
+        manifest = self.read_manifest()
+        partitions = manifest["partitions"]
+        touched = []
+
+        # 새 저장소면 빈 집계에서 시작, 기존 집계가 최신이 아니면 다음 로드 때 다시 만듦
+        if not partitions:
+            aggregates = LeagueAggregateStore.from_frame(clean_stats_frame(new_data.iloc[0:0]))
+        else:
+            aggregates = self.load_aggregates()
+
+        for season, season_data in new_data.groupby('Season', sort=True):
+            season = int(season)
+            new_rows = season_data.drop_duplicates(subset=KEY_COLUMNS, keep='last')
+            replaced = new_rows.iloc[0:0]
+            season_data = new_rows
+            entry = partitions.get(str(season))
+            if entry is not None:
+                existing = self._read_partition(entry)
+                is_replaced = existing.set_index(KEY_COLUMNS).index.isin(new_rows.set_index(KEY_COLUMNS).index)
+                replaced = existing[is_replaced]
+                season_data = pd.concat([existing[~is_replaced], new_rows], ignore_index=True)
+            season_data = season_data.sort_values('PlayerName').reset_index(drop=True)
+
+            # 집계는 교체된 기존 행만 빼고 새 행을 더함 (시즌 전체를 다시 훑지 않음)
+            if aggregates is not None:
+                aggregates.subtract(clean_stats_frame(replaced))
+                aggregates.add(clean_stats_frame(new_rows))
+
+            partitions[str(season)] = self._write_partition(season, season_data)
+            touched.append(season)
+
+        manifest["format_version"] = MANIFEST_FORMAT_VERSION
+        manifest["version"] = int(manifest.get("version", 0)) + 1
+        manifest["updated_at"] = time.time()
+        self._write_manifest(manifest)
+        if aggregates is not None:
+            aggregates.source_version = manifest["version"]
+            aggregates.save(self.aggregates_path)
+        logger.info(f"파티션 업데이트 완료: {self.root_dir} (시즌 {touched})")
+        return touched
+
+    def bootstrap_from_csv(self, csv_path: str) -> List[int]:
+        """
+        기존 CSV 전체를 시즌 파티션으로 나눠 저장합니다.
+
+        Args:
+            csv_path: 원본 CSV 파일 경로
+
+        Returns:
+            List[int]: 생성된 시즌 목록
+        """
+        df = pd.read_csv(csv_path)
+        logger.info(f"CSV에서 파티션 생성: {csv_path} ({len(df)}개 레코드)")
+        return self.upsert(df)
+
+    def export_csv(self, csv_path: str) -> None:
+        """
+        전체 파티션을 단일 CSV로 내보냅니다. (CSV를 직접 읽는 도구와의 호환용, 전체 재작성)
+
+        Args:
+            csv_path: 저장할 CSV 파일 경로
+        """
+        df = self.read().sort_values(['PlayerName', 'Season'])
+        _atomic_write(csv_path, lambda path: df.to_csv(path, index=False))
+        logger.info(f"CSV 내보내기 완료: {csv_path} ({len(df)}개 레코드)")
+
+
+def dataset_exists(csv_path: str) -> bool:
+    """
+    CSV 데이터셋이 있는지 확인합니다. (파티션 저장소 또는 CSV 파일)
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+
+    Returns:
+        bool: 파티션 저장소나 CSV 파일이 있으면 True
+    """
+    return PartitionedStore.for_csv(csv_path).exists() or os.path.exists(csv_path)
+
+
+def read_dataset(csv_path: str) -> pd.DataFrame:
+    """
+    데이터셋 전체를 정제 없이 읽습니다. 파티션 저장소가 있으면 CSV 대신 파티션을 읽습니다.
+
+    결측치 검사처럼 원본 값이 필요한 도구용이며, 앱 화면은 레지스트리의 정제된 프레임을 사용합니다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+
+    Returns:
+        pd.DataFrame: 원본 컬럼 그대로의 데이터
+
+    Raises:
+        FileNotFoundError: 파티션 저장소와 CSV 파일이 모두 없는 경우
+    """
+    store = PartitionedStore.for_csv(csv_path)
+    if store.exists():
+        return store.read()
+    return pd.read_csv(csv_path)
+
+
+def dataset_stat(csv_path: str) -> Tuple[int, float]:
+    """
+    데이터셋의 디스크 크기와 최종 수정 시각을 반환합니다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+
+    Returns:
+        Tuple[int, float]: (바이트 수, 수정 시각 타임스탬프) - 파티션 저장소가 있으면 파티션 파일 합계와 매니페스트 기준
+
+    Raises:
+        FileNotFoundError: 파티션 저장소와 CSV 파일이 모두 없는 경우
+    """
+    store = PartitionedStore.for_csv(csv_path)
+    if store.exists():
+        partitions = store.read_manifest()["partitions"].values()
+        size = sum(os.path.getsize(store._partition_path(entry["file"])) for entry in partitions)
+        return size, os.stat(store.manifest_path).st_mtime
+    stat = os.stat(csv_path)
+    return stat.st_size, stat.st_mtime
+
+
+def upsert_dataset(new_data: pd.DataFrame, csv_path: str, export_csv: bool = False) -> List[int]:
+    """
+    CSV 데이터셋에 대응하는 파티션 저장소에 새 데이터를 병합합니다.
+    저장소가 아직 없으면 기존 CSV로 먼저 초기화합니다.
+
+    Args:
+        new_data: 새 데이터
+        csv_path: 원본 CSV 파일 경로
+        export_csv: 병합 후 CSV 전체를 다시 쓸지 여부
+
+    Returns:
+        List[int]: 다시 쓴 시즌 목록
+    """
+    store = PartitionedStore.for_csv(csv_path)
+    if not store.exists() and os.path.exists(csv_path):
+        store.bootstrap_from_csv(csv_path)
+    touched = store.upsert(new_data)
+    if export_csv:
+        store.export_csv(csv_path)
+    return touched
+
+
+def main():
+    """파티션 저장소 관리 명령 (bootstrap: CSV → 파티션, export: 파티션 → CSV)"""
+    from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+
+    parser = argparse.ArgumentParser(description="시즌 파티션 저장소 관리")
+    parser.add_argument("command", choices=["bootstrap", "export", "status"])
+    args = parser.parse_args()
+
+    for csv_path in [BATTER_STATS_FILE, PITCHER_STATS_FILE]:
+        store = PartitionedStore.for_csv(csv_path)
+        if args.command == "bootstrap":
+            seasons = store.bootstrap_from_csv(csv_path)
+            print(f"{store.root_dir}: {len(seasons)}개 시즌 파티션 생성")
+        elif args.command == "export":
+            store.export_csv(csv_path)
+            print(f"{csv_path}: 내보내기 완료")
+        else:
+            manifest = store.read_manifest()
+            print(f"{store.root_dir}: 버전 {manifest.get('version', 0)}, 시즌 {store.seasons()}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
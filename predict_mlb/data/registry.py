@@ -0,0 +1,255 @@
+"""
+데이터 레지스트리 모듈: 프로세스 전체에서 공유하는 데이터셋 저장소를 제공합니다.
+
+루트 페이지(search/trend/predict)와 predict_mlb 패키지 페이지가 같은 CSV를 각자
+캐시하지 않도록, 데이터셋을 (원본 경로, 스키마) 기준으로 프로세스당 한 번만 로드해
+보관합니다. 각 항목은 원본 파일의 mtime/크기로 만든 버전을 가지며, 원본이 바뀌면
+다음 조회 시 새 버전으로 교체됩니다. CSV에 대응하는 시즌 파티션 저장소가 있으면
+CSV 대신 파티션을 읽고, 매니페스트를 버전 기준으로 사용합니다. 리그 집계도 항목별로
+한 번만 만들며, 파티션 저장소에 최신 집계 파일이 있으면 그대로 읽습니다.
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from .aggregates import LeagueAggregateStore
+from .columnar_cache import clean_stats_frame, load_stats_frame
+from .frame_index import FrameIndex
+from .partitioned_store import PartitionedStore
+from .schema import ColumnSchema, schema_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def source_version(path: str) -> str:
+    """
+    원본 파일의 버전 문자열을 반환합니다.
+
+    Args:
+        path: 원본 파일 경로
+
+    Returns:
+        str: "mtime_ns-size" 형식의 버전
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+    """
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def dataset_version(path: str) -> str:
+    """
+    데이터셋 버전을 반환합니다. 파티션 저장소가 있으면 매니페스트 기준입니다.
+
+    Args:
+        path: 원본 CSV 파일 경로
+
+    Returns:
+        str: 데이터셋 버전
+
+    Raises:
+        FileNotFoundError: 원본 파일과 파티션이 모두 없는 경우
+    """
+    store = PartitionedStore.for_csv(path)
+    if store.exists():
+        return "partitions:" + source_version(store.manifest_path)
+    return source_version(path)
+
+
+def _load_dataset(path: str, schema: Optional[ColumnSchema] = None,
+                  season_range: Optional[Tuple[int, int]] = None) -> pd.DataFrame:
+    """파티션 저장소가 있으면 파티션에서, 없으면 컬럼형 캐시를 거쳐 CSV에서 로드합니다."""
+    store = PartitionedStore.for_csv(path)
+    if store.exists():
+        return clean_stats_frame(store.read(season_range=season_range), schema)
+    frame = load_stats_frame(path, schema)
+    if season_range is not None:
+        frame = frame[frame['Season'].between(*season_range)]
+    return frame
+
+
+@dataclass
+class DatasetEntry:
+    """레지스트리에 보관되는 데이터셋 항목 (프레임은 읽기 전용으로 다뤄야 함)"""
+    path: str
+    version: str
+    frame: pd.DataFrame
+    loaded_at: float = field(default_factory=time.time)
+    _index: Optional[FrameIndex] = field(default=None, repr=False)
+    _aggregates: Optional[LeagueAggregateStore] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def index(self) -> FrameIndex:
+        """선수/시즌 인덱스 (처음 접근할 때 한 번만 생성)"""
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = FrameIndex(self.frame)
+        return self._index
+
+    @property
+    def aggregates(self) -> LeagueAggregateStore:
+        """시즌별 리그 집계 (파티션의 집계 파일이 최신이면 읽고, 아니면 프레임에서 한 번 생성)"""
+        if self._aggregates is None:
+            with self._lock:
+                if self._aggregates is None:
+                    store = PartitionedStore.for_csv(self.path)
+                    aggregates = store.load_aggregates() if store.exists() else None
+                    if aggregates is None:
+                        aggregates = LeagueAggregateStore.from_frame(self.frame, source_version=self.version)
+                    self._aggregates = aggregates
+        return self._aggregates
+
+
+class DataRegistry:
+    """프로세스 전역 데이터셋 레지스트리 클래스"""
+
+    def __init__(self):
+        """DataRegistry 클래스 초기화"""
+        self._entries: Dict[Tuple[str, str], DatasetEntry] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def get(self, path: str, schema: Optional[ColumnSchema] = None) -> DatasetEntry:
+        """
+        데이터셋 항목을 반환합니다. 원본 버전이 바뀐 경우에만 다시 로드합니다.
+
+        같은 데이터셋을 여러 세션이 동시에 요청해도 로드는 한 번만 수행됩니다.
+
+        Args:
+            path: 원본 CSV 파일 경로
+            schema: 적용할 컬럼 스키마
+
+        Returns:
+            DatasetEntry: 데이터셋 항목
+
+        Raises:
+            FileNotFoundError: 원본 파일이 없는 경우
+        """
+        key = (os.path.abspath(path), schema_fingerprint(schema))
+        version = dataset_version(path)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # 다른 스레드가 먼저 로드했는지 다시 확인
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                return entry
+
+            frame = _load_dataset(path, schema)
+            entry = DatasetEntry(path=key[0], version=version, frame=frame)
+            self._entries[key] = entry
+            logger.info(f"데이터셋 로드: {os.path.basename(path)} (버전 {version}, {len(frame)}개 레코드)")
+            return entry
+
+    def get_frame(self, path: str, schema: Optional[ColumnSchema] = None) -> pd.DataFrame:
+        """
+        데이터프레임을 반환합니다.
+
+        Args:
+            path: 원본 CSV 파일 경로
+            schema: 적용할 컬럼 스키마
+
+        Returns:
+            pd.DataFrame: 공유 데이터프레임 (변경하지 말고 필요하면 복사해서 사용)
+        """
+        return self.get(path, schema).frame
+
+    def get_index(self, path: str, schema: Optional[ColumnSchema] = None) -> FrameIndex:
+        """
+        데이터셋의 선수/시즌 인덱스를 반환합니다.
+
+        Args:
+            path: 원본 CSV 파일 경로
+            schema: 적용할 컬럼 스키마
+
+        Returns:
+            FrameIndex: 선수/시즌 인덱스
+        """
+        return self.get(path, schema).index
+
+    def get_aggregates(self, path: str, schema: Optional[ColumnSchema] = None) -> LeagueAggregateStore:
+        """
+        데이터셋의 시즌별 리그 집계를 반환합니다.
+
+        Args:
+            path: 원본 CSV 파일 경로
+            schema: 적용할 컬럼 스키마
+
+        Returns:
+            LeagueAggregateStore: 리그 집계 저장소
+        """
+        return self.get(path, schema).aggregates
+
+    def get_season_range(self, path: str, schema: Optional[ColumnSchema],
+                         season_range: Tuple[int, int]) -> pd.DataFrame:
+        """
+        특정 시즌 범위의 데이터만 반환합니다.
+
+        전체 데이터셋이 이미 로드되어 있으면 공유 프레임에서 잘라내고,
+        아니면 해당 시즌 파티션만 읽습니다. (결과는 레지스트리에 보관하지 않음)
+
+        Args:
+            path: 원본 CSV 파일 경로
+            schema: 적용할 컬럼 스키마
+            season_range: 시즌 범위 (시작, 끝) - 양끝 포함
+
+        Returns:
+            pd.DataFrame: 해당 시즌 범위 데이터
+        """
+        key = (os.path.abspath(path), schema_fingerprint(schema))
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == dataset_version(path):
+            frame = entry.frame
+            return frame[frame['Season'].between(*season_range)]
+        return _load_dataset(path, schema, season_range)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        보관 중인 데이터셋을 제거합니다.
+
+        Args:
+            path: 제거할 원본 파일 경로 (None이면 전체 제거)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            target = os.path.abspath(path)
+            for key in [key for key in self._entries if key[0] == target]:
+                del self._entries[key]
+
+    def versions(self) -> Dict[str, str]:
+        """
+        보관 중인 데이터셋의 버전을 반환합니다.
+
+        Returns:
+            Dict[str, str]: 파일 경로 → 버전
+        """
+        return {entry.path: entry.version for entry in list(self._entries.values())}
+
+
+_registry = DataRegistry()
+
+
+def get_registry() -> DataRegistry:
+    """
+    프로세스 전역 데이터 레지스트리를 반환합니다.
+
+    Returns:
+        DataRegistry: 레지스트리 싱글톤
+    """
+    return _registry
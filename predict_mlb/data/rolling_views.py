@@ -0,0 +1,121 @@
+"""
+이동평균 뷰 모듈: 여러 윈도우 크기의 이동평균을 누적합으로 한 번에 계산합니다.
+
+지표별 `rolling().mean()`을 윈도우마다 반복하고 프레임을 복사하는 대신, (시즌 × 지표)
+2차원 배열의 누적합과 누적 개수를 한 번 만들어 두고 모든 윈도우를 벡터 연산으로 계산합니다.
+결과는 (window, metric, Season) 키의 긴 형식 테이블 하나에 보관하며, 미리 계산하지 않은
+윈도우도 같은 누적합에서 바로 계산합니다. (pandas `rolling(window, min_periods=1).mean()`과 동일)
+"""
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class RollingViews:
+    """누적합 기반 이동평균 뷰 클래스"""
+
+    def __init__(self, df: pd.DataFrame, metrics: List[str], windows: Iterable[int] = (),
+                 order_column: str = 'Season'):
+        """
+        RollingViews 클래스 초기화
+
+        Args:
+            df: 시즌별 데이터프레임 (예: 리그 평균)
+            metrics: 이동평균을 계산할 지표 목록
+            windows: 미리 계산해 둘 윈도우 크기 목록
+            order_column: 정렬 기준 컬럼
+        """
+        self.metrics = list(metrics)
+        order = np.argsort(df[order_column].to_numpy(), kind='stable')
+        self.seasons = df[order_column].to_numpy()[order]
+        values = df[self.metrics].to_numpy(dtype='float64')[order]
+
+        # 앞에 0행을 붙인 누적합: 구간 [lo, hi)의 합 = prefix[hi] - prefix[lo]
+        valid = ~np.isnan(values)
+        self._prefix_sum = np.zeros((len(values) + 1, len(self.metrics)))
+        self._prefix_count = np.zeros((len(values) + 1, len(self.metrics)))
+        np.cumsum(np.where(valid, values, 0.0), axis=0, out=self._prefix_sum[1:])
+        np.cumsum(valid, axis=0, out=self._prefix_count[1:])
+
+        self.windows = sorted({int(window) for window in windows})
+        self.table = self._build_table(self.windows)
+
+    def _compute(self, windows: List[int]) -> np.ndarray:
+        """
+        윈도우별 이동평균을 한 번에 계산합니다.
+
+        Args:
+            windows: 윈도우 크기 목록
+
+        Returns:
+            np.ndarray: (윈도우 × 시즌 × 지표) 배열, 윈도우 안에 값이 없으면 NaN
+        """
+        n = len(self.seasons)
+        hi = np.arange(1, n + 1)
+        lo = np.maximum(hi[None, :] - np.asarray(windows)[:, None], 0)
+        sums = self._prefix_sum[hi][None, :, :] - self._prefix_sum[lo]
+        counts = self._prefix_count[hi][None, :, :] - self._prefix_count[lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def _build_table(self, windows: List[int]) -> pd.DataFrame:
+        """윈도우 목록의 결과를 (window, metric, Season) 인덱스의 긴 형식 테이블로 만듭니다."""
+        index = pd.MultiIndex.from_product([windows, self.metrics, self.seasons],
+                                           names=['window', 'metric', 'Season'])
+        if not windows:
+            return pd.DataFrame({'value': np.empty(0)}, index=index)
+        # (윈도우, 시즌, 지표) → (윈도우, 지표, 시즌) 순서로 펼침
+        values = self._compute(windows).transpose(0, 2, 1).reshape(-1)
+        return pd.DataFrame({'value': values}, index=index)
+
+    def add_windows(self, windows: Iterable[int]) -> None:
+        """
+        윈도우를 추가로 계산해 테이블에 보관합니다.
+
+        Args:
+            windows: 추가할 윈도우 크기 목록
+        """
+        new_windows = sorted({int(window) for window in windows} - set(self.windows))
+        if not new_windows:
+            return
+        self.table = pd.concat([self.table, self._build_table(new_windows)]).sort_index()
+        self.windows = sorted(self.windows + new_windows)
+
+    def series(self, window: int, metric: str) -> pd.Series:
+        """
+        지표 하나의 이동평균을 반환합니다.
+
+        Args:
+            window: 윈도우 크기 (미리 계산하지 않은 크기도 가능)
+            metric: 지표
+
+        Returns:
+            pd.Series: 시즌 인덱스의 이동평균
+        """
+        if window in self.windows:
+            return self.table['value'].loc[(window, metric)]
+        values = self._compute([window])[0, :, self.metrics.index(metric)]
+        return pd.Series(values, index=pd.Index(self.seasons, name='Season'), name='value')
+
+    def frame(self, window: int, metrics: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        넓은 형식(Season + 지표 컬럼)의 이동평균 데이터프레임을 반환합니다.
+
+        Args:
+            window: 윈도우 크기 (미리 계산하지 않은 크기도 가능)
+            metrics: 지표 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: Season 컬럼과 지표별 이동평균 컬럼
+        """
+        metrics = self.metrics if metrics is None else list(metrics)
+        if window in self.windows:
+            wide = self.table['value'].loc[window].unstack('metric')
+            wide = wide[metrics]
+        else:
+            columns = [self.metrics.index(metric) for metric in metrics]
+            wide = pd.DataFrame(self._compute([window])[0][:, columns], columns=metrics,
+                                index=pd.Index(self.seasons, name='Season'))
+        wide.columns.name = None
+        return wide.reset_index()
@@ -0,0 +1,166 @@
+"""
+데이터 스키마 모듈: 타자/투수 데이터프레임의 명시적 컴팩트 dtype 스키마를 정의합니다.
+
+read_csv의 dtype 추론 대신 선언된 스키마를 적용해 선수명/팀은 categorical,
+시즌은 int16, 누적 기록은 nullable 소형 정수, 비율 기록은 float32로 저장합니다.
+"""
+import hashlib
+import json
+import logging
+from typing import Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ColumnSchema = Dict[str, str]
+
+# 스키마를 바꾸면 올려서 컬럼형 캐시를 무효화합니다.
+SCHEMA_VERSION = 1
+
+# 공통 식별 컬럼
+_ID_COLUMNS: ColumnSchema = {
+    'Season': 'int16',
+    'PlayerID': 'int32',
+    'PlayerName': 'category',
+    'Team': 'category',
+}
+
+BATTER_SCHEMA: ColumnSchema = {
+    **_ID_COLUMNS,
+    # 누적 기록 (GamesPlayed/AtBats/Runs는 CSV에 "133.0" 형태로 저장되어 있음)
+    'GamesPlayed': 'Int16',
+    'AtBats': 'Int16',
+    'Runs': 'Int16',
+    'Hits': 'Int16',
+    'HomeRuns': 'Int16',
+    'RBIs': 'Int16',
+    'StolenBases': 'Int16',
+    'Walks': 'Int16',
+    'StrikeOuts': 'Int16',
+    # 비율 기록
+    'BattingAverage': 'float32',
+    'OnBasePercentage': 'float32',
+    'SluggingPercentage': 'float32',
+    'OPS': 'float32',
+}
+
+PITCHER_SCHEMA: ColumnSchema = {
+    **_ID_COLUMNS,
+    # 누적 기록
+    'GamesPlayed': 'Int16',
+    'Wins': 'Int16',
+    'Losses': 'Int16',
+    'StrikeOuts': 'Int16',
+    'Walks': 'Int16',
+    'HitsAllowed': 'Int16',
+    'HomeRunsAllowed': 'Int16',
+    'Saves': 'Int16',
+    # 비율 기록 (이닝은 173.1처럼 소수 표기를 쓰므로 실수형)
+    'EarnedRunAverage': 'float32',
+    'InningsPitched': 'float32',
+    'Whip': 'float32',
+    'QualifyingInnings': 'boolean',
+}
+
+SCHEMAS: Dict[str, ColumnSchema] = {
+    'batter': BATTER_SCHEMA,
+    'pitcher': PITCHER_SCHEMA,
+}
+
+
+def get_schema(player_type: str) -> ColumnSchema:
+    """
+    선수 유형에 해당하는 스키마를 반환합니다.
+
+    Args:
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+    Returns:
+        ColumnSchema: 컬럼명-dtype 매핑
+    """
+    return SCHEMAS['batter' if player_type.lower() == 'batter' else 'pitcher']
+
+
+def schema_fingerprint(schema: Optional[ColumnSchema]) -> str:
+    """
+    스키마 내용을 식별하는 짧은 해시를 반환합니다. 캐시 키에 사용됩니다.
+
+    Args:
+        schema: 컬럼 스키마 (None이면 스키마 미적용)
+
+    Returns:
+        str: 스키마 지문
+    """
+    payload = json.dumps({'version': SCHEMA_VERSION, 'columns': schema or {}}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def apply_schema(df: pd.DataFrame, schema: ColumnSchema) -> pd.DataFrame:
+    """
+    데이터프레임에 스키마를 적용합니다.
+
+    스키마에 없는 컬럼은 그대로 두고, 변환할 수 없는 컬럼(예: 정수형에 소수값)은
+    경고를 남기고 기존 dtype을 유지합니다.
+
+    Args:
+        df: 변환할 데이터프레임
+        schema: 컬럼 스키마
+
+    Returns:
+        pd.DataFrame: 스키마가 적용된 데이터프레임
+    """
+    result = df.copy()
+    for column, dtype in schema.items():
+        if column not in result.columns or str(result[column].dtype) == dtype:
+            continue
+        try:
+            result[column] = result[column].astype(dtype)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"{column} 컬럼을 {dtype}로 변환할 수 없습니다: {e}")
+    return result
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    스키마 적용 전후의 컬럼별 메모리 사용량을 비교합니다.
+
+    Args:
+        before: 스키마 적용 전 데이터프레임
+        after: 스키마 적용 후 데이터프레임
+
+    Returns:
+        pd.DataFrame: 컬럼별 dtype, 전후 바이트 수, 절감 바이트 수 (마지막 행은 합계)
+    """
+    before_bytes = before.memory_usage(deep=True, index=False)
+    after_bytes = after.memory_usage(deep=True, index=False)
+
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_before': before_bytes,
+        'bytes_after': after_bytes,
+    })
+    report['bytes_saved'] = report['bytes_before'] - report['bytes_after']
+    report.loc['TOTAL'] = ['', '', before_bytes.sum(), after_bytes.sum(),
+                           before_bytes.sum() - after_bytes.sum()]
+    return report
+
+
+def main():
+    """타자/투수 데이터에 스키마를 적용했을 때의 컬럼별 메모리 절감량을 출력합니다."""
+    from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+
+    for player_type, path in [('batter', BATTER_STATS_FILE), ('pitcher', PITCHER_STATS_FILE)]:
+        raw = pd.read_csv(path)
+        typed = apply_schema(raw, get_schema(player_type))
+        report = memory_report(raw, typed)
+        total = report.loc['TOTAL']
+        print(f"\n=== {player_type}: {path} ===")
+        print(report.to_string())
+        print(f"총 {total['bytes_before']:,} → {total['bytes_after']:,} 바이트 "
+              f"({total['bytes_saved'] / max(total['bytes_before'], 1):.1%} 절감)")
+
+
+if __name__ == "__main__":
+    main()
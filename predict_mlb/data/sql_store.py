@@ -0,0 +1,243 @@
+"""
+SQL 저장소 모듈: 타자/투수 테이블을 로컬 임베디드 데이터베이스(SQLite) 파일로 제공합니다.
+
+여러 서버 프로세스가 전체 CSV를 각자 메모리에 올리지 않고 하나의 디스크 데이터셋을
+공유할 수 있도록, 선수/시즌 조회와 리그 평균을 인덱스 기반 쿼리로 처리합니다.
+"""
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .registry import dataset_version, get_registry
+from .schema import ColumnSchema, apply_schema, get_schema
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAMES: Dict[str, str] = {
+    'batter': 'batter_stats',
+    'pitcher': 'pitcher_stats',
+}
+
+
+def _player_key(player_type: str) -> str:
+    """선수 유형 문자열을 'batter' 또는 'pitcher'로 정규화합니다."""
+    return 'batter' if player_type.lower() == 'batter' else 'pitcher'
+
+
+def _quote(identifier: str) -> str:
+    """SQL 식별자를 인용합니다."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SQLiteStatsStore:
+    """SQLite 기반 통계 저장소 클래스"""
+
+    def __init__(self, db_path: str):
+        """
+        SQLiteStatsStore 클래스 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def __reduce__(self):
+        """연결/락은 제외하고 파일 경로만으로 직렬화합니다. (캐시 해싱, 프로세스 간 전달용)"""
+        return (self.__class__, (self.db_path,))
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        현재 스레드용 읽기 연결을 반환합니다. (Streamlit 세션 스레드마다 별도 연결)
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        """메타 테이블과 저널 모드를 설정합니다."""
+        # WAL 모드: 재구축 중에도 다른 프로세스의 읽기가 막히지 않음
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS dataset_meta ("
+            "player_type TEXT PRIMARY KEY, source TEXT, version TEXT)"
+        )
+
+    def _read_version(self, conn: sqlite3.Connection, player_type: str) -> Optional[str]:
+        """저장된 데이터셋 버전을 읽습니다."""
+        row = conn.execute(
+            "SELECT version FROM dataset_meta WHERE player_type = ?", (player_type,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync_from_csv(self, csv_path: str, player_type: str = 'batter') -> bool:
+        """
+        데이터셋 버전이 바뀐 경우에만 테이블을 다시 만듭니다.
+
+        데이터는 레지스트리에서 가져오므로, 시즌 파티션 저장소가 있으면 CSV 대신
+        파티션(매니페스트 버전)을 따릅니다.
+
+        Args:
+            csv_path: 원본 CSV 파일 경로
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            bool: 테이블을 다시 만들었으면 True
+        """
+        key = _player_key(player_type)
+
+        with self._write_lock:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                self._init_schema(conn)
+                if self._read_version(conn, key) == dataset_version(csv_path):
+                    return False
+
+                entry = get_registry().get(csv_path, get_schema(key))
+                self._replace_table(conn, key, entry.frame)
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO dataset_meta VALUES (?, ?, ?)",
+                        (key, os.path.basename(csv_path), entry.version),
+                    )
+                logger.info(f"SQL 저장소 재구축 완료: {TABLE_NAMES[key]} ({len(entry.frame)}개 레코드, 버전 {entry.version})")
+                return True
+            finally:
+                conn.close()
+
+    def _replace_table(self, conn: sqlite3.Connection, player_type: str, df: pd.DataFrame) -> None:
+        """
+        테이블을 하나의 트랜잭션 안에서 교체하고 복합 인덱스를 만듭니다.
+
+        Args:
+            conn: 쓰기 연결
+            player_type: 선수 유형
+            df: 저장할 데이터프레임
+        """
+        table = TABLE_NAMES[player_type]
+        # categorical/nullable dtype은 SQLite 기본 타입으로 변환
+        plain = df.astype({col: 'object' for col in df.columns
+                           if isinstance(df[col].dtype, pd.CategoricalDtype) or str(df[col].dtype) == 'boolean'})
+        columns = ", ".join(_quote(col) for col in plain.columns)
+        placeholders = ", ".join("?" for _ in plain.columns)
+        rows = plain.astype(object).where(plain.notna(), None).itertuples(index=False, name=None)
+
+        with conn:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.execute(f"CREATE TABLE {table} ({columns})")
+            conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+            conn.execute(f"CREATE INDEX idx_{table}_player_season ON {table} (PlayerID, Season)")
+            conn.execute(f"CREATE INDEX idx_{table}_season_team ON {table} (Season, Team)")
+            conn.execute(f"CREATE INDEX idx_{table}_player_name ON {table} (PlayerName, Season)")
+
+    def _query(self, sql: str, params: tuple = (), schema: Optional[ColumnSchema] = None) -> pd.DataFrame:
+        """쿼리 결과를 데이터프레임으로 반환합니다. 스키마가 주어지면 dtype을 맞춥니다."""
+        df = pd.read_sql_query(sql, self._connect(), params=params)
+        return apply_schema(df, schema) if schema else df
+
+    def get_player_data(self, player_name: str, player_type: str = 'batter') -> pd.DataFrame:
+        """
+        선수 이름으로 데이터를 조회합니다. (PlayerName, Season) 인덱스를 사용합니다.
+
+        Args:
+            player_name: 선수 이름
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            pd.DataFrame: 해당 선수의 시즌순 데이터
+        """
+        key = _player_key(player_type)
+        return self._query(
+            f"SELECT * FROM {TABLE_NAMES[key]} WHERE PlayerName = ? ORDER BY Season",
+            (player_name,), get_schema(key),
+        )
+
+    def get_player_data_by_id(self, player_id: int, player_type: str = 'batter') -> pd.DataFrame:
+        """
+        선수 ID로 데이터를 조회합니다. (PlayerID, Season) 인덱스를 사용합니다.
+
+        Args:
+            player_id: 선수 ID
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            pd.DataFrame: 해당 선수의 시즌순 데이터
+        """
+        key = _player_key(player_type)
+        return self._query(
+            f"SELECT * FROM {TABLE_NAMES[key]} WHERE PlayerID = ? ORDER BY Season",
+            (int(player_id),), get_schema(key),
+        )
+
+    def get_season_data(self, season: int, player_type: str = 'batter') -> pd.DataFrame:
+        """
+        특정 시즌 데이터를 조회합니다. (Season, Team) 인덱스를 사용합니다.
+
+        Args:
+            season: 시즌
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            pd.DataFrame: 해당 시즌 데이터
+        """
+        key = _player_key(player_type)
+        return self._query(
+            f"SELECT * FROM {TABLE_NAMES[key]} WHERE Season = ?", (int(season),), get_schema(key),
+        )
+
+    def calculate_league_averages(self, metrics: List[str], player_type: str = 'batter') -> pd.DataFrame:
+        """
+        시즌별 리그 평균을 계산합니다.
+
+        Args:
+            metrics: 계산할 지표 리스트
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            pd.DataFrame: 시즌별 리그 평균 데이터프레임
+        """
+        key = _player_key(player_type)
+        averages = ", ".join(f"AVG({_quote(m)}) AS {_quote(m)}" for m in metrics)
+        return self._query(
+            f"SELECT Season, {averages} FROM {TABLE_NAMES[key]} GROUP BY Season ORDER BY Season"
+        )
+
+    def get_all_seasons(self, player_type: str = 'batter') -> List[int]:
+        """
+        모든 시즌 목록을 반환합니다. (Season, Team) 인덱스만 읽습니다.
+
+        Args:
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            List[int]: 시즌 목록
+        """
+        key = _player_key(player_type)
+        rows = self._connect().execute(
+            f"SELECT DISTINCT Season FROM {TABLE_NAMES[key]} ORDER BY Season"
+        ).fetchall()
+        return [int(row[0]) for row in rows]
+
+    def get_all_players(self, player_type: str = 'batter') -> List[str]:
+        """
+        모든 선수 이름 목록을 반환합니다.
+
+        Args:
+            player_type: 선수 유형 ('batter' 또는 'pitcher')
+
+        Returns:
+            List[str]: 정렬된 선수 이름 목록
+        """
+        key = _player_key(player_type)
+        rows = self._connect().execute(
+            f"SELECT DISTINCT PlayerName FROM {TABLE_NAMES[key]} ORDER BY PlayerName"
+        ).fetchall()
+        return [row[0] for row in rows]
@@ -0,0 +1,148 @@
+"""
+일괄 예측 작업 모듈: 예측 대상 타자/투수 전체의 지표별 예측을 미리 계산해 저장합니다.
+
+예측 페이지와 같은 조건(최근 필수 시즌 보유)과 같은 지표(PREDICT_METRIC_RANGES)로 예측 작업을
+만들고, 일괄 예측기에서 실행한 뒤 데이터 버전과 함께 예측 테이블에 저장합니다.
+야간 배치로 실행해 두면 예측 페이지는 훈련 없이 테이블 조회만으로 결과를 보여줍니다.
+
+사용 예:
+    python -m predict_mlb.forecast_all                  # 타자, 투수 전체
+    python -m predict_mlb.forecast_all --player-type pitcher --workers 4
+    python -m predict_mlb.forecast_all --backend prophet
+    python -m predict_mlb.forecast_all --replace         # 기존 테이블을 이번 결과로 전체 교체
+    python -m predict_mlb.forecast_all --status
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import List, Optional
+
+import pandas as pd
+
+from .config.settings import FORECAST_BACKEND, PREDICT_MAX_PERIODS, PREDICT_METRIC_RANGES, PREDICT_REQUIRED_SEASONS
+from .data.registry import get_registry
+from .data.schema import get_schema
+from .models.batch_forecaster import BatchForecaster, ForecastJob, make_jobs
+from .models.forecast_store import ForecastStore, results_to_frame
+from .models.forecasters import FORECASTER_BACKENDS
+
+logger = logging.getLogger(__name__)
+
+
+def eligible_jobs(data: pd.DataFrame, metrics: List[str], periods: int = PREDICT_MAX_PERIODS,
+                  limit: Optional[int] = None, backend: str = FORECAST_BACKEND) -> List[ForecastJob]:
+    """
+    예측 페이지 조건을 만족하는 선수들의 예측 작업을 만듭니다.
+
+    Args:
+        data: 선수 유형별 전체 데이터
+        metrics: 예측할 지표 목록
+        periods: 예측할 미래 기간 (연도 수, 기본값은 예측 페이지에서 고를 수 있는 최대 기간)
+        limit: 처리할 최대 선수 수 (None이면 전체)
+        backend: 예측 모델 백엔드
+
+    Returns:
+        List[ForecastJob]: 예측 작업 목록
+    """
+    # 예측 페이지와 같이 선수 이름 단위로 묶고, 필수 시즌을 모두 가진 선수만 대상
+    seasons_by_player = data.groupby('PlayerName', observed=True)['Season'].agg(set)
+    required = set(PREDICT_REQUIRED_SEASONS)
+    players = sorted(name for name, seasons in seasons_by_player.items() if required <= seasons)
+    if limit is not None:
+        players = players[:limit]
+
+    wanted = set(players)
+    jobs = []
+    for name, player_data in data[data['PlayerName'].isin(wanted)].groupby('PlayerName', observed=True):
+        jobs.extend(make_jobs(player_data, metrics, periods, backend))
+    return jobs
+
+
+def forecast_player_type(player_type: str, csv_path: str, forecaster: BatchForecaster,
+                         limit: Optional[int] = None, backend: str = FORECAST_BACKEND,
+                         replace: bool = False) -> int:
+    """
+    선수 유형 하나의 예측을 계산해 예측 테이블에 병합합니다.
+
+    같은 (데이터 버전, 백엔드, PlayerID, 지표) 키의 행만 교체하므로, 다른 백엔드나 데이터 버전,
+    --limit으로 빠진 선수의 예측은 유지됩니다.
+
+    Args:
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
+        csv_path: 원본 CSV 파일 경로
+        forecaster: 일괄 예측기
+        limit: 처리할 최대 선수 수 (None이면 전체)
+        backend: 예측 모델 백엔드
+        replace: True면 병합하지 않고 테이블 전체를 이번 결과로 다시 씀
+
+    Returns:
+        int: 저장한 예측 작업 수
+    """
+    entry = get_registry().get(csv_path, get_schema(player_type))
+    metrics = list(PREDICT_METRIC_RANGES[player_type])
+    jobs = eligible_jobs(entry.frame, metrics, limit=limit, backend=backend)
+    logger.info(f"{player_type}: {len(jobs)}개 예측 작업 ({backend}, 데이터 버전 {entry.version})")
+
+    results = []
+    failed = 0
+    start = time.perf_counter()
+    for done, result in enumerate(forecaster.iter_results(jobs), start=1):
+        if result.ok:
+            results.append(result)
+        else:
+            failed += 1
+            logger.warning(f"예측 실패: {result.job.player_name} {result.job.metric} - {result.error}")
+        if done % 100 == 0 or done == len(jobs):
+            logger.info(f"{player_type}: {done}/{len(jobs)} 완료 ({time.perf_counter() - start:.1f}초)")
+
+    store = ForecastStore.for_csv(csv_path)
+    rows = results_to_frame(results, entry.version)
+    if replace:
+        store.write(rows)
+    else:
+        store.merge(rows)
+    if failed:
+        logger.warning(f"{player_type}: {failed}개 작업 실패")
+    return len(results)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+
+    parser = argparse.ArgumentParser(description="리그 전체 선수 일괄 예측")
+    parser.add_argument("--player-type", choices=["batter", "pitcher", "all"], default="all")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: 사용 가능한 코어 수, 최대 4)")
+    parser.add_argument("--backend", choices=sorted(FORECASTER_BACKENDS), default=FORECAST_BACKEND,
+                        help=f"예측 모델 백엔드 (기본: {FORECAST_BACKEND})")
+    parser.add_argument("--limit", type=int, default=None, help="선수 유형별 최대 선수 수 (테스트용)")
+    parser.add_argument("--replace", action="store_true",
+                        help="기존 예측 테이블(다른 백엔드/데이터 버전 포함)을 이번 결과로 전체 교체")
+    parser.add_argument("--status", action="store_true", help="저장된 예측 요약만 출력")
+    args = parser.parse_args(argv)
+
+    targets = [("batter", BATTER_STATS_FILE), ("pitcher", PITCHER_STATS_FILE)]
+    if args.player_type != "all":
+        targets = [target for target in targets if target[0] == args.player_type]
+
+    if args.status:
+        for player_type, csv_path in targets:
+            store = ForecastStore.for_csv(csv_path)
+            print(f"{player_type}: {store.path}\n  {store.summary()}")
+        return 0
+
+    forecaster = BatchForecaster(max_workers=args.workers)
+    try:
+        for player_type, csv_path in targets:
+            count = forecast_player_type(player_type, csv_path, forecaster, args.limit, args.backend,
+                                         replace=args.replace)
+            print(f"{player_type}: {count}개 예측 저장")
+    finally:
+        forecaster.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+예측 구간 벤치마크 모듈: Prophet의 시뮬레이션 구간과 해석적 구간의 예측 시간과 포함률을 비교합니다.
+
+백테스트와 같은 기준 시즌별 작업으로 Prophet을 한 번 적합한 뒤, 같은 모델로
+uncertainty_samples=1000(시뮬레이션)과 0(해석적 구간) 예측을 각각 실행합니다. 적합이 같으므로
+yhat은 같고 구간만 달라지며, 이후 시즌 실제 기록의 구간 포함률과 예측 시간을 함께 보고합니다.
+
+사용 예:
+    python -m predict_mlb.interval_benchmark                         # 타자, 기준 시즌별 50명
+    python -m predict_mlb.interval_benchmark --player-type pitcher --limit 100 --horizon 3
+"""
+import argparse
+import logging
+import sys
+import time
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backtest import DEFAULT_HORIZON, DEFAULT_ORIGINS, backtest_jobs, results_to_errors, summarize
+from .config.settings import PREDICT_METRIC_RANGES
+from .data.registry import get_registry
+from .data.schema import get_schema
+from .models.batch_forecaster import ForecastResult, FORECAST_COLUMNS, init_worker_process
+from .models.forecasters import create_forecaster, prophet_analytic_intervals
+
+logger = logging.getLogger(__name__)
+
+# 비교할 구간 계산 방식 → Prophet uncertainty_samples
+INTERVAL_MODES = {'sampled': 1000, 'analytic': 0}
+
+
+def run_interval_benchmark(player_type: str, csv_path: str, origins: Iterable[int],
+                           horizon: int = DEFAULT_HORIZON, limit: Optional[int] = 50,
+                           seed: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Dict[str, float]]]:
+    """
+    선수 유형 하나의 구간 방식별 예측 시간과 포함률을 측정합니다.
+
+    Args:
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
+        csv_path: 원본 CSV 파일 경로
+        origins: 훈련 마지막 시즌 목록
+        horizon: 예측할 미래 기간 (연도 수)
+        limit: 기준 시즌별 최대 선수 수 (None이면 전체)
+        seed: 시뮬레이션 난수 시드
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, Dict[str, Dict[str, float]]]: 예측 오차 테이블,
+            방식/지표별 요약 (MAE, coverage, 평균 구간 폭, 작업당 예측 ms), 방식별 시간
+    """
+    data = get_registry().get(csv_path, get_schema(player_type)).frame
+    metrics = [metric for metric in PREDICT_METRIC_RANGES[player_type] if metric in data.columns]
+    actuals = data[['PlayerID', 'Season'] + metrics].melt(
+        id_vars=['PlayerID', 'Season'], var_name='metric', value_name='actual').dropna(subset=['actual'])
+    actuals = actuals.astype({'PlayerID': 'int64', 'Season': 'int64', 'metric': 'object', 'actual': 'float64'})
+
+    np.random.seed(seed)
+    timings = {mode: {'jobs': 0, 'fit_seconds': 0.0, 'wall_seconds': 0.0} for mode in INTERVAL_MODES}
+    frames = []
+    for origin in origins:
+        results: Dict[str, List[ForecastResult]] = {mode: [] for mode in INTERVAL_MODES}
+        for job in backtest_jobs(data, metrics, origin, horizon, 'prophet', limit=limit):
+            try:
+                model = create_forecaster('prophet', uncertainty_samples=0)
+                model.fit(job.training_frame())
+            except Exception as e:
+                logger.warning(f"{job.player_name} {job.metric} 적합 실패: {e}")
+                continue
+            future = model.make_future_dataframe(periods=job.periods, freq='Y')
+            for mode, samples in INTERVAL_MODES.items():
+                model.uncertainty_samples = samples
+                start = time.perf_counter()
+                forecast = model.predict(future)
+                if samples == 0:
+                    forecast = prophet_analytic_intervals(model, forecast)
+                elapsed = time.perf_counter() - start
+                # 'fit_seconds' 자리에 예측 시간을 기록 (summarize()의 작업당 시간 컬럼으로 집계)
+                timings[mode]['jobs'] += 1
+                timings[mode]['fit_seconds'] += elapsed
+                results[mode].append(ForecastResult(replace(job, backend=mode), forecast[FORECAST_COLUMNS],
+                                                    fit_seconds=elapsed))
+        for mode, mode_results in results.items():
+            frames.append(results_to_errors(mode_results, origin, actuals))
+        logger.info(f"{player_type} {origin}: {len(results['sampled'])}개 작업")
+
+    errors = pd.concat(frames, ignore_index=True)
+    summary = summarize(errors, timings).rename(columns={'backend': 'intervals', 'fit_ms_per_job': 'predict_ms_per_job'})
+    widths = errors.assign(width=errors['yhat_upper'] - errors['yhat_lower']).groupby(['backend', 'metric'])['width'].mean()
+    summary['mean_width'] = [widths[(mode, metric)] for mode, metric in zip(summary['intervals'], summary['metric'])]
+    return errors, summary, timings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+
+    parser = argparse.ArgumentParser(description="Prophet 예측 구간 방식 비교 (시뮬레이션 vs 해석적)")
+    parser.add_argument("--player-type", choices=["batter", "pitcher"], default="batter")
+    parser.add_argument("--origins", nargs="+", type=int, default=list(DEFAULT_ORIGINS), help="훈련 마지막 시즌 목록")
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON, help="예측할 미래 기간 (연도 수)")
+    parser.add_argument("--limit", type=int, default=50, help="기준 시즌별 최대 선수 수")
+    parser.add_argument("--seed", type=int, default=0, help="시뮬레이션 난수 시드")
+    args = parser.parse_args(argv)
+
+    # 작업 프로세스와 같은 조건 (네이티브 스레드 1개, cmdstanpy 로그 정리)
+    init_worker_process()
+    csv_path = BATTER_STATS_FILE if args.player_type == "batter" else PITCHER_STATS_FILE
+    _, summary, timings = run_interval_benchmark(args.player_type, csv_path, args.origins, args.horizon,
+                                                 args.limit, args.seed)
+    with pd.option_context("display.width", 140, "display.max_columns", None):
+        print(summary.round(4).to_string(index=False))
+    for mode, timing in timings.items():
+        print(f"{mode}: {timing['jobs']}개 예측, 작업당 {1000 * timing['fit_seconds'] / max(timing['jobs'], 1):.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,484 @@
+"""
+일괄 예측 모듈: 여러 (선수, 지표, 기간) 예측 작업을 프로세스 풀에 나눠 실행합니다.
+
+감쇠 추세 백엔드('damped') 작업은 프로세스 풀을 거치지 않고 호출 스레드에서 한 번의 2차원
+배열 적합으로 모두 처리합니다. Prophet 훈련은 CPU를 오래 쓰는 작업이라 스레드로는 병렬화되지 않으므로, spawn 방식의
+프로세스 풀에서 실행합니다. 작업에는 선수 프레임 대신 (시즌, 값) 배열만 담아 전달 비용을
+줄이고, 결과는 끝나는 순서대로 돌려줍니다. 작업 프로세스 수를 제한하고 BLAS/OpenMP/Stan
+스레드를 1개로 고정해서 프로세스 수 × 스레드 수만큼 코어를 과점유하지 않게 합니다.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from ..config.settings import FALLBACK_BACKEND, FORECAST_BACKEND, FORECAST_MAX_WORKERS
+from ..utils.lazy_import import lazy_import
+from ..utils.single_flight import get_single_flight
+from .forecasters import create_forecaster, forecast_series_batch, forecaster_params, predict_forecast
+from .model_registry import get_model_registry
+
+if TYPE_CHECKING:
+    from ..services.compute_worker import ComputeService
+    from .forecast_cache import ForecastCache
+
+logger = logging.getLogger(__name__)
+
+prophet = lazy_import("prophet")
+
+# 작업 프로세스의 네이티브 스레드 수 제한 (과점유 방지)
+THREAD_LIMIT_ENV_VARS = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "STAN_NUM_THREADS",
+]
+
+# 결과로 돌려받는 예측 컬럼 (모델 객체와 구성 요소 컬럼은 작업 프로세스에 남김)
+FORECAST_COLUMNS = ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+
+
+@dataclass(frozen=True)
+class ForecastJob:
+    """예측 작업 하나 (프로세스 간 전달용으로 배열만 보관)"""
+    player_name: str
+    metric: str
+    seasons: Tuple[int, ...]
+    values: Tuple[float, ...]
+    periods: int = 5
+    player_id: Optional[int] = None
+    backend: str = FORECAST_BACKEND
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """결과 조회 키 (선수 이름, 지표)"""
+        return (self.player_name, self.metric)
+
+    def training_frame(self) -> pd.DataFrame:
+        """
+        Prophet 훈련용 데이터프레임을 만듭니다.
+
+        Returns:
+            pd.DataFrame: 'ds'(연도 시작일), 'y' 컬럼 데이터프레임
+        """
+        return pd.DataFrame({
+            'ds': pd.to_datetime([str(season) for season in self.seasons], format='%Y'),
+            'y': list(self.values),
+        })
+
+
+@dataclass
+class ForecastResult:
+    """예측 작업 결과"""
+    job: ForecastJob
+    forecast: Optional[pd.DataFrame] = None
+    error: Optional[str] = None
+    fit_seconds: float = 0.0
+    # 결과 출처 ('fit': 훈련, 'cache': 예측 캐시, 'store': 일괄 예측 저장소, 'shared': 다른 세션의 같은 작업,
+    # 'fallback': 응답 시간 예산을 넘겨 빠른 백엔드로 대신 계산)
+    source: str = "fit"
+
+    @property
+    def ok(self) -> bool:
+        """예측 성공 여부"""
+        return self.error is None
+
+
+def make_jobs(player_data: pd.DataFrame, metrics: Iterable[str], periods: int = 5,
+              backend: Optional[str] = None) -> List[ForecastJob]:
+    """
+    선수 데이터에서 지표별 예측 작업을 만듭니다.
+
+    Args:
+        player_data: 한 선수의 시즌별 데이터 (Season, PlayerName 컬럼 필요)
+        metrics: 예측할 지표 목록 (데이터에 없는 지표는 건너뜀)
+        periods: 예측할 미래 기간 (연도 수)
+        backend: 예측 모델 백엔드 (None이면 설정의 FORECAST_BACKEND)
+
+    Returns:
+        List[ForecastJob]: 예측 작업 목록
+    """
+    player_data = player_data.sort_values('Season')
+    player_name = str(player_data['PlayerName'].iloc[0])
+    player_id = int(player_data['PlayerID'].iloc[0]) if 'PlayerID' in player_data.columns else None
+    seasons = tuple(int(season) for season in player_data['Season'])
+    backend = backend or FORECAST_BACKEND
+    return [
+        ForecastJob(player_name, metric, seasons, tuple(float(v) for v in player_data[metric]), periods, player_id,
+                    backend)
+        for metric in metrics if metric in player_data.columns
+    ]
+
+
+def limit_native_threads() -> None:
+    """네이티브 라이브러리 스레드 수를 1로 제한합니다. (이미 지정된 값은 유지)"""
+    for var in THREAD_LIMIT_ENV_VARS:
+        os.environ.setdefault(var, "1")
+
+
+def init_worker_process() -> None:
+    """작업 프로세스 초기화: 스레드 제한, 로그 정리, Prophet 미리 로드"""
+    limit_native_threads()
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    logging.getLogger("prophet").setLevel(logging.WARNING)
+    # 첫 작업이 import 비용을 떠안지 않도록 미리 로드
+    prophet.Prophet
+
+
+def run_job(job: ForecastJob, use_registry: bool = True) -> ForecastResult:
+    """
+    예측 작업 하나를 실행합니다. (작업 프로세스 또는 호출 스레드에서 실행)
+
+    예측 페이지(PredictionModel)와 같은 생성 인자로 모델 저장소를 거치므로, 같은 학습 데이터로
+    적합해 둔 모델이 있으면 다시 적합하지 않고 불러와 예측만 합니다.
+
+    Args:
+        job: 예측 작업
+        use_registry: False면 모델 저장소를 거치지 않고 항상 적합 (예열용)
+
+    Returns:
+        ForecastResult: 예측 결과 (실패 시 error에 메시지)
+    """
+    start = time.perf_counter()
+    try:
+        params = forecaster_params(job.backend)
+        if use_registry:
+            model = get_model_registry().get_or_fit(
+                job.backend, job.training_frame(), lambda: create_forecaster(job.backend, **params),
+                metric=job.metric, player_id=job.player_id, params=params,
+            )
+        else:
+            model = create_forecaster(job.backend, **params)
+            model.fit(job.training_frame())
+        future = model.make_future_dataframe(periods=job.periods, freq='Y')
+        forecast = predict_forecast(model, future)[FORECAST_COLUMNS]
+        return ForecastResult(job, forecast, fit_seconds=time.perf_counter() - start)
+    except Exception as e:
+        return ForecastResult(job, error=str(e), fit_seconds=time.perf_counter() - start)
+
+
+def run_vectorized_jobs(jobs: List[ForecastJob]) -> List[ForecastResult]:
+    """
+    감쇠 추세 작업들을 한 번의 배열 적합으로 실행합니다. (호출 스레드에서 실행)
+
+    Args:
+        jobs: 'damped' 백엔드 예측 작업 목록
+
+    Returns:
+        List[ForecastResult]: 작업 순서대로의 예측 결과 (관측이 2개 미만인 작업은 실패)
+    """
+    results: List[Optional[ForecastResult]] = [None] * len(jobs)
+    # 기간이 같은 작업끼리 묶어 적합 (결측값은 빼고 시즌/값 배열만 전달)
+    groups: Dict[int, List[Tuple[int, Tuple[int, ...], Tuple[float, ...]]]] = {}
+    for index, job in enumerate(jobs):
+        pairs = [(season, value) for season, value in zip(job.seasons, job.values) if value == value]
+        if len(pairs) < 2:
+            results[index] = ForecastResult(job, error="Dataframe has less than 2 non-NaN rows.")
+            continue
+        seasons, values = zip(*pairs)
+        groups.setdefault(job.periods, []).append((index, seasons, values))
+
+    for periods, members in groups.items():
+        start = time.perf_counter()
+        try:
+            forecasts = forecast_series_batch([values for _, _, values in members],
+                                              [seasons for _, seasons, _ in members], periods)
+        except Exception as e:
+            for index, _, _ in members:
+                results[index] = ForecastResult(jobs[index], error=str(e))
+            continue
+        # 적합 시간은 묶음 전체 시간을 작업 수로 나눈 값
+        per_job = (time.perf_counter() - start) / len(members)
+        for (index, _, _), forecast in zip(members, forecasts):
+            results[index] = ForecastResult(jobs[index], forecast, fit_seconds=per_job)
+    return results
+
+
+def run_fallback_jobs(jobs: List[ForecastJob]) -> List[ForecastResult]:
+    """
+    작업들을 빠른 백엔드(FALLBACK_BACKEND)로 대신 실행합니다. (호출 스레드에서 배열 적합)
+
+    Args:
+        jobs: 원래 예측 작업 목록
+
+    Returns:
+        List[ForecastResult]: 원래 작업을 담은 source='fallback' 결과 (캐시에 저장하지 않음)
+    """
+    fallback = run_vectorized_jobs([replace(job, backend=FALLBACK_BACKEND) for job in jobs])
+    return [ForecastResult(job, result.forecast, result.error, result.fit_seconds, source="fallback")
+            for job, result in zip(jobs, fallback)]
+
+
+def default_max_workers() -> int:
+    """
+    기본 작업 프로세스 수를 반환합니다.
+
+    Returns:
+        int: 설정값, 설정이 없으면 사용 가능한 코어 수 (최대 4)
+    """
+    if FORECAST_MAX_WORKERS > 0:
+        return FORECAST_MAX_WORKERS
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, 4))
+
+
+class BatchForecaster:
+    """프로세스 풀 기반 일괄 예측 클래스"""
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context: str = "spawn",
+                 service: Optional["ComputeService"] = None,
+                 service_factory: Optional[Callable[[], "ComputeService"]] = None):
+        """
+        BatchForecaster 클래스 초기화
+
+        Args:
+            max_workers: 작업 프로세스 수 (None이면 default_max_workers(), 1이면 호출 스레드에서 실행)
+            mp_context: multiprocessing 시작 방식 (Streamlit 스레드에서 fork는 안전하지 않으므로 spawn)
+            service: 계산 작업자 서비스 (있으면 프로세스 풀 대신 서비스에 대화형 우선순위로 제출하고,
+                작업 수와 관계없이 호출 프로세스에서는 훈련하지 않음)
+            service_factory: 계산 작업자 서비스를 만드는 함수 (감쇠 추세가 아닌 작업이 처음 남았을 때만
+                호출하므로, 감쇠 추세 요청만 들어오면 작업자 프로세스를 시작하지 않음)
+        """
+        self.max_workers = max_workers or default_max_workers()
+        self.mp_context = mp_context
+        self.service = service
+        self.service_factory = service_factory
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀을 반환합니다. (처음 사용할 때 생성)"""
+        with self._lock:
+            if self._executor is None:
+                # spawn된 자식은 부모 환경변수를 물려받아 numpy import 전에 스레드 수가 정해짐
+                limit_native_threads()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.mp_context),
+                    initializer=init_worker_process,
+                )
+                logger.info(f"예측 프로세스 풀 시작 ({self.max_workers}개 작업 프로세스)")
+            return self._executor
+
+    def _get_service(self) -> Optional["ComputeService"]:
+        """계산 작업자 서비스를 반환합니다. (팩토리가 있으면 처음 사용할 때 생성)"""
+        with self._lock:
+            if self.service is None and self.service_factory is not None:
+                self.service = self.service_factory()
+            return self.service
+
+    def iter_results(self, jobs: List[ForecastJob],
+                     cache: Optional["ForecastCache"] = None) -> Iterator[ForecastResult]:
+        """
+        작업들을 실행하고 끝나는 순서대로 결과를 돌려줍니다.
+
+        Args:
+            jobs: 예측 작업 목록
+            cache: 예측 캐시 (있으면 캐시된 작업은 바로 돌려주고 새 결과는 저장, 다른 세션에서
+                진행 중인 같은 작업은 다시 훈련하지 않고 그 결과를 기다림)
+
+        Returns:
+            Iterator[ForecastResult]: 완료 순서대로의 예측 결과
+        """
+        if cache is not None:
+            yield from self._iter_cached(jobs, cache)
+            return
+
+        if not jobs:
+            return
+        # 감쇠 추세 작업은 프로세스 풀 없이 한 번에 적합
+        vectorized = [job for job in jobs if job.backend == "damped"]
+        if vectorized:
+            yield from run_vectorized_jobs(vectorized)
+            jobs = [job for job in jobs if job.backend != "damped"]
+            if not jobs:
+                return
+        service = self._get_service()
+        if service is not None:
+            # 반복이 중간에 멈추면(세션 이동/재실행) 서비스가 남은 작업을 취소
+            from ..services.compute_worker import INTERACTIVE
+            yield from service.iter_results(jobs, INTERACTIVE)
+            return
+        if self.max_workers <= 1 or len(jobs) == 1:
+            for job in jobs:
+                yield run_job(job)
+            return
+
+        try:
+            executor = self._get_executor()
+            futures: Dict[Future, ForecastJob] = {executor.submit(run_job, job): job for job in jobs}
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            logger.warning(f"프로세스 풀을 사용할 수 없어 순차 실행합니다: {e}")
+            self.shutdown()
+            for job in jobs:
+                yield run_job(job)
+            return
+
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                # 작업 프로세스가 죽은 경우 풀을 버리고 해당 작업은 호출 스레드에서 다시 실행
+                logger.warning(f"예측 작업 프로세스 오류, 순차 실행으로 대체: {e}")
+                self.shutdown()
+                yield run_job(job)
+
+    def _iter_cached(self, jobs: List[ForecastJob], cache: "ForecastCache") -> Iterator[ForecastResult]:
+        """
+        캐시와 단일 실행 계층을 거쳐 작업들을 실행합니다.
+
+        Args:
+            jobs: 예측 작업 목록
+            cache: 예측 캐시
+
+        Returns:
+            Iterator[ForecastResult]: 캐시 적중, 직접 훈련, 공유 결과 순서의 예측 결과
+        """
+        flights = get_single_flight("forecast_job")
+        pending, owned, waiting = [], {}, []
+        for job in jobs:
+            cached = cache.get_job(job)
+            if cached is not None:
+                yield cached
+                continue
+            key = cache.job_key(job)
+            flight, leader = flights.begin(key)
+            if leader:
+                owned[job] = (key, flight)
+                pending.append(job)
+            else:
+                waiting.append((job, flight))
+
+        try:
+            with closing(self.iter_results(pending)) as results:
+                for result in results:
+                    cache.put_job(result)
+                    key, flight = owned.pop(result.job)
+                    flights.finish(key, flight, result)
+                    yield result
+        finally:
+            # 중간에 중단되면 대기 중인 다른 세션이 멈추지 않도록 실패로 알림
+            for key, flight in owned.values():
+                flights.finish(key, flight, error=RuntimeError("예측 작업이 취소되었습니다."))
+
+        for job, flight in waiting:
+            try:
+                shared = flight.wait()
+            except Exception as e:
+                yield ForecastResult(job, error=str(e), source="shared")
+                continue
+            yield ForecastResult(job, shared.forecast, shared.error, shared.fit_seconds, source="shared")
+
+    def iter_results_within(self, jobs: List[ForecastJob], latency_budget: float,
+                            cache: Optional["ForecastCache"] = None) -> Iterator[ForecastResult]:
+        """
+        응답 시간 예산 안에 끝난 결과를 돌려주고, 예산을 넘긴 작업은 빠른 백엔드 예측으로 대신합니다.
+
+        작업은 별도 스레드에서 iter_results()로 끝까지 실행되므로, 예산을 넘긴 훈련도 계속 진행되어
+        캐시를 채우고 다음 요청에서는 캐시 적중으로 바로 돌아옵니다. 예산 안에 반복을 멈추면
+        (세션 이동) 다음 결과가 나올 때 남은 작업을 취소합니다.
+
+        Args:
+            jobs: 예측 작업 목록
+            latency_budget: 응답 시간 예산 (초)
+            cache: 예측 캐시 (iter_results()와 같음)
+
+        Returns:
+            Iterator[ForecastResult]: 예산 안에 끝난 결과, 이어서 나머지 작업의 source='fallback' 결과
+        """
+        if not jobs:
+            return
+        deadline = time.monotonic() + latency_budget
+        results: "queue.Queue[Optional[ForecastResult]]" = queue.Queue()
+        abandoned = threading.Event()
+
+        def drain() -> None:
+            source = self.iter_results(jobs, cache)
+            try:
+                for result in source:
+                    results.put(result)
+                    if abandoned.is_set():
+                        break
+            except Exception as e:
+                logger.warning(f"예측 작업 실행 실패: {e}")
+            finally:
+                source.close()
+                results.put(None)
+
+        threading.Thread(target=drain, name="forecast-drain", daemon=True).start()
+        pending = list(jobs)
+        try:
+            while pending:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    result = results.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if result is None:
+                    break
+                if result.job in pending:
+                    pending.remove(result.job)
+                yield result
+        except GeneratorExit:
+            abandoned.set()
+            raise
+
+        if pending:
+            logger.info(f"응답 시간 예산({latency_budget:g}초) 초과, {len(pending)}개 작업을 {FALLBACK_BACKEND}로 대신 예측")
+            yield from run_fallback_jobs(pending)
+
+    def run(self, jobs: List[ForecastJob]) -> Dict[Tuple[str, str], ForecastResult]:
+        """
+        작업들을 모두 실행합니다.
+
+        Args:
+            jobs: 예측 작업 목록
+
+        Returns:
+            Dict[Tuple[str, str], ForecastResult]: (선수 이름, 지표) → 예측 결과
+        """
+        return {result.job.key: result for result in self.iter_results(jobs)}
+
+    def shutdown(self) -> None:
+        """프로세스 풀을 종료합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_forecaster: Optional[BatchForecaster] = None
+_forecaster_lock = threading.Lock()
+
+
+def get_batch_forecaster() -> BatchForecaster:
+    """
+    프로세스 전역 일괄 예측기를 반환합니다. (세션들이 같은 프로세스 풀을 공유)
+
+    Returns:
+        BatchForecaster: 일괄 예측기 싱글톤
+    """
+    global _forecaster
+    with _forecaster_lock:
+        if _forecaster is None:
+            _forecaster = BatchForecaster()
+            atexit.register(_forecaster.shutdown)
+        return _forecaster
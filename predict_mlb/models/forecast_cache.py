@@ -0,0 +1,303 @@
+"""
+예측 캐시 모듈: 예측 결과를 내용 기반 키로 보관하는 2단계(메모리 LRU + 디스크) 캐시를 제공합니다.
+
+키는 (PlayerID, 지표, 예측 기간, 예측 백엔드, 해당 지표의 시즌/값 해시, 모델 설정)으로 만들어서, 선수의
+기록이 실제로 바뀐 경우에만 새 키가 됩니다. 모델 객체 대신 예측 프레임('ds', 'yhat',
+'yhat_lower', 'yhat_upper')만 보관하므로 항목이 작고, 디스크 계층은 서버를 다시 시작해도
+유지됩니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from ..config.settings import FORECAST_CACHE_DIR, FORECAST_CACHE_MAX_DISK_MB, FORECAST_CACHE_MAX_ENTRIES, PROPHET_INTERVALS
+from ..data.columnar_cache import PYARROW_AVAILABLE
+from .batch_forecaster import ForecastJob, ForecastResult
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키 형식이나 일괄 예측 모델 설정이 바뀌면 올려서 기존 항목을 무효화합니다.
+CACHE_KEY_VERSION = 3
+
+# 디스크 용량 검사 주기 (저장 횟수)
+_PRUNE_INTERVAL = 50
+
+
+def model_config(backend: str = "prophet", **params: Any) -> Dict[str, Any]:
+    """
+    캐시 키에 포함할 모델 설정을 반환합니다. (라이브러리 버전이 바뀌면 키도 바뀜)
+
+    Args:
+        backend: 예측 모델 종류
+        **params: 모델 파라미터
+
+    Returns:
+        Dict[str, Any]: 모델 설정
+    """
+    try:
+        backend_version = version(backend)
+    except PackageNotFoundError:
+        backend_version = None
+    return {"backend": backend, "version": backend_version, "params": params}
+
+
+def forecast_cache_key(job: ForecastJob, config: Dict[str, Any]) -> str:
+    """
+    예측 작업의 캐시 키를 만듭니다.
+
+    Args:
+        job: 예측 작업 (지표의 시즌/값 포함)
+        config: 모델 설정
+
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    payload = json.dumps({
+        "v": CACHE_KEY_VERSION,
+        "player_id": job.player_id,
+        "player_name": job.player_name,
+        "metric": job.metric,
+        "periods": job.periods,
+        "backend": job.backend,
+        "seasons": list(job.seasons),
+        "values": [repr(value) for value in job.values],
+        "config": config,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ForecastCache:
+    """메모리 LRU + 디스크 2단계 예측 캐시 클래스"""
+
+    def __init__(self, max_entries: int = 256, disk_dir: Optional[str] = None,
+                 max_disk_mb: Optional[float] = None, config: Optional[Dict[str, Any]] = None):
+        """
+        ForecastCache 클래스 초기화
+
+        Args:
+            max_entries: 메모리에 보관할 최대 항목 수
+            disk_dir: 디스크 계층 디렉토리 (None이면 메모리만 사용)
+            max_disk_mb: 디스크 계층 최대 용량 (MB, None이면 제한 없음)
+            config: 작업 키에 포함할 모델 설정 (None이면 기본 Prophet 설정)
+        """
+        self.config = config if config is not None else model_config("prophet", freq="Y", intervals=PROPHET_INTERVALS)
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_mb = max_disk_mb
+        self._memory: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0}
+
+    def _disk_path(self, key: str) -> str:
+        """키에 해당하는 디스크 파일 경로 (앞 2글자로 하위 디렉토리 분산)"""
+        suffix = ".parquet" if PYARROW_AVAILABLE else ".pkl"
+        return os.path.join(self.disk_dir, key[:2], key + suffix)
+
+    def _remember(self, key: str, forecast: pd.DataFrame) -> None:
+        """메모리 계층에 넣고 한도를 넘으면 가장 오래 쓰지 않은 항목을 내보냅니다. (잠금 상태에서 호출)"""
+        self._memory[key] = forecast
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        캐시된 예측을 조회합니다. 디스크에서 찾은 항목은 메모리로 올립니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[pd.DataFrame]: 예측 프레임 (호출자가 변경하지 않아야 함), 없으면 None
+        """
+        with self._lock:
+            forecast = self._memory.get(key)
+            if forecast is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return forecast
+
+        forecast = self._read_disk(key)
+        with self._lock:
+            if forecast is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, forecast)
+            return forecast
+
+    def put(self, key: str, forecast: pd.DataFrame) -> None:
+        """
+        예측을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            forecast: 예측 프레임
+        """
+        with self._lock:
+            self._remember(key, forecast)
+            self._puts += 1
+            prune = self.max_disk_mb is not None and self._puts % _PRUNE_INTERVAL == 0
+        self._write_disk(key, forecast)
+        if prune:
+            self.prune_disk()
+
+    def job_key(self, job: ForecastJob) -> str:
+        """
+        예측 작업의 캐시 키를 반환합니다.
+
+        Args:
+            job: 예측 작업
+
+        Returns:
+            str: 캐시 키
+        """
+        return forecast_cache_key(job, self.config)
+
+    def get_job(self, job: ForecastJob) -> Optional[ForecastResult]:
+        """
+        예측 작업의 캐시된 결과를 조회합니다.
+
+        Args:
+            job: 예측 작업
+
+        Returns:
+            Optional[ForecastResult]: 캐시된 예측 결과, 없으면 None
+        """
+        forecast = self.get(self.job_key(job))
+        if forecast is None:
+            return None
+        return ForecastResult(job, forecast, source="cache")
+
+    def put_job(self, result: ForecastResult) -> None:
+        """
+        성공한 예측 결과를 작업 키로 저장합니다.
+
+        Args:
+            result: 예측 결과
+        """
+        if result.ok:
+            self.put(self.job_key(result.job), result.forecast)
+
+    def _read_disk(self, key: str) -> Optional[pd.DataFrame]:
+        """디스크 계층에서 항목을 읽습니다."""
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            if path.endswith(".parquet"):
+                return pd.read_parquet(path)
+            return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"예측 캐시 파일 읽기 실패 ({path}): {e}")
+            return None
+
+    def _write_disk(self, key: str, forecast: pd.DataFrame) -> None:
+        """디스크 계층에 항목을 원자적으로 저장합니다. (실패해도 메모리 캐시는 유지)"""
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if path.endswith(".parquet"):
+                forecast.to_parquet(tmp_path, index=False)
+            else:
+                forecast.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"예측 캐시 파일 저장 실패 ({path}): {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def prune_disk(self) -> int:
+        """
+        디스크 계층이 최대 용량을 넘으면 오래된 파일부터 지웁니다.
+
+        Returns:
+            int: 지운 파일 수
+        """
+        if self.disk_dir is None or self.max_disk_mb is None or not os.path.isdir(self.disk_dir):
+            return 0
+        files = []
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        limit = self.max_disk_mb * 1024 * 1024
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        with self._lock:
+            self._stats["disk_evictions"] += removed
+        return removed
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        캐시를 비웁니다.
+
+        Args:
+            disk: 디스크 계층도 비울지 여부
+        """
+        with self._lock:
+            self._memory.clear()
+        if disk and self.disk_dir is not None and os.path.isdir(self.disk_dir):
+            for root, _, names in os.walk(self.disk_dir):
+                for name in names:
+                    os.remove(os.path.join(root, name))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 적중(메모리/디스크), 미스, 내보낸 항목 수, 현재 메모리 항목 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+            stats["entries"] = len(self._memory)
+        return stats
+
+
+_cache: Optional[ForecastCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_forecast_cache() -> ForecastCache:
+    """
+    프로세스 전역 예측 캐시를 반환합니다.
+
+    Returns:
+        ForecastCache: 예측 캐시 싱글톤
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ForecastCache(FORECAST_CACHE_MAX_ENTRIES, FORECAST_CACHE_DIR or None, FORECAST_CACHE_MAX_DISK_MB)
+        return _cache
@@ -0,0 +1,271 @@
+"""
+예측 저장소 모듈: 일괄 예측 결과를 컬럼형 테이블로 저장하고 조회합니다.
+
+`python -m predict_mlb.forecast_all`이 리그 전체 선수의 예측을 미리 계산해 두면, 예측 페이지와
+PredictionModel은 (데이터 버전, 예측 백엔드, PlayerID, 지표)로 이 테이블을 먼저 조회하고, 없을 때만
+모델을 실시간으로 훈련합니다. 데이터가 갱신되면 데이터 버전이 달라지므로 이전 예측은
+조회되지 않습니다.
+
+레이아웃 (CSV 파일 옆 forecasts 디렉토리):
+    data/forecasts/<CSV 파일명>.parquet
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from ..data.columnar_cache import PYARROW_AVAILABLE
+from ..config.settings import FORECAST_BACKEND
+from .batch_forecaster import FORECAST_COLUMNS, ForecastJob, ForecastResult
+
+logger = logging.getLogger(__name__)
+
+FORECASTS_DIRNAME = "forecasts"
+
+# 테이블 키와 컬럼
+KEY_COLUMNS = ['data_version', 'backend', 'PlayerID', 'metric']
+TABLE_COLUMNS = KEY_COLUMNS + ['PlayerName', 'Season', 'is_future', 'periods'] + FORECAST_COLUMNS + ['created_at']
+
+
+def get_forecast_path(csv_path: str) -> str:
+    """
+    CSV 파일에 대응하는 예측 테이블 경로를 반환합니다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+
+    Returns:
+        str: 예측 테이블 경로 (pyarrow가 없으면 .csv)
+    """
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    suffix = ".parquet" if PYARROW_AVAILABLE else ".csv"
+    return os.path.join(os.path.dirname(os.path.abspath(csv_path)), FORECASTS_DIRNAME, stem + suffix)
+
+
+def results_to_frame(results: Iterable[ForecastResult], data_version: str) -> pd.DataFrame:
+    """
+    예측 결과들을 테이블 행으로 변환합니다. (실패한 결과는 제외)
+
+    Args:
+        results: 예측 결과 목록
+        data_version: 예측에 사용한 데이터 버전
+
+    Returns:
+        pd.DataFrame: 예측 테이블 형식의 데이터프레임
+    """
+    frames = []
+    created_at = time.time()
+    for result in results:
+        if not result.ok or result.job.player_id is None:
+            continue
+        job = result.job
+        forecast = result.forecast.copy()
+        last_training = pd.Timestamp(year=max(job.seasons), month=1, day=1)
+        forecast['is_future'] = forecast['ds'] > last_training
+        forecast['Season'] = forecast['ds'].dt.year
+        forecast['data_version'] = data_version
+        forecast['backend'] = job.backend
+        forecast['PlayerID'] = job.player_id
+        forecast['PlayerName'] = job.player_name
+        forecast['metric'] = job.metric
+        forecast['periods'] = job.periods
+        forecast['created_at'] = created_at
+        frames.append(forecast[TABLE_COLUMNS])
+    if not frames:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+class ForecastStore:
+    """컬럼형 예측 저장소 클래스"""
+
+    def __init__(self, path: str):
+        """
+        ForecastStore 클래스 초기화
+
+        Args:
+            path: 예측 테이블 파일 경로
+        """
+        self.path = path
+        self._table: Optional[pd.DataFrame] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_csv(cls, csv_path: str) -> 'ForecastStore':
+        """
+        CSV 파일에 대응하는 예측 저장소를 반환합니다.
+
+        Args:
+            csv_path: 원본 CSV 파일 경로
+
+        Returns:
+            ForecastStore: 예측 저장소
+        """
+        return cls(get_forecast_path(csv_path))
+
+    def exists(self) -> bool:
+        """예측 테이블 파일이 있는지 확인합니다."""
+        return os.path.exists(self.path)
+
+    def _read_rows(self) -> pd.DataFrame:
+        """예측 테이블 파일을 행 형식 그대로 읽습니다."""
+        if self.path.endswith(".parquet"):
+            table = pd.read_parquet(self.path)
+        else:
+            table = pd.read_csv(self.path, parse_dates=['ds'])
+        # 백엔드 컬럼이 없는 이전 테이블은 Prophet 예측
+        if 'backend' not in table.columns:
+            table['backend'] = 'prophet'
+        return table
+
+    def _read(self) -> pd.DataFrame:
+        """예측 테이블 파일을 읽습니다."""
+        # (데이터 버전, 백엔드, PlayerID, 지표) 정렬 인덱스로 조회
+        return self._read_rows().set_index(KEY_COLUMNS).sort_index()
+
+    def _get_table(self) -> Optional[pd.DataFrame]:
+        """메모리에 올린 예측 테이블을 반환합니다. 파일이 바뀐 경우에만 다시 읽습니다."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._signature != signature:
+            with self._lock:
+                if self._signature != signature:
+                    self._table = self._read()
+                    self._signature = signature
+                    logger.info(f"예측 테이블 로드: {self.path} ({len(self._table)}개 행)")
+        return self._table
+
+    def lookup(self, player_id: int, metric: str, data_version: str,
+               periods: int = 5, backend: str = FORECAST_BACKEND) -> Optional[pd.DataFrame]:
+        """
+        저장된 예측을 조회합니다.
+
+        Args:
+            player_id: 선수 ID
+            metric: 지표
+            data_version: 현재 데이터 버전 (다르면 조회되지 않음)
+            periods: 필요한 미래 기간 (저장된 기간보다 길면 조회되지 않음)
+            backend: 예측 모델 백엔드
+
+        Returns:
+            Optional[pd.DataFrame]: 'ds', 'yhat', 'yhat_lower', 'yhat_upper' 예측, 없으면 None
+        """
+        table = self._get_table()
+        if table is None:
+            return None
+        try:
+            rows = table.loc[(data_version, backend, int(player_id), metric)]
+        except KeyError:
+            return None
+        if rows.empty or int(rows['periods'].iloc[0]) < periods:
+            return None
+        # 학습 구간 전체와 요청한 기간만큼의 미래 예측
+        keep = ~rows['is_future'] | (rows['is_future'].cumsum() <= periods)
+        return rows.loc[keep, FORECAST_COLUMNS].reset_index(drop=True)
+
+    def lookup_job(self, job: ForecastJob, data_version: str) -> Optional[ForecastResult]:
+        """
+        예측 작업에 해당하는 저장된 결과를 조회합니다.
+
+        Args:
+            job: 예측 작업
+            data_version: 현재 데이터 버전
+
+        Returns:
+            Optional[ForecastResult]: 저장된 예측 결과, 없으면 None
+        """
+        if job.player_id is None:
+            return None
+        forecast = self.lookup(job.player_id, job.metric, data_version, job.periods, job.backend)
+        if forecast is None:
+            return None
+        return ForecastResult(job, forecast, source="store")
+
+    def write(self, table: pd.DataFrame) -> None:
+        """
+        예측 테이블 전체를 원자적으로 저장합니다.
+
+        Args:
+            table: results_to_frame() 형식의 데이터프레임
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            if self.path.endswith(".parquet"):
+                table.to_parquet(tmp_path, index=False)
+            else:
+                table.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        logger.info(f"예측 테이블 저장: {self.path} ({len(table)}개 행)")
+
+    def merge(self, rows: pd.DataFrame) -> None:
+        """
+        새 예측 행을 기존 테이블에 병합해 저장합니다.
+
+        같은 (데이터 버전, 백엔드, PlayerID, 지표) 키의 기존 행만 새 행으로 교체하고,
+        다른 백엔드나 데이터 버전, 이번에 예측하지 않은 선수의 행은 그대로 둡니다.
+
+        Args:
+            rows: results_to_frame() 형식의 새 예측 행
+        """
+        if rows.empty:
+            return
+        if self.exists():
+            existing = self._read_rows()
+            replaced = pd.MultiIndex.from_frame(existing[KEY_COLUMNS]).isin(
+                pd.MultiIndex.from_frame(rows[KEY_COLUMNS]))
+            kept = existing.loc[~replaced, TABLE_COLUMNS]
+            if not kept.empty:
+                rows = pd.concat([kept, rows], ignore_index=True)
+        self.write(rows)
+
+    def summary(self) -> Dict[str, object]:
+        """
+        저장된 예측 요약을 반환합니다.
+
+        Returns:
+            Dict[str, object]: 행 수, 선수 수, 지표 목록, 데이터 버전 목록, 백엔드 목록
+        """
+        table = self._get_table()
+        if table is None:
+            return {"rows": 0, "players": 0, "metrics": [], "data_versions": [], "backends": []}
+        keys = table.index.to_frame(index=False)
+        return {
+            "rows": len(table),
+            "players": int(keys['PlayerID'].nunique()),
+            "metrics": sorted(keys['metric'].unique()),
+            "data_versions": sorted(keys['data_version'].unique()),
+            "backends": sorted(keys['backend'].unique()),
+        }
+
+
+_stores: Dict[str, ForecastStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_forecast_store(csv_path: str) -> ForecastStore:
+    """
+    CSV 파일에 대응하는 프로세스 공유 예측 저장소를 반환합니다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+
+    Returns:
+        ForecastStore: 예측 저장소 (파일이 없어도 반환, 조회 시 None)
+    """
+    path = get_forecast_path(csv_path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = ForecastStore(path)
+        return store
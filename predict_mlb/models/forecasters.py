@@ -0,0 +1,446 @@
+"""
+예측기 모듈: 교체 가능한 예측 모델 백엔드를 제공합니다.
+
+- 'prophet': Prophet (Stan 최적화, 선수·지표당 수백 ms)
+- 'damped': 감쇠 추세 Holt 지수평활 (NumPy, 수천 개 시계열을 2차원 배열 한 번으로 적합)
+
+대부분의 선수는 연간 데이터가 20개 미만이라 Prophet 적합 비용에 비해 얻는 것이 적으므로,
+감쇠 추세 모델을 기본 백엔드로 사용할 수 있습니다. DampedTrendForecaster는 Prophet과 같은
+fit / make_future_dataframe / predict 인터페이스를 제공하므로 ModelTrainingStep의
+model_factory나 PredictionModel에서 그대로 바꿔 쓸 수 있습니다.
+
+모델 (ETS(A,Ad,N), 오차 수정 형식):
+    예측:   ŷ_t = l_{t-1} + φ b_{t-1}
+    수준:   l_t = ŷ_t + α e_t
+    추세:   b_t = φ b_{t-1} + β e_t
+    h기 예측: l_T + (φ + φ² + … + φ^h) b_T
+    h기 분산: σ² (1 + Σ_{j=1}^{h-1} (α + β φ (1 - φ^j) / (1 - φ))²)
+
+Prophet 예측 구간 ('analytic' 모드, uncertainty_samples=0):
+    Prophet은 미래 변화점(비율 S, 크기 Laplace(0, λ), λ = mean|δ|)을 넣은 추세 경로와 관측 잡음을
+    1000번 시뮬레이션해 분위수로 구간을 구합니다. 같은 분산을 해석적으로 계산해 정규 근사합니다.
+    분산(t): y_scale² (σ_obs² + (2/3) S λ² (t - T)³₊)   (t, T는 Prophet의 척도화된 시간)
+"""
+import itertools
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PROPHET_INTERVALS
+from ..utils.lazy_import import lazy_import
+
+prophet = lazy_import("prophet")
+
+# 파라미터 격자 (β는 α 이하, φ < 1)
+ALPHA_GRID = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+BETA_RATIOS = (0.0, 0.1, 0.3, 0.5)
+PHI_GRID = (0.8, 0.9, 0.98)
+
+# Prophet 기본 예측 구간과 같은 80% 구간
+DEFAULT_INTERVAL_WIDTH = 0.8
+
+# Prophet 생성 기본 인자 ('analytic' 모드는 시뮬레이션을 끄고 prophet_analytic_intervals()로 구간 계산)
+PROPHET_DEFAULTS: Dict[str, Any] = {'uncertainty_samples': 0} if PROPHET_INTERVALS == 'analytic' else {}
+
+
+def _parameter_grid() -> np.ndarray:
+    """(α, β, φ) 파라미터 격자를 (격자 수 × 3) 배열로 반환합니다."""
+    return np.array([(alpha, alpha * ratio, phi)
+                     for alpha, ratio, phi in itertools.product(ALPHA_GRID, BETA_RATIOS, PHI_GRID)])
+
+
+def _filter(values: np.ndarray, alpha: np.ndarray, beta: np.ndarray, phi: np.ndarray,
+            keep_fitted: bool = False) -> Dict[str, np.ndarray]:
+    """
+    감쇠 추세 필터를 시간 순서로 한 번 실행합니다. 파라미터 배열은 (…, 시계열 수)로 브로드캐스트됩니다.
+
+    NaN은 관측이 없는 시즌(앞쪽 패딩 또는 중간 공백)으로 보고, 상태만 한 단계 진행합니다.
+
+    Args:
+        values: (시계열 수 × 시점 수) 배열
+        alpha: 수준 평활 계수
+        beta: 추세 평활 계수
+        phi: 추세 감쇠 계수
+        keep_fitted: 시점별 1단계 예측값을 보관할지 여부
+
+    Returns:
+        Dict[str, np.ndarray]: sse, n_errors, level, trend (와 fitted)
+    """
+    n_series, n_steps = values.shape
+    shape = np.broadcast_shapes(np.shape(alpha), (n_series,))
+    level = np.zeros(shape)
+    trend = np.zeros(shape)
+    started = np.zeros(n_series, dtype=bool)
+    sse = np.zeros(shape)
+    n_errors = np.zeros(n_series)
+    fitted = np.full(shape + (n_steps,), np.nan) if keep_fitted else None
+
+    for t in range(n_steps):
+        y = values[:, t]
+        observed = ~np.isnan(y)
+        pred = level + phi * trend
+        update = observed & started
+        first = observed & ~started
+
+        error = np.where(update, y - pred, 0.0)
+        sse += error ** 2
+        n_errors += update
+        if keep_fitted:
+            fitted[..., t] = np.where(update, pred, np.where(first, y, np.nan))
+
+        # 관측 없음: 예측대로 진행 / 첫 관측: 수준을 관측값으로 초기화
+        new_level = np.where(started, pred + alpha * error, 0.0)
+        new_trend = np.where(started, phi * trend + beta * error, 0.0)
+        level = np.where(first, y, new_level) if first.any() else new_level
+        trend = new_trend
+        started = started | observed
+
+    result = {"sse": sse, "n_errors": n_errors, "level": level, "trend": trend}
+    if keep_fitted:
+        result["fitted"] = fitted
+    return result
+
+
+@dataclass
+class DampedTrendFit:
+    """감쇠 추세 모델 일괄 적합 결과 (모든 배열의 첫 축은 시계열)"""
+    alpha: np.ndarray
+    beta: np.ndarray
+    phi: np.ndarray
+    sigma: np.ndarray
+    level: np.ndarray
+    trend: np.ndarray
+    fitted: np.ndarray
+
+    def forecast(self, periods: int, interval_width: float = DEFAULT_INTERVAL_WIDTH) -> Dict[str, np.ndarray]:
+        """
+        미래 예측값과 해석적 예측 구간을 계산합니다.
+
+        Args:
+            periods: 예측할 미래 기간
+            interval_width: 예측 구간 폭 (0~1)
+
+        Returns:
+            Dict[str, np.ndarray]: yhat, yhat_lower, yhat_upper - 각각 (시계열 수 × 기간) 배열
+        """
+        steps = np.arange(1, periods + 1)
+        phi = self.phi[:, None]
+        # φ + φ² + … + φ^h
+        damped_sum = phi * (1 - phi ** steps) / (1 - phi)
+        yhat = self.level[:, None] + damped_sum * self.trend[:, None]
+
+        # c_j = α + β φ (1 - φ^j) / (1 - φ), j = 1..h-1
+        c = self.alpha[:, None] + self.beta[:, None] * damped_sum[:, :-1] if periods > 1 else np.zeros((len(phi), 0))
+        variance_factor = 1 + np.concatenate([np.zeros((len(phi), 1)), np.cumsum(c ** 2, axis=1)], axis=1)
+        half_width = _z_score(interval_width) * self.sigma[:, None] * np.sqrt(variance_factor)
+        return {"yhat": yhat, "yhat_lower": yhat - half_width, "yhat_upper": yhat + half_width}
+
+    def fitted_intervals(self, interval_width: float = DEFAULT_INTERVAL_WIDTH) -> Dict[str, np.ndarray]:
+        """
+        학습 구간의 1단계 예측값과 예측 구간을 반환합니다.
+
+        Args:
+            interval_width: 예측 구간 폭 (0~1)
+
+        Returns:
+            Dict[str, np.ndarray]: yhat, yhat_lower, yhat_upper - 각각 (시계열 수 × 시점 수) 배열
+        """
+        half_width = _z_score(interval_width) * self.sigma[:, None]
+        return {"yhat": self.fitted, "yhat_lower": self.fitted - half_width, "yhat_upper": self.fitted + half_width}
+
+
+def _z_score(interval_width: float) -> float:
+    """양측 예측 구간 폭에 해당하는 표준정규 분위수"""
+    return NormalDist().inv_cdf(0.5 + interval_width / 2)
+
+
+def fit_damped_trend(values: np.ndarray) -> DampedTrendFit:
+    """
+    여러 시계열에 감쇠 추세 모델을 한 번에 적합합니다.
+
+    모든 (α, β, φ) 격자 조합을 한 번의 필터로 평가해 시계열별로 1단계 예측 제곱오차 합이
+    가장 작은 조합을 고르고, 선택된 파라미터로 다시 필터를 실행해 상태와 적합값을 얻습니다.
+
+    Args:
+        values: (시계열 수 × 시점 수) 배열, 관측이 없는 시점은 NaN (시계열은 마지막 열에서 끝나도록 정렬)
+
+    Returns:
+        DampedTrendFit: 시계열별 파라미터, 잔차 표준편차, 최종 상태, 적합값
+    """
+    values = np.asarray(values, dtype='float64')
+    grid = _parameter_grid()
+    search = _filter(values, grid[:, 0:1], grid[:, 1:2], grid[:, 2:3])
+    best = np.argmin(search["sse"], axis=0)
+    alpha, beta, phi = grid[best, 0], grid[best, 1], grid[best, 2]
+
+    final = _filter(values, alpha, beta, phi, keep_fitted=True)
+    n_errors = final["n_errors"]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sigma = np.where(n_errors > 0, np.sqrt(final["sse"] / np.maximum(n_errors, 1)), np.nan)
+    return DampedTrendFit(alpha, beta, phi, sigma, final["level"], final["trend"], final["fitted"])
+
+
+def _normalize_freq(freq: str) -> str:
+    """pandas 2.2에서 사용 중단된 연도 빈도 별칭을 바꿉니다."""
+    return {"Y": "YE", "A": "YE"}.get(freq, freq)
+
+
+class DampedTrendForecaster:
+    """Prophet과 같은 인터페이스의 감쇠 추세 예측기 클래스"""
+
+    def __init__(self, interval_width: float = DEFAULT_INTERVAL_WIDTH, **kwargs: Any):
+        """
+        DampedTrendForecaster 클래스 초기화
+
+        Args:
+            interval_width: 예측 구간 폭 (Prophet 기본값과 같은 0.8)
+            **kwargs: Prophet 전용 인자 (호환을 위해 받고 무시)
+        """
+        self.interval_width = interval_width
+        self.history: Optional[pd.DataFrame] = None
+        self.fit_result: Optional[DampedTrendFit] = None
+
+    def fit(self, df: pd.DataFrame) -> 'DampedTrendForecaster':
+        """
+        모델을 적합합니다.
+
+        Args:
+            df: 'ds'(날짜), 'y' 컬럼 데이터프레임 (연 단위)
+
+        Returns:
+            DampedTrendForecaster: 자기 자신
+        """
+        history = df[['ds', 'y']].dropna().sort_values('ds').reset_index(drop=True)
+        history['ds'] = pd.to_datetime(history['ds'])
+        if len(history) < 2:
+            raise ValueError("Dataframe has less than 2 non-NaN rows.")
+        years = history['ds'].dt.year.to_numpy()
+        values = np.full((1, years[-1] - years[0] + 1), np.nan)
+        values[0, years - years[0]] = history['y'].to_numpy(dtype='float64')
+        self.history = history
+        self.fit_result = fit_damped_trend(values)
+        return self
+
+    def to_params(self) -> Dict[str, Any]:
+        """
+        적합된 모델을 JSON으로 저장할 수 있는 파라미터로 변환합니다.
+
+        Returns:
+            Dict[str, Any]: 예측 구간 폭, 학습 데이터, 적합 파라미터와 상태
+        """
+        fit = self.fit_result
+        return {
+            "interval_width": self.interval_width,
+            "history": {
+                "ds": self.history['ds'].dt.strftime('%Y-%m-%d').tolist(),
+                "y": self.history['y'].astype('float64').tolist(),
+            },
+            "fit": {
+                name: np.where(np.isnan(value), None, value).tolist()
+                for name, value in (("alpha", fit.alpha), ("beta", fit.beta), ("phi", fit.phi),
+                                    ("sigma", fit.sigma), ("level", fit.level), ("trend", fit.trend),
+                                    ("fitted", fit.fitted))
+            },
+        }
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> 'DampedTrendForecaster':
+        """
+        to_params()로 저장한 파라미터에서 적합된 모델을 복원합니다. (다시 적합하지 않음)
+
+        Args:
+            params: to_params() 결과
+
+        Returns:
+            DampedTrendForecaster: 적합된 예측기
+        """
+        model = cls(interval_width=params["interval_width"])
+        model.history = pd.DataFrame({
+            'ds': pd.to_datetime(params["history"]["ds"]),
+            'y': np.asarray(params["history"]["y"], dtype='float64'),
+        })
+        fit = {name: np.asarray(value, dtype='float64') for name, value in params["fit"].items()}
+        model.fit_result = DampedTrendFit(**fit)
+        return model
+
+    def make_future_dataframe(self, periods: int, freq: str = 'Y', include_history: bool = True) -> pd.DataFrame:
+        """
+        예측할 날짜 데이터프레임을 만듭니다. (Prophet과 같은 날짜 규칙)
+
+        Args:
+            periods: 미래 기간 수
+            freq: 날짜 빈도
+            include_history: 학습 구간 날짜 포함 여부
+
+        Returns:
+            pd.DataFrame: 'ds' 컬럼 데이터프레임
+        """
+        last_date = self.history['ds'].max()
+        dates = pd.date_range(start=last_date, periods=periods + 1, freq=_normalize_freq(freq))
+        dates = dates[dates > last_date][:periods]
+        if include_history:
+            dates = np.concatenate([self.history['ds'].to_numpy(), dates.to_numpy()])
+        return pd.DataFrame({'ds': pd.to_datetime(dates)})
+
+    def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+        """
+        예측을 수행합니다. 학습 구간 날짜는 1단계 적합값, 이후 날짜는 순서대로 1..h기 예측값입니다.
+
+        Args:
+            future: 'ds' 컬럼 데이터프레임
+
+        Returns:
+            pd.DataFrame: 'ds', 'yhat', 'yhat_lower', 'yhat_upper' 데이터프레임
+        """
+        ds = pd.to_datetime(future['ds']).reset_index(drop=True)
+        last_date = self.history['ds'].max()
+        first_year = int(self.history['ds'].dt.year.min())
+        is_future = (ds > last_date).to_numpy()
+        steps = np.cumsum(is_future)
+
+        output = {name: np.full(len(ds), np.nan) for name in ('yhat', 'yhat_lower', 'yhat_upper')}
+        in_sample = self.fit_result.fitted_intervals(self.interval_width)
+        positions = ds.dt.year.to_numpy() - first_year
+        valid = ~is_future & (positions >= 0) & (positions < self.fit_result.fitted.shape[1])
+        ahead = self.fit_result.forecast(int(steps.max()) if is_future.any() else 0, self.interval_width)
+        for name in output:
+            output[name][valid] = in_sample[name][0, positions[valid]]
+            if is_future.any():
+                output[name][is_future] = ahead[name][0, steps[is_future] - 1]
+        return pd.DataFrame({'ds': ds, **output})
+
+
+def forecast_series_batch(series: Sequence[Sequence[float]], seasons: Sequence[Sequence[int]],
+                          periods: int, interval_width: float = DEFAULT_INTERVAL_WIDTH) -> List[pd.DataFrame]:
+    """
+    여러 선수 시계열을 한 번에 적합하고 Prophet 결과와 같은 형식의 예측 프레임을 만듭니다.
+
+    시계열은 각자의 마지막 시즌이 배열의 마지막 열에 오도록 오른쪽 정렬되고, 빠진 시즌은 NaN입니다.
+
+    Args:
+        series: 시계열별 값 목록
+        seasons: 시계열별 시즌 목록 (값과 같은 순서, 오름차순)
+        periods: 예측할 미래 기간 (연도 수)
+        interval_width: 예측 구간 폭
+
+    Returns:
+        List[pd.DataFrame]: 시계열별 'ds', 'yhat', 'yhat_lower', 'yhat_upper' 예측 프레임
+    """
+    if not series:
+        return []
+    firsts = np.array([season[0] for season in seasons])
+    lasts = np.array([season[-1] for season in seasons])
+    width = int((lasts - firsts).max()) + 1
+    values = np.full((len(series), width), np.nan)
+    for row, (season, value) in enumerate(zip(seasons, series)):
+        columns = width - 1 - (lasts[row] - np.asarray(season))
+        values[row, columns] = value
+
+    fit = fit_damped_trend(values)
+    in_sample = fit.fitted_intervals(interval_width)
+    ahead = fit.forecast(periods, interval_width)
+
+    frames = []
+    for row, season in enumerate(seasons):
+        season = np.asarray(season)
+        columns = width - 1 - (lasts[row] - season)
+        # 학습 구간은 시즌 1월 1일, 미래는 Prophet의 make_future_dataframe(freq='Y')와 같은 연말 날짜
+        history_ds = (season - 1970).astype('datetime64[Y]')
+        future_years = (lasts[row] + np.arange(1, periods + 1) - 1970).astype('datetime64[Y]')
+        future_ds = future_years.astype('datetime64[D]') - np.timedelta64(1, 'D')
+        frames.append(pd.DataFrame({
+            'ds': np.concatenate([history_ds.astype('datetime64[ns]'), future_ds.astype('datetime64[ns]')]),
+            **{name: np.concatenate([in_sample[name][row, columns], ahead[name][row]])
+               for name in ('yhat', 'yhat_lower', 'yhat_upper')},
+        }))
+    return frames
+
+
+def prophet_analytic_intervals(model: Any, forecast: pd.DataFrame) -> pd.DataFrame:
+    """
+    시뮬레이션 없이 적합된 Prophet 모델의 예측 구간을 계산합니다.
+
+    관측 잡음 분산과 미래 변화점에 의한 추세 분산을 더한 정규 근사 구간입니다. 학습 구간은
+    관측 잡음만 반영됩니다. (Prophet 시뮬레이션과 같음) 선형 추세가 아니면 관측 잡음만 사용합니다.
+
+    Args:
+        model: 적합된 Prophet 모델 (MAP 적합)
+        forecast: model.predict() 결과 ('ds', 'yhat')
+
+    Returns:
+        pd.DataFrame: 'yhat_lower', 'yhat_upper' 컬럼을 더한 예측 결과
+    """
+    t = ((forecast['ds'] - model.start) / model.t_scale).to_numpy(dtype='float64')
+    sigma_obs = float(np.mean(model.params['sigma_obs']))
+    variance = np.full(len(t), sigma_obs ** 2)
+    if model.growth == 'linear':
+        # 미래 변화점: 단위 시간당 S개, 크기 Laplace(0, λ) (분산 2λ²), 시점 s의 변화는 (t - s)만큼 누적
+        rate = len(model.changepoints_t)
+        scale = float(np.mean(np.abs(model.params['delta']))) + 1e-8
+        ahead = np.clip(t - float(model.history['t'].max()), 0, None)
+        variance += (2.0 / 3.0) * rate * scale ** 2 * ahead ** 3
+    half_width = _z_score(model.interval_width) * model.y_scale * np.sqrt(variance)
+    yhat = forecast['yhat'].to_numpy(dtype='float64')
+    return forecast.assign(yhat_lower=yhat - half_width, yhat_upper=yhat + half_width)
+
+
+def predict_forecast(model: Any, future: pd.DataFrame) -> pd.DataFrame:
+    """
+    예측기로 예측하고, 시뮬레이션 구간이 없는 Prophet 결과에는 해석적 구간을 더합니다.
+
+    Args:
+        model: 적합된 예측기 (Prophet 또는 DampedTrendForecaster)
+        future: 'ds' 컬럼 데이터프레임
+
+    Returns:
+        pd.DataFrame: 'ds', 'yhat', 'yhat_lower', 'yhat_upper'를 포함한 예측 결과
+    """
+    forecast = model.predict(future)
+    if 'yhat_lower' not in forecast.columns:
+        forecast = prophet_analytic_intervals(model, forecast)
+    return forecast
+
+
+# 백엔드 이름 → 예측기 생성 함수
+FORECASTER_BACKENDS: Dict[str, Callable[..., Any]] = {
+    'prophet': lambda **kwargs: prophet.Prophet(**{**PROPHET_DEFAULTS, **kwargs}),
+    'damped': DampedTrendForecaster,
+}
+
+
+def forecaster_params(backend: str, yearly_seasonality: bool = False) -> Dict[str, Any]:
+    """
+    예측 페이지와 일괄 예측이 공통으로 쓰는 예측기 생성 인자를 반환합니다. (모델 저장소 키에 포함)
+
+    Args:
+        backend: 'prophet' 또는 'damped'
+        yearly_seasonality: 연간 계절성 사용 여부 (Prophet만 사용)
+
+    Returns:
+        Dict[str, Any]: create_forecaster()에 넘길 인자
+    """
+    if backend == 'prophet':
+        return {'yearly_seasonality': yearly_seasonality, **PROPHET_DEFAULTS}
+    return {}
+
+
+def create_forecaster(backend: str = 'damped', **kwargs: Any) -> Any:
+    """
+    백엔드 이름으로 예측기를 만듭니다.
+
+    Args:
+        backend: 'prophet' 또는 'damped'
+        **kwargs: 예측기 생성 인자
+
+    Returns:
+        Any: fit / make_future_dataframe / predict를 제공하는 예측기
+
+    Raises:
+        ValueError: 알 수 없는 백엔드인 경우
+    """
+    if backend not in FORECASTER_BACKENDS:
+        raise ValueError(f"알 수 없는 예측 백엔드입니다: {backend} (사용 가능: {', '.join(FORECASTER_BACKENDS)})")
+    return FORECASTER_BACKENDS[backend](**kwargs)
@@ -0,0 +1,200 @@
+"""
+Marcel 예측 모듈: 최근 3시즌 가중 평균과 리그 평균 회귀로 다음 시즌 기록을 예측합니다.
+
+Tom Tango의 Marcel 방식을 따라 최근 시즌부터 5/4/3 가중치를 주고, 일정량의 리그 평균을
+더해 평균 쪽으로 당깁니다. 비율 지표(타율, 평균자책점 등)는 시즌 가중치에 출전 시간(타수/이닝)을
+곱해 가중하고(출전 시간이 비어 있는 시즌은 리그 중앙값으로 대체), 누적 지표(승, 탈삼진 등)는
+시즌 가중치만 사용합니다. 나이 컬럼이 있으면
+29세를 기준으로 나이 보정을 적용합니다.
+
+모든 (선수, 시즌)의 직전 시즌들을 (PlayerID, Season - k) 인덱스 재정렬로 한 번에 가져오므로
+리그 전체 예측이 선수별 반복 없이 배열 연산 몇 번으로 끝납니다. 최근 2개 시즌이 모두 없어
+Prophet 예측이 불가능한 선수도 기본 예측을 얻을 수 있습니다.
+"""
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.aggregates import LeagueAggregateStore, infer_weight_column
+
+# 최근 시즌부터의 시즌 가중치
+SEASON_WEIGHTS = (5, 4, 3)
+
+# 출전 시간 가중 비율 지표
+RATE_METRICS = {
+    'BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS',
+    'EarnedRunAverage', 'Whip',
+}
+
+# 낮을수록 좋은 지표 (나이 보정 방향이 반대)
+LOWER_IS_BETTER = {'EarnedRunAverage', 'Whip', 'Losses', 'HitsAllowed', 'HomeRunsAllowed'}
+
+# 리그 평균 회귀량: 비율 지표는 가중치 컬럼별 출전 시간 단위, 누적 지표는 시즌 가중치 단위
+REGRESSION_PLAYING_TIME = {'AtBats': 1200.0, 'InningsPitched': 400.0}
+REGRESSION_SEASON_WEIGHT = 3.0
+
+# 나이 보정 (기준 나이보다 어리면 1세당 +0.6%, 많으면 1세당 -0.3%)
+AGE_COLUMN = 'Age'
+PEAK_AGE = 29
+YOUNG_AGE_RATE = 0.006
+OLD_AGE_RATE = 0.003
+
+
+class MarcelProjector:
+    """Marcel 방식 다음 시즌 예측 클래스"""
+
+    def __init__(self, aggregates: Optional[LeagueAggregateStore] = None,
+                 weight_column: Optional[str] = None):
+        """
+        MarcelProjector 클래스 초기화
+
+        Args:
+            aggregates: 시즌별 리그 집계 (None이면 예측할 데이터로 만듦)
+            weight_column: 출전 시간 컬럼 (None이면 데이터 컬럼으로 추론)
+        """
+        self.aggregates = aggregates
+        self.weight_column = weight_column
+
+    def _league_means(self, df: pd.DataFrame, metrics: List[str], weight_column: Optional[str]) -> pd.DataFrame:
+        """
+        시즌별 리그 평균을 반환합니다. 비율 지표는 출전 시간 가중 평균을 사용합니다.
+
+        Args:
+            df: 선수 시즌 데이터
+            metrics: 지표 목록
+            weight_column: 출전 시간 컬럼
+
+        Returns:
+            pd.DataFrame: 시즌 인덱스, 지표별 리그 평균 컬럼
+        """
+        aggregates = self.aggregates
+        if aggregates is None or any(metric not in aggregates.metrics for metric in metrics):
+            aggregates = LeagueAggregateStore.from_frame(df, metrics, weight_column)
+        means = aggregates.mean(metrics).set_index('Season')
+        rate_metrics = [metric for metric in metrics if metric in RATE_METRICS]
+        if rate_metrics and aggregates.weight_column:
+            weighted = aggregates.weighted_mean(rate_metrics).set_index('Season')
+            means[rate_metrics] = weighted[rate_metrics].fillna(means[rate_metrics])
+        return means
+
+    def project(self, df: pd.DataFrame, metrics: List[str], target_season: Optional[int] = None,
+                latest_only: bool = True) -> pd.DataFrame:
+        """
+        선수들의 다음 시즌 기록을 예측합니다.
+
+        Args:
+            df: 선수 시즌 데이터 (PlayerID, PlayerName, Season과 지표 컬럼)
+            metrics: 예측할 지표 목록
+            target_season: 예측할 시즌 (지정하면 모든 선수를 직전 3시즌 기준으로 예측,
+                None이면 각 (선수, 시즌) 행의 다음 시즌을 예측)
+            latest_only: target_season이 없을 때 선수별 마지막 시즌 기준 예측만 남길지 여부
+
+        Returns:
+            pd.DataFrame: PlayerID, PlayerName, Season(예측 시즌), 지표별 예측값,
+                Reliability(0~1, 선수 기록 비중) 컬럼 (최근 3시즌 기록이 없는 선수는 제외)
+        """
+        metrics = [metric for metric in metrics if metric in df.columns]
+        weight_column = self.weight_column or infer_weight_column(df.columns)
+        columns = ['PlayerID', 'Season'] + metrics
+        if weight_column and weight_column not in columns:
+            columns.append(weight_column)
+        if AGE_COLUMN in df.columns:
+            columns.append(AGE_COLUMN)
+        seasons = df[columns].set_index(['PlayerID', 'Season']).sort_index()
+        seasons = seasons[~seasons.index.duplicated(keep='last')]
+
+        # 예측 기준 (선수, 기준 시즌) 목록
+        if target_season is not None:
+            players = seasons.index.get_level_values('PlayerID').unique()
+            base = pd.MultiIndex.from_arrays([players, np.full(len(players), target_season - 1)],
+                                             names=['PlayerID', 'Season'])
+        else:
+            base = seasons.index
+            if latest_only:
+                base = seasons.groupby(level='PlayerID').tail(1).index
+        player_ids = base.get_level_values('PlayerID').to_numpy()
+        base_seasons = base.get_level_values('Season').to_numpy()
+
+        # (PlayerID, 기준 시즌 - k) 재정렬로 최근 3시즌 값을 (시즌 가중치 수 × 선수 수) 배열로 가져옴
+        lagged = [seasons.reindex(pd.MultiIndex.from_arrays([player_ids, base_seasons - k]))
+                  for k in range(len(SEASON_WEIGHTS))]
+        season_weights = np.array(SEASON_WEIGHTS, dtype='float64')[:, None]
+        if weight_column:
+            playing_time = np.stack([frame[weight_column].to_numpy(dtype='float64', na_value=np.nan)
+                                     for frame in lagged])
+            # 출전 시간이 기록되지 않은 시즌(0 또는 결측)은 리그 중앙값으로 대체
+            recorded = seasons[weight_column].to_numpy(dtype='float64', na_value=np.nan)
+            recorded = recorded[recorded > 0]
+            typical = float(np.median(recorded)) if len(recorded) else 1.0
+            playing_time = np.where(playing_time > 0, playing_time, typical)
+        else:
+            playing_time = np.ones((len(SEASON_WEIGHTS), len(base)))
+
+        league = self._league_means(df, metrics, weight_column).reindex(base_seasons)
+        result = pd.DataFrame({'PlayerID': player_ids, 'Season': base_seasons + 1})
+        reliability = np.zeros(len(base))
+        observed_any = np.zeros(len(base), dtype=bool)
+        for metric in metrics:
+            values = np.stack([frame[metric].to_numpy(dtype='float64', na_value=np.nan) for frame in lagged])
+            observed = ~np.isnan(values)
+            if metric in RATE_METRICS and weight_column:
+                weights = season_weights * playing_time * observed
+                regression = REGRESSION_PLAYING_TIME.get(weight_column, REGRESSION_SEASON_WEIGHT)
+            else:
+                weights = season_weights * observed
+                regression = REGRESSION_SEASON_WEIGHT
+            weight_sum = weights.sum(axis=0)
+            league_mean = league[metric].to_numpy(dtype='float64')
+            weighted_sum = (weights * np.nan_to_num(values)).sum(axis=0)
+            result[metric] = (weighted_sum + regression * league_mean) / (weight_sum + regression)
+            reliability = np.maximum(reliability, weight_sum / (weight_sum + regression))
+            observed_any |= observed.any(axis=0)
+
+        if AGE_COLUMN in seasons.columns:
+            self._adjust_for_age(result, lagged, metrics)
+        result['Reliability'] = reliability
+
+        names = df.drop_duplicates('PlayerID', keep='last').set_index('PlayerID')['PlayerName']
+        result.insert(1, 'PlayerName', result['PlayerID'].map(names))
+        return result[observed_any].reset_index(drop=True)
+
+    def _adjust_for_age(self, result: pd.DataFrame, lagged: List[pd.DataFrame], metrics: List[str]) -> None:
+        """
+        예측 시즌 나이로 나이 보정을 적용합니다. (기준 시즌 나이가 없는 선수는 보정하지 않음)
+
+        Args:
+            result: 예측 결과 (지표 컬럼을 직접 수정)
+            lagged: 기준 시즌부터의 시즌 데이터 목록
+            metrics: 보정할 지표 목록
+        """
+        # 가장 최근에 기록된 나이 + 경과 연수
+        age = np.full(len(result), np.nan)
+        for k, frame in reversed(list(enumerate(lagged))):
+            known = frame[AGE_COLUMN].to_numpy(dtype='float64', na_value=np.nan) + k + 1
+            age = np.where(np.isnan(known), age, known)
+        gap = PEAK_AGE - age
+        factor = np.where(gap > 0, 1 + gap * YOUNG_AGE_RATE, 1 + gap * OLD_AGE_RATE)
+        factor = np.nan_to_num(factor, nan=1.0)
+        for metric in metrics:
+            result[metric] = result[metric] / factor if metric in LOWER_IS_BETTER else result[metric] * factor
+
+
+def project_next_season(df: pd.DataFrame, metrics: List[str], aggregates: Optional[LeagueAggregateStore] = None,
+                        target_season: Optional[int] = None) -> pd.DataFrame:
+    """
+    리그 전체 선수의 다음 시즌 Marcel 예측을 계산합니다.
+
+    Args:
+        df: 선수 유형별 전체 데이터
+        metrics: 예측할 지표 목록
+        aggregates: 시즌별 리그 집계 (None이면 데이터로 만듦)
+        target_season: 예측할 시즌 (None이면 데이터의 마지막 시즌 다음 해)
+
+    Returns:
+        pd.DataFrame: 선수별 예측 (MarcelProjector.project 형식)
+    """
+    if target_season is None:
+        target_season = int(df['Season'].max()) + 1
+    return MarcelProjector(aggregates).project(df, metrics, target_season=target_season)
+
@@ -0,0 +1,363 @@
+"""
+모델 저장소 모듈: 적합된 예측 모델을 파일로 저장하고 다시 적합하지 않고 불러옵니다.
+
+Prophet 모델은 prophet.serialize의 JSON 형식으로, 감쇠 추세 모델은 적합 파라미터(to_params)로
+저장합니다. 각 항목에는 학습 데이터 해시와 라이브러리 버전을 함께 기록해서, 선수 기록이나
+라이브러리가 바뀌면 조회되지 않습니다. 키에 예측 기간이 들어가지 않으므로 예측 기간을 바꾸거나
+화면을 다시 그릴 때는 저장된 모델의 predict()만 호출하면 됩니다. 저장 디렉토리는 보관 기간이 지난
+항목과, 최대 용량을 넘는 만큼의 오래된 항목을 주기적으로 지웁니다.
+
+레이아웃:
+    data/models/<키 앞 2글자>/<키>.json
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from ..config.settings import MODEL_REGISTRY_DIR, MODEL_REGISTRY_MAX_AGE_DAYS, MODEL_REGISTRY_MAX_MB
+from ..utils.lazy_import import lazy_import
+from .forecasters import DampedTrendForecaster
+
+logger = logging.getLogger(__name__)
+
+prophet_serialize = lazy_import("prophet.serialize")
+
+# 저장 형식이 바뀌면 올려서 기존 항목을 무효화합니다.
+ARTIFACT_FORMAT_VERSION = 1
+
+# 디스크 용량/보관 기간 검사 주기 (저장 횟수)
+_PRUNE_INTERVAL = 50
+
+# 백엔드별 버전을 기록할 라이브러리
+BACKEND_LIBRARIES = {'prophet': 'prophet', 'damped': 'numpy'}
+
+
+def library_version(backend: str) -> Optional[str]:
+    """
+    백엔드가 사용하는 라이브러리 버전을 반환합니다.
+
+    Args:
+        backend: 예측 모델 백엔드
+
+    Returns:
+        Optional[str]: 라이브러리 버전, 설치되지 않았으면 None
+    """
+    try:
+        return version(BACKEND_LIBRARIES.get(backend, backend))
+    except PackageNotFoundError:
+        return None
+
+
+def training_hash(data: pd.DataFrame) -> str:
+    """
+    학습 데이터('ds', 'y')의 내용 해시를 만듭니다.
+
+    Args:
+        data: 학습 데이터
+
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    payload = json.dumps({
+        "ds": pd.to_datetime(data['ds']).dt.strftime('%Y-%m-%d').tolist(),
+        "y": [repr(float(value)) for value in data['y']],
+    })
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def serialize_model(model: Any, backend: str) -> Any:
+    """
+    적합된 모델을 JSON으로 저장할 수 있는 값으로 변환합니다.
+
+    Args:
+        model: 적합된 모델
+        backend: 예측 모델 백엔드
+
+    Returns:
+        Any: Prophet은 JSON 문자열, 감쇠 추세 모델은 파라미터 딕셔너리
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+    """
+    if backend == 'prophet':
+        return prophet_serialize.model_to_json(model)
+    if backend == 'damped':
+        return model.to_params()
+    raise ValueError(f"저장할 수 없는 예측 백엔드입니다: {backend}")
+
+
+def deserialize_model(payload: Any, backend: str) -> Any:
+    """
+    serialize_model() 결과에서 적합된 모델을 복원합니다.
+
+    Args:
+        payload: 저장된 모델 값
+        backend: 예측 모델 백엔드
+
+    Returns:
+        Any: 적합된 모델
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+    """
+    if backend == 'prophet':
+        return prophet_serialize.model_from_json(payload)
+    if backend == 'damped':
+        return DampedTrendForecaster.from_params(payload)
+    raise ValueError(f"복원할 수 없는 예측 백엔드입니다: {backend}")
+
+
+class ModelRegistry:
+    """적합된 모델 파일 저장소 클래스"""
+
+    def __init__(self, root_dir: Optional[str], max_loaded: int = 64,
+                 max_disk_mb: Optional[float] = None, max_age_days: Optional[float] = None):
+        """
+        ModelRegistry 클래스 초기화
+
+        Args:
+            root_dir: 저장 디렉토리 (None이면 메모리에만 보관)
+            max_loaded: 메모리에 보관할 복원된 모델 수
+            max_disk_mb: 저장 디렉토리 최대 용량 (None이면 제한 없음)
+            max_age_days: 마지막 사용 후 항목 보관 기간 (일, None이면 제한 없음)
+        """
+        self.root_dir = root_dir
+        self.max_loaded = max_loaded
+        self.max_disk_mb = max_disk_mb
+        self.max_age_days = max_age_days
+        self._loaded: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "saves": 0, "disk_evictions": 0}
+
+    def model_key(self, backend: str, data: pd.DataFrame, metric: str = "",
+                  player_id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        모델 항목 키를 만듭니다. (예측 기간은 포함하지 않음)
+
+        Args:
+            backend: 예측 모델 백엔드
+            data: 학습 데이터 ('ds', 'y')
+            metric: 지표
+            player_id: 선수 ID
+            params: 모델 생성 인자
+
+        Returns:
+            str: SHA-256 16진수 문자열
+        """
+        payload = json.dumps({
+            "v": ARTIFACT_FORMAT_VERSION,
+            "backend": backend,
+            "version": library_version(backend),
+            "params": params or {},
+            "player_id": player_id,
+            "metric": metric,
+            "training_hash": training_hash(data),
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """키에 해당하는 파일 경로 (앞 2글자로 하위 디렉토리 분산)"""
+        return os.path.join(self.root_dir, key[:2], key + ".json")
+
+    def _remember(self, key: str, model: Any) -> None:
+        """복원된 모델을 메모리에 보관합니다. (잠금 상태에서 호출)"""
+        self._loaded[key] = model
+        self._loaded.move_to_end(key)
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        저장된 모델을 불러옵니다.
+
+        Args:
+            key: 모델 항목 키
+
+        Returns:
+            Optional[Any]: 적합된 모델, 없거나 버전이 다르면 None
+        """
+        with self._lock:
+            model = self._loaded.get(key)
+            if model is not None:
+                self._loaded.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return model
+
+        model = self._read(key)
+        with self._lock:
+            if model is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, model)
+            return model
+
+    def _read(self, key: str) -> Optional[Any]:
+        """파일에서 모델 항목을 읽어 복원합니다."""
+        if self.root_dir is None:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                artifact = json.load(f)
+            meta = artifact["meta"]
+            if meta.get("format") != ARTIFACT_FORMAT_VERSION or meta.get("version") != library_version(meta["backend"]):
+                return None
+            model = deserialize_model(artifact["model"], meta["backend"])
+            # 보관 기간은 마지막 사용 시각 기준 (자주 쓰는 모델은 지우지 않음)
+            os.utime(path)
+            return model
+        except Exception as e:
+            logger.warning(f"모델 파일 읽기 실패 ({path}): {e}")
+            return None
+
+    def save(self, key: str, model: Any, backend: str, data: pd.DataFrame,
+             metric: str = "", player_id: Optional[int] = None) -> None:
+        """
+        적합된 모델을 저장합니다. (실패해도 메모리에는 보관)
+
+        Args:
+            key: 모델 항목 키
+            model: 적합된 모델
+            backend: 예측 모델 백엔드
+            data: 학습 데이터 ('ds', 'y')
+            metric: 지표
+            player_id: 선수 ID
+        """
+        with self._lock:
+            self._remember(key, model)
+            self._stats["saves"] += 1
+            prune = (self.max_disk_mb is not None or self.max_age_days is not None) \
+                and self._stats["saves"] % _PRUNE_INTERVAL == 0
+        if self.root_dir is None:
+            return
+        artifact = {
+            "meta": {
+                "format": ARTIFACT_FORMAT_VERSION,
+                "backend": backend,
+                "version": library_version(backend),
+                "training_hash": training_hash(data),
+                "metric": metric,
+                "player_id": player_id,
+                "seasons": pd.to_datetime(data['ds']).dt.year.tolist(),
+                "created_at": time.time(),
+            },
+            "model": serialize_model(model, backend),
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(artifact, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"모델 파일 저장 실패 ({path}): {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        if prune:
+            self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """
+        보관 기간 동안 쓰이지 않은 항목을 지우고, 최대 용량을 넘으면 가장 오래 쓰이지 않은 항목부터 지웁니다.
+
+        Returns:
+            int: 지운 파일 수
+        """
+        if self.root_dir is None or not os.path.isdir(self.root_dir):
+            return 0
+        files = []
+        for root, _, names in os.walk(self.root_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        limit = None if self.max_disk_mb is None else self.max_disk_mb * 1024 * 1024
+        expires = None if self.max_age_days is None else time.time() - self.max_age_days * 86400
+        removed = 0
+        for mtime, size, path in sorted(files):
+            expired = expires is not None and mtime < expires
+            if not expired and (limit is None or total <= limit):
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        with self._lock:
+            self._stats["disk_evictions"] += removed
+        return removed
+
+    def get_or_fit(self, backend: str, data: pd.DataFrame, factory: Callable[[], Any], metric: str = "",
+                   player_id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        저장된 모델을 불러오고, 없으면 적합해서 저장합니다.
+
+        Args:
+            backend: 예측 모델 백엔드
+            data: 학습 데이터 ('ds', 'y')
+            factory: 적합 전 모델을 만드는 함수
+            metric: 지표
+            player_id: 선수 ID
+            params: 모델 생성 인자 (키에 포함)
+
+        Returns:
+            Any: 적합된 모델
+        """
+        key = self.model_key(backend, data, metric, player_id, params)
+        model = self.load(key)
+        if model is None:
+            model = factory()
+            model.fit(data)
+            self.save(key, model, backend, data, metric, player_id)
+        return model
+
+    def stats(self) -> Dict[str, int]:
+        """
+        저장소 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 적중(메모리/파일), 미스, 저장 횟수, 디스크에서 지운 항목 수, 메모리 보관 모델 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["loaded"] = len(self._loaded)
+        return stats
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    프로세스 전역 모델 저장소를 반환합니다.
+
+    Returns:
+        ModelRegistry: 모델 저장소 싱글톤
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry(MODEL_REGISTRY_DIR or None,
+                                      max_disk_mb=MODEL_REGISTRY_MAX_MB or None,
+                                      max_age_days=MODEL_REGISTRY_MAX_AGE_DAYS or None)
+        return _registry
@@ -1,34 +1,85 @@
 """
 예측 모델 모듈: 선수 기록 예측을 위한 클래스와 함수를 제공합니다.
 """
+import logging
 import pandas as pd
 import numpy as np
-from prophet import Prophet
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
-import streamlit as st
+
+from ..config.settings import FALLBACK_BACKEND, FORECAST_BACKEND
+from .batch_forecaster import get_batch_forecaster, make_jobs
+from .forecast_cache import get_forecast_cache
+from .forecast_store import ForecastStore
+from .forecasters import create_forecaster, forecaster_params, predict_forecast
+from .model_registry import ModelRegistry, get_model_registry
+from ..utils.single_flight import get_single_flight
+
+logger = logging.getLogger(__name__)
+
+# 응답 시간 예산을 넘긴 예측을 끝까지 실행하는 스레드 (Prophet 훈련은 cmdstan 하위 프로세스에서 실행)
+_background = ThreadPoolExecutor(max_workers=4, thread_name_prefix="predict-background")
+
+@dataclass
+class FittedForecast:
+    """적합된 예측 모델 (예측 기간과 무관, evaluate()로 원하는 기간을 예측)"""
+    model: Any
+    training_data: pd.DataFrame
+    metric: str
+    player_name: str
+
+    def evaluate(self, periods: int) -> Dict[str, Any]:
+        """
+        적합된 모델로 지정한 기간을 예측합니다. (다시 적합하지 않음)
+        
+        Args:
+            periods: 예측할 미래 기간 (연도 수)
+            
+        Returns:
+            Dict[str, Any]: 예측 결과 (seasons, actual, predicted, lower, upper, forecast, metric, player_name, model)
+        """
+        future = self.model.make_future_dataframe(periods=periods, freq='Y')
+        forecast = predict_forecast(self.model, future)
+        result = assemble_forecast(self.training_data, forecast, periods)
+        result['metric'] = self.metric
+        result['player_name'] = self.player_name
+        result['model'] = self.model
+        return result
+
 
 class PredictionModel:
     """예측 모델 클래스"""
-    def __init__(self, min_seasons: int = 2):
+    def __init__(self, min_seasons: int = 2, forecast_store: Optional[ForecastStore] = None,
+                 data_version: Optional[str] = None, backend: str = FORECAST_BACKEND,
+                 model_registry: Optional[ModelRegistry] = None):
         """
         PredictionModel 클래스 초기화
         
         Args:
             min_seasons: 예측에 필요한 최소 시즌 수
+            forecast_store: 미리 계산된 예측 저장소 (있으면 훈련 전에 먼저 조회)
+            data_version: 선수 데이터의 데이터 버전 (예측 저장소 조회 키)
+            backend: 예측 모델 백엔드 ('damped' 또는 'prophet')
+            model_registry: 적합된 모델 저장소 (None이면 프로세스 전역 저장소)
         """
         self.model = None
         self.min_seasons = min_seasons
+        self.backend = backend
+        self.model_registry = model_registry if model_registry is not None else get_model_registry()
+        self.forecast_store = forecast_store
+        self.data_version = data_version
         
     def prepare_data(self, player_data: pd.DataFrame, metric: str) -> pd.DataFrame:
         """
-        Prophet 모델에 맞게 데이터를 준비합니다.
+        예측 모델(Prophet 형식)에 맞게 데이터를 준비합니다.
         
         Args:
             player_data: 선수 데이터
             metric: 예측할 지표
             
         Returns:
-            pd.DataFrame: Prophet 모델용 데이터프레임
+            pd.DataFrame: 'ds', 'y' 컬럼 데이터프레임
         """
         # Prophet은 'ds'와 'y' 컬럼을 필요로 함
         prophet_data = player_data[['Season', metric]].rename(columns={
@@ -39,116 +90,264 @@ class PredictionModel:
         prophet_data['ds'] = pd.to_datetime(prophet_data['ds'], format='%Y')
         return prophet_data
     
-    def train_model(self, data: pd.DataFrame, yearly_seasonality: bool = False) -> Prophet:
+    def train_model(self, data: pd.DataFrame, yearly_seasonality: bool = False, metric: str = "",
+                    player_id: Optional[int] = None) -> Any:
         """
-        Prophet 모델을 훈련합니다.
+        예측 모델을 훈련합니다. 같은 학습 데이터로 적합해 저장해 둔 모델이 있으면 불러옵니다.
         
         Args:
             data: 훈련 데이터
-            yearly_seasonality: 연간 계절성 사용 여부
+            yearly_seasonality: 연간 계절성 사용 여부 (Prophet 백엔드만 사용)
+            metric: 지표 (모델 저장소 키)
+            player_id: 선수 ID (모델 저장소 키)
             
         Returns:
-            Prophet: 훈련된 Prophet 모델
+            Any: 훈련된 모델 (Prophet 또는 DampedTrendForecaster)
         """
-        model = Prophet(yearly_seasonality=yearly_seasonality)
-        model.fit(data)
+        params = forecaster_params(self.backend, yearly_seasonality)
+        model = self.model_registry.get_or_fit(
+            self.backend, data, lambda: create_forecaster(self.backend, **params),
+            metric=metric, player_id=player_id, params=params,
+        )
         self.model = model
         return model
         
-    def predict(self, player_data: pd.DataFrame, metric: str, periods: int = 5) -> Dict[str, Any]:
+    def fit(self, player_data: pd.DataFrame, metric: str) -> FittedForecast:
+        """
+        선수의 특정 지표에 모델을 적합합니다. (모델 저장소에 있으면 불러오기만 함)
+        
+        Args:
+            player_data: 선수 데이터
+            metric: 예측할 지표
+            
+        Returns:
+            FittedForecast: 원하는 기간을 예측할 수 있는 적합된 모델
+            
+        Raises:
+            ValueError: 최소 시즌 수보다 데이터가 적은 경우
+        """
+        if len(player_data) < self.min_seasons:
+            raise ValueError(f"예측에 필요한 데이터가 부족합니다. 최소 {self.min_seasons}개 시즌이 필요합니다.")
+        prophet_data = self.prepare_data(player_data, metric)
+        player_id = int(player_data['PlayerID'].iloc[0]) if 'PlayerID' in player_data.columns else None
+        model = self.train_model(prophet_data, metric=metric, player_id=player_id)
+        return FittedForecast(model, prophet_data, metric, player_data['PlayerName'].iloc[0])
+
+    def predict(self, player_data: pd.DataFrame, metric: str, periods: int = 5,
+                latency_budget: Optional[float] = None) -> Dict[str, Any]:
         """
         선수의 특정 지표에 대한 예측을 수행합니다.
         
+        여러 세션이 같은 선수/지표/기간을 동시에 요청하면 한 번만 계산하고 결과를 공유합니다.
+        응답 시간 예산을 주면 그 안에 끝나지 않은 예측은 빠른 백엔드(FALLBACK_BACKEND) 예측으로
+        대신하고, 원래 예측은 뒤에서 계속 실행해서 모델 저장소를 채웁니다.
+        
         Args:
             player_data: 선수 데이터
             metric: 예측할 지표
             periods: 예측할 미래 기간 (연도 수)
+            latency_budget: 응답 시간 예산 (초, None이면 끝날 때까지 기다림)
             
         Returns:
-            Dict[str, Any]: 예측 결과 및 관련 정보
+            Dict[str, Any]: 예측 결과 및 관련 정보 (fallback: 빠른 백엔드로 대신 예측했는지 여부)
         """
+        columns = [column for column in ('PlayerID', 'PlayerName', 'Season', metric) if column in player_data.columns]
+        key = (
+            self.backend, self.min_seasons, self.data_version, metric, periods,
+            int(pd.util.hash_pandas_object(player_data[columns], index=False).sum()),
+        )
+        flights = get_single_flight("predict")
+        if latency_budget is None or self.backend == FALLBACK_BACKEND:
+            result = flights.do(key, lambda: self._predict(player_data, metric, periods))
+        else:
+            future = _background.submit(flights.do, key, lambda: self._predict(player_data, metric, periods))
+            try:
+                result = future.result(timeout=latency_budget)
+            except FutureTimeoutError:
+                logger.info(f"응답 시간 예산({latency_budget:g}초) 초과, {metric} 예측을 {FALLBACK_BACKEND}로 대신합니다.")
+                return self._fallback_result(player_data, metric, periods)
+        # 대기자들이 같은 딕셔너리를 받으므로 최상위 키는 복사해서 돌려줌
+        return {**result, 'fallback': False}
+    
+    def _fallback_result(self, player_data: pd.DataFrame, metric: str, periods: int) -> Dict[str, Any]:
+        """
+        빠른 백엔드로 적합한 대체 예측을 만듭니다. (모델 저장소를 거치지 않음)
+        
+        Args:
+            player_data: 선수 데이터
+            metric: 예측할 지표
+            periods: 예측할 미래 기간 (연도 수)
+            
+        Returns:
+            Dict[str, Any]: predict() 형식의 예측 결과 (fallback=True)
+        """
+        prophet_data = self.prepare_data(player_data.sort_values('Season'), metric).dropna(subset=['y'])
+        try:
+            model = create_forecaster(FALLBACK_BACKEND).fit(prophet_data)
+        except Exception as e:
+            return {"error": str(e), "fallback": True}
+        result = FittedForecast(model, prophet_data, metric, player_data['PlayerName'].iloc[0]).evaluate(periods)
+        result['fallback'] = True
+        result['fallback_backend'] = FALLBACK_BACKEND
+        return result
+    
+    def _predict(self, player_data: pd.DataFrame, metric: str, periods: int) -> Dict[str, Any]:
+        """predict()의 실제 계산 (단일 실행 계층 뒤에서 호출)"""
         # 최소 시즌 수 확인
         if len(player_data) < self.min_seasons:
             return {"error": f"예측에 필요한 데이터가 부족합니다. 최소 {self.min_seasons}개 시즌이 필요합니다."}
         
-        # 데이터 준비
-        prophet_data = self.prepare_data(player_data, metric)
+        # 미리 계산된 예측이 있으면 훈련하지 않음
+        stored = self._lookup_stored(player_data, metric, periods)
+        if stored is not None:
+            return self._stored_result(player_data, metric, stored, periods)
         
-        # 모델 훈련
-        model = self.train_model(prophet_data)
-        
-        # 미래 예측을 위한 데이터프레임 생성
-        future = model.make_future_dataframe(periods=periods, freq='Y')
-        
-        # 예측 수행
-        forecast = model.predict(future)
-        
-        # 예측 결과 포맷팅
-        result = {
-            'seasons': [],
-            'actual': [],
-            'predicted': [],
-            'lower': [],
-            'upper': []
-        }
-        
-        # 실제 데이터
-        for i, row in prophet_data.iterrows():
-            season = row['ds'].year
-            result['seasons'].append(season)
-            result['actual'].append(row['y'])
-            
-            # 해당 시즌의 예측값 찾기
-            forecast_row = forecast[forecast['ds'] == row['ds']]
-            if not forecast_row.empty:
-                result['predicted'].append(forecast_row['yhat'].values[0])
-                result['lower'].append(forecast_row['yhat_lower'].values[0])
-                result['upper'].append(forecast_row['yhat_upper'].values[0])
-            else:
-                result['predicted'].append(None)
-                result['lower'].append(None)
-                result['upper'].append(None)
-        
-        # 미래 예측값
-        last_season = prophet_data['ds'].dt.year.max()
-        for i in range(1, periods + 1):
-            future_season = last_season + i
-            result['seasons'].append(future_season)
-            result['actual'].append(None)  # 미래 데이터는 실제값 없음
+        # 모델 훈련 (저장된 모델이 있으면 예측만 수행)
+        return self.fit(player_data, metric).evaluate(periods)
+    
+    def _lookup_stored(self, player_data: pd.DataFrame, metric: str, periods: int) -> Optional[pd.DataFrame]:
+        """
+        예측 저장소에서 선수/지표 예측을 조회합니다.
+        
+        Args:
+            player_data: 선수 데이터
+            metric: 지표
+            periods: 예측할 미래 기간 (연도 수)
             
-            # 예측값 찾기
-            forecast_row = forecast[forecast['ds'].dt.year == future_season]
-            if not forecast_row.empty:
-                result['predicted'].append(forecast_row['yhat'].values[0])
-                result['lower'].append(forecast_row['yhat_lower'].values[0])
-                result['upper'].append(forecast_row['yhat_upper'].values[0])
-            else:
-                result['predicted'].append(None)
-                result['lower'].append(None)
-                result['upper'].append(None)
-        
-        # 추가 정보
+        Returns:
+            Optional[pd.DataFrame]: 저장된 예측, 저장소가 없거나 조회되지 않으면 None
+        """
+        if self.forecast_store is None or self.data_version is None or 'PlayerID' not in player_data.columns:
+            return None
+        return self.forecast_store.lookup(player_data['PlayerID'].iloc[0], metric, self.data_version, periods,
+                                         self.backend)
+    
+    def _stored_result(self, player_data: pd.DataFrame, metric: str, forecast: pd.DataFrame,
+                       periods: int) -> Dict[str, Any]:
+        """저장된(또는 작업 프로세스에서 받은) 예측을 predict() 결과 형식으로 만듭니다."""
+        prophet_data = self.prepare_data(player_data.sort_values('Season'), metric)
+        result = self.format_forecast(prophet_data, forecast, periods)
         result['metric'] = metric
         result['player_name'] = player_data['PlayerName'].iloc[0]
-        result['model'] = model
-        result['forecast'] = forecast
-        
+        # 모델 객체는 이 프로세스에 없음
+        result['model'] = None
         return result
+    
+    def format_forecast(self, prophet_data: pd.DataFrame, forecast: pd.DataFrame, periods: int) -> Dict[str, Any]:
+        """
+        예측 결과를 시즌별 실제값/예측값/구간 배열로 정리합니다.
+        
+        Args:
+            prophet_data: 훈련 데이터 ('ds', 'y')
+            forecast: Prophet 예측 결과
+            periods: 예측한 미래 기간 (연도 수)
+            
+        Returns:
+            Dict[str, Any]: 예측 결과 (seasons, actual, predicted, lower, upper 배열과 forecast)
+        """
+        return assemble_forecast(prophet_data, forecast, periods)
 
-    @st.cache_data(ttl=3600)
-    def predict_multiple_metrics(self, player_data: pd.DataFrame, metrics: List[str], periods: int = 5) -> Dict[str, Dict[str, Any]]:
+    def predict_multiple_metrics(self, player_data: pd.DataFrame, metrics: List[str], periods: int = 5,
+                                 latency_budget: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
         """
-        여러 지표에 대한 예측을 수행합니다.
+        여러 지표에 대한 예측을 수행합니다. 예측 저장소에 있는 지표는 조회만 하고,
+        나머지는 예측 캐시(선수 기록이 바뀔 때만 무효화)를 거쳐 훈련합니다.
         
         Args:
             player_data: 선수 데이터
             metrics: 예측할 지표 리스트
             periods: 예측할 미래 기간 (연도 수)
+            latency_budget: 응답 시간 예산 (초, None이면 끝날 때까지 기다림)
             
         Returns:
             Dict[str, Dict[str, Any]]: 각 지표별 예측 결과
         """
         results = {}
         for metric in metrics:
-            results[metric] = self.predict(player_data, metric, periods)
-        return results
+            stored = self._lookup_stored(player_data, metric, periods)
+            if stored is not None:
+                results[metric] = self._stored_result(player_data, metric, stored, periods)
+        
+        # 저장소에 없는 지표만 훈련
+        missing = tuple(metric for metric in metrics if metric not in results)
+        if missing:
+            results.update(_predict_multiple_metrics(player_data, missing, periods, self.min_seasons, self.backend,
+                                                     latency_budget))
+        return {metric: results[metric] for metric in metrics if metric in results}
+
+
+def assemble_forecast(training_data: pd.DataFrame, forecast: pd.DataFrame, periods: int) -> Dict[str, Any]:
+    """
+    훈련 시즌과 미래 시즌에 예측값을 연도 기준으로 한 번에 결합합니다.
+    
+    같은 연도의 예측 행이 여러 개면 첫 행을 사용합니다. (학습 구간은 1월 1일 행, 미래 구간은
+    Prophet의 연말 날짜 행) 예측이 없는 시즌과 미래 시즌의 실제값은 NaN입니다.
+    
+    Args:
+        training_data: 훈련 데이터 ('ds', 'y')
+        forecast: 예측 결과 ('ds', 'yhat', 'yhat_lower', 'yhat_upper')
+        periods: 예측한 미래 기간 (연도 수)
+        
+    Returns:
+        Dict[str, Any]: seasons(int 배열), actual/predicted/lower/upper(float 배열), forecast
+    """
+    history_seasons = training_data['ds'].dt.year.to_numpy(dtype='int64')
+    last_season = history_seasons.max() if len(history_seasons) else 0
+    seasons = np.concatenate([history_seasons, last_season + np.arange(1, periods + 1)])
+    actual = np.concatenate([training_data['y'].to_numpy(dtype='float64', na_value=np.nan), np.full(periods, np.nan)])
+    
+    # 예측 연도별 첫 행 위치 → 시즌별 행 위치 (정렬된 연도에서 이진 탐색)
+    years, first_rows = np.unique(forecast['ds'].dt.year.to_numpy(dtype='int64'), return_index=True)
+    positions = np.searchsorted(years, seasons).clip(max=max(len(years) - 1, 0))
+    found = (years[positions] == seasons) if len(years) else np.zeros(len(seasons), dtype=bool)
+    rows = first_rows[positions[found]] if len(years) else positions[found]
+    
+    result = {'seasons': seasons, 'actual': actual}
+    for key, column in (('predicted', 'yhat'), ('lower', 'yhat_lower'), ('upper', 'yhat_upper')):
+        values = np.full(len(seasons), np.nan)
+        values[found] = forecast[column].to_numpy(dtype='float64')[rows]
+        result[key] = values
+    result['forecast'] = forecast
+    return result
+
+
+def _predict_multiple_metrics(player_data: pd.DataFrame, metrics: Tuple[str, ...],
+                              periods: int, min_seasons: int,
+                              backend: str = FORECAST_BACKEND,
+                              latency_budget: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 지표를 예측합니다. 예측 캐시에 없는 지표만 일괄 예측기에서 훈련합니다.
+    (감쇠 추세 백엔드는 한 번의 배열 적합, Prophet은 프로세스 풀에서 병렬 훈련)
+    
+    Args:
+        player_data: 선수 데이터
+        metrics: 예측할 지표 튜플
+        periods: 예측할 미래 기간 (연도 수)
+        min_seasons: 예측에 필요한 최소 시즌 수
+        backend: 예측 모델 백엔드
+        latency_budget: 응답 시간 예산 (초, None이면 끝날 때까지 기다림)
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: 각 지표별 예측 결과
+    """
+    model = PredictionModel(min_seasons=min_seasons, backend=backend)
+    if len(player_data) < min_seasons:
+        return {metric: model.predict(player_data, metric, periods) for metric in metrics}
+    
+    results = {}
+    jobs = make_jobs(player_data, metrics, periods, backend)
+    forecaster = get_batch_forecaster()
+    if latency_budget is None:
+        job_results = forecaster.iter_results(jobs, cache=get_forecast_cache())
+    else:
+        job_results = forecaster.iter_results_within(jobs, latency_budget, cache=get_forecast_cache())
+    for result in job_results:
+        metric = result.job.metric
+        fallback = result.source == "fallback"
+        if not result.ok:
+            results[metric] = {"error": result.error, "fallback": fallback}
+            continue
+        # 모델 객체는 작업 프로세스에 남기고 예측 결과만 전달받음
+        results[metric] = model._stored_result(player_data, metric, result.forecast, periods)
+        results[metric]['fallback'] = fallback
+    return {metric: results[metric] for metric in metrics if metric in results}
@@ -32,15 +32,15 @@ class TrendAnalyzer:
         # 리그 평균 계산
         league_avg = self.data_manager.calculate_league_averages(metrics, player_type)
         
-        # 각 윈도우 크기별 이동평균 계산
-        moving_avgs = {}
-        for window in window_sizes:
-            moving_avgs[window] = self.data_manager.calculate_moving_average(league_avg, metrics, window)
+        # 모든 윈도우 크기의 이동평균을 한 번에 계산
+        rolling_views = self.data_manager.get_rolling_views(league_avg, metrics, window_sizes)
+        moving_avgs = {window: rolling_views.frame(window) for window in window_sizes}
             
         # 결과 정리
         result = {
             'league_avg': league_avg,
             'moving_avgs': moving_avgs,
+            'rolling_views': rolling_views,
             'metrics': metrics,
             'player_type': player_type
         }
@@ -88,17 +88,20 @@ def view_player_stats(data: pd.DataFrame, data_manager: DataManager,
         lang: 언어 코드
         season: 특정 시즌 (None이면 모든 시즌)
     """
-    # 시즌 필터링
-    if season:
-        data = data[data['Season'] == season]
+    index = data_manager.get_index(player_type)
 
-    # 선수 선택
-    player_names = [""] + sorted(data['PlayerName'].unique())
+    # 선수 선택 (시즌 필터링 시 해당 시즌 선수만)
+    if season:
+        player_names = [""] + index.get_season_players(season)
+    else:
+        player_names = [""] + index.players
     player = st.selectbox(get_text('select_player', lang), player_names, index=0)
 
     if player:
         # 선수 데이터 조회
-        player_data = data[data['PlayerName'] == player].sort_values(by='Season')
+        player_data = index.get_player(player).sort_values(by='Season')
+        if season:
+            player_data = player_data[player_data['Season'] == season]
         
         # 리그 평균 계산
         league_avg = data_manager.calculate_league_averages(metrics, player_type)
@@ -154,7 +157,7 @@ def view_player_stats(data: pd.DataFrame, data_manager: DataManager,
                             latest_value = latest_data[metric]
                             latest_season = latest_data['Season']
                             
-                            season_data = data[data['Season'] == latest_season]
+                            season_data = index.get_season(latest_season)
                             fig = chart_components.create_histogram(season_data, metric, latest_value, lang=lang)
                             st.pyplot(fig)
                         except Exception as e:
@@ -176,13 +179,15 @@ def view_season_stats(data: pd.DataFrame, data_manager: DataManager,
         metrics: 표시할 메트릭 목록
         lang: 언어 코드
     """
+    index = data_manager.get_index(player_type)
+
     # 시즌 선택
-    seasons = sorted(data['Season'].unique(), reverse=True)
+    seasons = index.seasons[::-1]
     season = st.selectbox(get_text('select_season', lang), seasons)
 
     if season:
-        # 해당 시즌 데이터 필터링
-        season_data = data[data['Season'] == season]
+        # 해당 시즌 데이터 조회
+        season_data = index.get_season(season)
         
         # 리그 평균 계산
         league_avg = data_manager.calculate_league_averages(metrics, player_type)
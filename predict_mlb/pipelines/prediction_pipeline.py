@@ -1,9 +1,23 @@
 """
 예측 파이프라인 모듈: 예측 처리 파이프라인을 정의합니다.
+
+파이프라인은 작은 DAG로 실행됩니다. prepare()를 가진 단계는 선수 단위 준비로 모든 지표에
+한 번만 실행되고, 나머지 단계는 지표별 분기로 나뉘어 스레드 풀에서 동시에 실행됩니다.
+각 단계 결과는 입력 지문(선수 데이터 해시에서 단계마다 이어지는 키)으로 보관되어, 같은 입력의
+재실행은 해당 단계를 건너뜁니다. 단계별 실행 시간은 timings()로 확인합니다.
 """
-from typing import Dict, List, Any, Optional, Callable, Protocol
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Hashable, List, Any, Optional, Callable, Protocol, Tuple
 import pandas as pd
 
+from ..config.settings import FORECAST_BACKEND
+from ..models.forecasters import create_forecaster, predict_forecast
+from ..models.prediction_model import assemble_forecast
+
 class PredictionStep(Protocol):
     """예측 단계 프로토콜"""
     def execute(self, data: pd.DataFrame, metric: str) -> Any:
@@ -31,6 +45,27 @@ class DataPreparationStep:
         """
         self.min_seasons = min_seasons
         
+    def prepare(self, data: pd.DataFrame, metrics: List[str]) -> pd.DataFrame:
+        """
+        선수 단위 준비를 실행합니다. (파이프라인이 지표와 관계없이 한 번만 호출)
+        
+        Args:
+            data: 선수 데이터
+            metrics: 예측할 지표 리스트
+            
+        Returns:
+            pd.DataFrame: Season(datetime)과 지표 컬럼만 남긴 데이터
+            
+        Raises:
+            ValueError: 데이터가 부족한 경우
+        """
+        if len(data) < self.min_seasons:
+            raise ValueError(f"예측에 필요한 데이터가 부족합니다. 최소 {self.min_seasons}개 시즌이 필요합니다.")
+        
+        # 필요한 컬럼만 한 번 선택하고 시즌을 datetime으로 한 번만 변환
+        columns = ['Season'] + [metric for metric in dict.fromkeys(metrics) if metric in data.columns]
+        return data[columns].assign(Season=pd.to_datetime(data['Season'], format='%Y'))
+        
     def execute(self, data: pd.DataFrame, metric: str) -> pd.DataFrame:
         """
         데이터 준비 단계를 실행합니다.
@@ -49,25 +84,25 @@ class DataPreparationStep:
             raise ValueError(f"예측에 필요한 데이터가 부족합니다. 최소 {self.min_seasons}개 시즌이 필요합니다.")
             
         # 필요한 컬럼만 선택
-        prepared_data = data[['Season', metric]].copy()
+        prepared_data = data[['Season', metric]]
         
         # null 값 확인 및 처리
         if prepared_data[metric].isnull().any():
-            prepared_data[metric] = prepared_data[metric].fillna(prepared_data[metric].mean())
+            prepared_data = prepared_data.assign(**{metric: prepared_data[metric].fillna(prepared_data[metric].mean())})
             
         return prepared_data
 
 class ModelTrainingStep:
     """모델 훈련 단계"""
     
-    def __init__(self, model_factory: Callable[[], Any]):
+    def __init__(self, model_factory: Optional[Callable[[], Any]] = None):
         """
         ModelTrainingStep 클래스 초기화
         
         Args:
-            model_factory: 모델 객체를 생성하는 팩토리 함수
+            model_factory: 모델 객체를 생성하는 팩토리 함수 (None이면 설정의 FORECAST_BACKEND 예측기)
         """
-        self.model_factory = model_factory
+        self.model_factory = model_factory or partial(create_forecaster, FORECAST_BACKEND)
         
     def execute(self, data: pd.DataFrame, metric: str) -> Any:
         """
@@ -80,14 +115,15 @@ class ModelTrainingStep:
         Returns:
             Any: 훈련된 모델
         """
-        # Prophet 모델용 데이터프레임 변환
+        # 예측 모델용 데이터프레임 변환 ('ds', 'y')
         prophet_data = data.rename(columns={
             'Season': 'ds',
             metric: 'y'
         })
         
-        # ds 컬럼을 datetime 형식으로 변환
-        prophet_data['ds'] = pd.to_datetime(prophet_data['ds'], format='%Y')
+        # ds 컬럼을 datetime 형식으로 변환 (선수 단위 준비에서 이미 변환했으면 건너뜀)
+        if not pd.api.types.is_datetime64_any_dtype(prophet_data['ds']):
+            prophet_data['ds'] = pd.to_datetime(prophet_data['ds'], format='%Y')
         
         # 모델 생성 및 훈련
         model = self.model_factory()
@@ -101,42 +137,47 @@ class ModelTrainingStep:
 class PredictionExecutionStep:
     """예측 실행 단계"""
     
+    # 예측 기간에 따라 결과가 달라지는 단계 (파이프라인이 실행 시점의 예측 기간을 전달)
+    horizon_dependent = True
+    
     def __init__(self, periods: int = 5):
         """
         PredictionExecutionStep 클래스 초기화
         
         Args:
-            periods: 예측할 미래 기간 (연도 수)
+            periods: 기본 예측 기간 (연도 수, 실행 시 지정하지 않은 경우 사용)
         """
         self.periods = periods
         
-    def execute(self, model_data: Dict[str, Any], metric: str) -> Dict[str, Any]:
+    def execute(self, model_data: Dict[str, Any], metric: str, periods: Optional[int] = None) -> Dict[str, Any]:
         """
         예측 실행 단계를 실행합니다.
         
         Args:
             model_data: 모델 및 훈련 데이터
             metric: 예측할 지표
+            periods: 예측할 미래 기간 (None이면 기본 예측 기간)
             
         Returns:
             Dict[str, Any]: 예측 결과
         """
+        periods = periods or self.periods
         model = model_data['model']
         training_data = model_data['training_data']
         
         # 미래 예측을 위한 데이터프레임 생성
-        future = model.make_future_dataframe(periods=self.periods, freq='Y')
+        future = model.make_future_dataframe(periods=periods, freq='Y')
         
         # 예측 수행
-        forecast = model.predict(future)
+        forecast = predict_forecast(model, future)
         
         # 예측 결과 포맷팅
-        result = self._format_forecast(training_data, forecast, metric)
+        result = self._format_forecast(training_data, forecast, metric, periods)
         
         return result
     
     def _format_forecast(self, training_data: pd.DataFrame, forecast: pd.DataFrame, 
-                         metric: str) -> Dict[str, Any]:
+                         metric: str, periods: int) -> Dict[str, Any]:
         """
         예측 결과를 포맷팅합니다.
         
@@ -144,65 +185,36 @@ class PredictionExecutionStep:
             training_data: 훈련 데이터
             forecast: 예측 결과
             metric: 예측한 지표
+            periods: 예측한 미래 기간 (연도 수)
             
         Returns:
-            Dict[str, Any]: 포맷팅된 예측 결과
-        """
-        result = {
-            'seasons': [],
-            'actual': [],
-            'predicted': [],
-            'lower': [],
-            'upper': []
-        }
-        
-        # 실제 데이터
-        for i, row in training_data.iterrows():
-            season = row['ds'].year
-            result['seasons'].append(season)
-            result['actual'].append(row['y'])
-            
-            # 해당 시즌의 예측값 찾기
-            forecast_row = forecast[forecast['ds'] == row['ds']]
-            if not forecast_row.empty:
-                result['predicted'].append(forecast_row['yhat'].values[0])
-                result['lower'].append(forecast_row['yhat_lower'].values[0])
-                result['upper'].append(forecast_row['yhat_upper'].values[0])
-            else:
-                result['predicted'].append(None)
-                result['lower'].append(None)
-                result['upper'].append(None)
-        
-        # 미래 예측값
-        last_season = training_data['ds'].dt.year.max()
-        for i in range(1, self.periods + 1):
-            future_season = last_season + i
-            result['seasons'].append(future_season)
-            result['actual'].append(None)  # 미래 데이터는 실제값 없음
-            
-            # 예측값 찾기
-            forecast_row = forecast[forecast['ds'].dt.year == future_season]
-            if not forecast_row.empty:
-                result['predicted'].append(forecast_row['yhat'].values[0])
-                result['lower'].append(forecast_row['yhat_lower'].values[0])
-                result['upper'].append(forecast_row['yhat_upper'].values[0])
-            else:
-                result['predicted'].append(None)
-                result['lower'].append(None)
-                result['upper'].append(None)
+            Dict[str, Any]: 포맷팅된 예측 결과 (시즌별 배열)
+        """
+        result = assemble_forecast(training_data, forecast, periods)
         
         # 추가 정보
         result['metric'] = metric
-        result['forecast'] = forecast
         
         return result
 
 class PredictionPipeline:
     """예측 파이프라인"""
     
-    def __init__(self):
-        """PredictionPipeline 클래스 초기화"""
+    def __init__(self, max_fitted: int = 128, max_workers: int = 4):
+        """
+        PredictionPipeline 클래스 초기화
+        
+        Args:
+            max_fitted: 보관할 단계 결과 수 (같은 입력의 재실행은 보관된 단계 결과를 재사용)
+            max_workers: 지표별 분기를 동시에 실행할 스레드 수 (1이면 호출 스레드에서 순서대로 실행)
+        """
         self.steps = []
+        self.max_fitted = max_fitted
+        self.max_workers = max_workers
+        self._memo: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
         
     def add_step(self, step: PredictionStep) -> None:
         """
@@ -212,36 +224,158 @@ class PredictionPipeline:
             step: 추가할 예측 단계
         """
         self.steps.append(step)
+        with self._lock:
+            self._memo.clear()
+        
+    def _run_step(self, key: Hashable, step: Any, run: Callable[[], Any]) -> Any:
+        """
+        단계 하나를 실행하거나 보관된 결과를 반환하고 실행 시간을 기록합니다.
+        
+        Args:
+            key: 단계 입력 지문 (단계 위치, 지표, 이전 단계 키, 예측 기간)
+            step: 실행할 단계
+            run: 단계 실행 함수
+            
+        Returns:
+            Any: 단계 결과
+        """
+        name = type(step).__name__
+        with self._lock:
+            timing = self._timings.setdefault(name, {'runs': 0, 'hits': 0, 'seconds': 0.0})
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                timing['hits'] += 1
+                return self._memo[key]
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            timing['runs'] += 1
+            timing['seconds'] += elapsed
+            self._memo[key] = result
+            while len(self._memo) > self.max_fitted:
+                self._memo.popitem(last=False)
+        return result
         
-    def execute(self, player_data: pd.DataFrame, metrics: List[str]) -> Dict[str, Any]:
+    def _prepare(self, player_data: pd.DataFrame, metrics: List[str]) -> Tuple[Any, Hashable]:
+        """
+        선수 단위 준비 단계들을 한 번 실행합니다.
+        
+        Args:
+            player_data: 선수 데이터
+            metrics: 예측할 지표 리스트
+            
+        Returns:
+            Tuple[Any, Hashable]: 준비된 데이터와 그 지문
+        """
+        key: Hashable = int(pd.util.hash_pandas_object(player_data, index=False).sum())
+        current_data = player_data
+        for index, step in enumerate(self.steps):
+            if not hasattr(step, 'prepare'):
+                continue
+            key = ('prepare', index, key, tuple(metrics))
+            current_data = self._run_step(key, step, partial(step.prepare, current_data, metrics))
+        return current_data, key
+        
+    def _run_branch(self, data: Any, key: Hashable, metric: str, periods: Optional[int]) -> Any:
+        """
+        지표 하나의 단계들을 실행합니다.
+        
+        Args:
+            data: 선수 단위 준비 결과
+            key: 준비 결과의 지문
+            metric: 예측할 지표
+            periods: 예측할 미래 기간 (None이면 각 단계의 기본값)
+            
+        Returns:
+            Any: 마지막 단계의 결과
+        """
+        current_data = data
+        for index, step in enumerate(self.steps):
+            if getattr(step, 'horizon_dependent', False):
+                key = (index, metric, key, periods)
+                run = partial(step.execute, current_data, metric, periods=periods)
+            else:
+                key = (index, metric, key)
+                run = partial(step.execute, current_data, metric)
+            current_data = self._run_step(key, step, run)
+        return current_data
+        
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """지표별 분기 스레드 풀을 반환합니다. (처음 사용할 때 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="prediction-pipeline")
+            return self._executor
+        
+    def execute(self, player_data: pd.DataFrame, metrics: List[str],
+                periods: Optional[int] = None) -> Dict[str, Any]:
         """
         예측 파이프라인을 실행합니다.
         
         Args:
             player_data: 선수 데이터
             metrics: 예측할 지표 리스트
+            periods: 예측할 미래 기간 (None이면 각 단계의 기본값)
             
         Returns:
             Dict[str, Any]: 각 지표별 예측 결과
         """
-        results = {}
+        player_name = player_data['PlayerName'].iloc[0]
+        try:
+            prepared, key = self._prepare(player_data, metrics)
+        except Exception as e:
+            # 선수 단위 준비가 실패하면 모든 지표에 같은 오류 정보 저장
+            return {metric: {'error': str(e), 'player_name': player_name} for metric in metrics}
         
+        # 지표별 분기 실행 (여러 지표면 스레드 풀에서 동시에)
+        if self.max_workers > 1 and len(metrics) > 1:
+            executor = self._get_executor()
+            futures = {metric: executor.submit(self._run_branch, prepared, key, metric, periods) for metric in metrics}
+            outcomes = {}
+            for metric, future in futures.items():
+                try:
+                    outcomes[metric] = future.result()
+                except Exception as e:
+                    outcomes[metric] = e
+        else:
+            outcomes = {}
+            for metric in metrics:
+                try:
+                    outcomes[metric] = self._run_branch(prepared, key, metric, periods)
+                except Exception as e:
+                    outcomes[metric] = e
+        
+        results = {}
         for metric in metrics:
-            try:
-                # 파이프라인 단계 실행
-                current_data = player_data
-                for step in self.steps:
-                    current_data = step.execute(current_data, metric)
-                
-                # 결과 저장
-                results[metric] = current_data
-                results[metric]['player_name'] = player_data['PlayerName'].iloc[0]
-                
-            except Exception as e:
+            outcome = outcomes[metric]
+            if isinstance(outcome, Exception):
                 # 오류 발생 시 오류 정보 저장
                 results[metric] = {
-                    'error': str(e),
-                    'player_name': player_data['PlayerName'].iloc[0]
+                    'error': str(outcome),
+                    'player_name': player_name
                 }
+                continue
+            # 보관된 단계 결과를 건드리지 않도록 최상위 키는 복사
+            results[metric] = dict(outcome) if isinstance(outcome, dict) else outcome
+            results[metric]['player_name'] = player_name
                 
         return results
+        
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """
+        단계별 실행 통계를 반환합니다.
+        
+        Returns:
+            Dict[str, Dict[str, float]]: 단계 이름 → 실행 횟수(runs), 재사용 횟수(hits), 실행 시간 합(seconds)
+        """
+        with self._lock:
+            return {name: dict(timing) for name, timing in self._timings.items()}
+        
+    def shutdown(self) -> None:
+        """지표별 분기 스레드 풀을 종료합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
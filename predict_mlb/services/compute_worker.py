@@ -0,0 +1,503 @@
+"""
+계산 작업자 서비스 모듈: 예측 훈련을 Streamlit 서버 프로세스 밖의 작업자 프로세스에서 실행합니다.
+
+Streamlit 페이지는 예측 작업을 ComputeService에 제출하고 결과를 기다리기만 하므로, Prophet/Stan
+훈련이 CPU와 GIL을 오래 잡아도 같은 서버의 다른 세션은 영향을 받지 않습니다.
+
+- 우선순위: 대기 작업은 우선순위 힙에 들어가 대화형 요청(INTERACTIVE)이 일괄 작업(BATCH)보다
+  먼저 작업자에 배정됩니다.
+- 제한 시간: 작업마다 마감 시각을 두고, 넘기면 해당 작업자 프로세스를 종료하고 새로 띄웁니다.
+- 취소: 대기 중인 작업은 힙에서 건너뛰고, 실행 중인 작업은 작업자를 종료해서 CPU를 바로 돌려받습니다.
+  (Stan 최적화는 중간에 멈출 수 없으므로 프로세스 단위로 취소)
+
+- 예열: 작업자는 오래 살아 있는 프로세스로, 시작할 때 Prophet을 불러오고 작은 예열 적합을 한 번
+  실행해 Stan 실행 파일과 모듈을 올려 둡니다. 이후 요청은 파이프로 받아 적합 시간만 듭니다.
+- 상태 확인: 유휴 작업자에 주기적으로 ping을 보내 제한 시간 안에 응답하지 않거나 죽은 작업자는
+  새로 띄웁니다.
+
+감독 스레드 하나가 작업자 파이프들과 깨우기용 파이프를 multiprocessing.connection.wait로 함께
+기다리며 배정, 결과 수신, 마감/취소, 상태 확인을 모두 맡습니다.
+"""
+import heapq
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, as_completed
+from multiprocessing.connection import Connection, wait
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config.settings import (COMPUTE_HEALTH_CHECK_INTERVAL, COMPUTE_HEALTH_CHECK_TIMEOUT, COMPUTE_JOB_TIMEOUT,
+                               COMPUTE_WARM_UP, COMPUTE_WORKERS)
+from ..models.batch_forecaster import (BatchForecaster, ForecastJob, ForecastResult, default_max_workers,
+                                       init_worker_process, limit_native_threads, run_job)
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (작을수록 먼저 실행)
+INTERACTIVE = 0
+BATCH = 10
+
+
+# 상태 확인 메시지의 작업 번호
+PING = -1
+
+# 예열 적합용 작은 시계열
+WARM_UP_JOB = ForecastJob("warm-up", "warm-up", tuple(range(2014, 2024)),
+                          (0.71, 0.74, 0.69, 0.77, 0.73, 0.70, 0.76, 0.72, 0.75, 0.71), periods=1, backend="prophet")
+
+
+def _worker_main(conn: Connection, warm_up: bool) -> None:
+    """작업자 프로세스 본체: (작업 번호, 작업)을 받아 (작업 번호, 결과)를 돌려줍니다."""
+    init_worker_process()
+    if warm_up:
+        # 첫 요청이 Stan 실행 파일 로드와 초기화 비용을 내지 않도록 미리 한 번 적합
+        run_job(WARM_UP_JOB, use_registry=False)
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        task_id, job = message
+        if task_id == PING:
+            conn.send((PING, os.getpid()))
+            continue
+        conn.send((task_id, run_job(job)))
+
+
+class ComputeTicket:
+    """제출된 작업 하나 (결과 대기와 취소에 사용)"""
+
+    def __init__(self, service: 'ComputeService', task_id: int, job: ForecastJob, priority: int,
+                 timeout: Optional[float]):
+        """
+        ComputeTicket 클래스 초기화
+
+        Args:
+            service: 작업을 제출한 서비스
+            task_id: 작업 번호
+            job: 예측 작업
+            priority: 우선순위
+            timeout: 실행 제한 시간 (초, None이면 무제한)
+        """
+        self.service = service
+        self.task_id = task_id
+        self.job = job
+        self.priority = priority
+        self.timeout = timeout
+        self.future: "Future[ForecastResult]" = Future()
+        self.cancel_requested = False
+
+    def cancel(self) -> None:
+        """작업을 취소합니다. (대기 중이면 건너뛰고, 실행 중이면 작업자를 종료)"""
+        self.service.cancel(self)
+
+    def done(self) -> bool:
+        """작업이 끝났는지 여부"""
+        return self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> ForecastResult:
+        """
+        작업 결과를 기다려 반환합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            ForecastResult: 예측 결과 (제한 시간 초과/취소/작업자 오류는 error에 메시지)
+        """
+        if self.future.cancelled():
+            return ForecastResult(self.job, error="예측 작업이 취소되었습니다.")
+        return self.future.result(timeout)
+
+
+class _Worker:
+    """작업자 프로세스 하나와 현재 배정된 작업"""
+
+    def __init__(self, context: multiprocessing.context.BaseContext, warm_up: bool = True):
+        """
+        _Worker 클래스 초기화 (프로세스를 바로 시작)
+
+        Args:
+            context: multiprocessing 컨텍스트
+            warm_up: 시작할 때 예열 적합을 실행할지 여부
+        """
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, warm_up), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.ticket: Optional[ComputeTicket] = None
+        self.deadline: Optional[float] = None
+        self.started_at = time.monotonic()
+        self.last_seen = self.started_at
+        self.ping_deadline: Optional[float] = None
+        self.jobs_done = 0
+
+    @property
+    def busy(self) -> bool:
+        """작업 실행 중이거나 상태 확인 응답을 기다리는 중인지 여부"""
+        return self.ticket is not None or self.ping_deadline is not None
+
+    def kill(self) -> None:
+        """작업자 프로세스를 즉시 종료합니다."""
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self) -> None:
+        """작업자 프로세스에 종료를 요청합니다. (응답이 없으면 강제 종료)"""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ComputeService:
+    """우선순위/제한 시간/취소를 지원하는 작업자 프로세스 서비스 클래스"""
+
+    def __init__(self, num_workers: Optional[int] = None, default_timeout: Optional[float] = COMPUTE_JOB_TIMEOUT,
+                 mp_context: str = "spawn", warm_up: bool = bool(COMPUTE_WARM_UP),
+                 health_check_interval: float = COMPUTE_HEALTH_CHECK_INTERVAL,
+                 health_check_timeout: float = COMPUTE_HEALTH_CHECK_TIMEOUT):
+        """
+        ComputeService 클래스 초기화 (작업자는 start() 또는 첫 작업 제출 시 시작)
+
+        Args:
+            num_workers: 작업자 프로세스 수 (None이면 설정값, 설정이 0이면 사용 가능한 코어 수)
+            default_timeout: 기본 작업 제한 시간 (초, None이면 무제한)
+            mp_context: multiprocessing 시작 방식 (Streamlit 스레드에서 fork는 안전하지 않으므로 spawn)
+            warm_up: 작업자 시작 시 예열 적합을 실행할지 여부
+            health_check_interval: 유휴 작업자 상태 확인 주기 (초, 0이면 확인하지 않음)
+            health_check_timeout: 상태 확인 응답 제한 시간 (초, 예열 중인 작업자는 이 시간 안에 예열을 마쳐야 함)
+        """
+        self.num_workers = num_workers or COMPUTE_WORKERS or default_max_workers()
+        self.default_timeout = default_timeout
+        self.warm_up = warm_up
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.context = multiprocessing.get_context(mp_context)
+        self._heap: List[tuple] = []
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._wake_lock = threading.Lock()
+        self._wake_reader, self._wake_writer = self.context.Pipe(duplex=False)
+        self._workers: List[_Worker] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"submitted": 0, "completed": 0, "timeouts": 0, "cancelled": 0, "worker_restarts": 0,
+                       "health_checks": 0, "unhealthy": 0}
+        self._next_health_check = time.monotonic() + health_check_interval
+
+    def _ensure_started(self) -> None:
+        """감독 스레드를 시작합니다. (잠금 상태에서 호출)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="compute-supervisor", daemon=True)
+            self._thread.start()
+
+    def start(self) -> None:
+        """
+        작업자들을 미리 띄웁니다. (첫 요청 전에 예열을 끝내 두려는 경우)
+
+        Raises:
+            RuntimeError: 종료된 서비스인 경우
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("종료된 계산 서비스입니다.")
+            self._ensure_started()
+
+    def _wake(self) -> None:
+        """감독 스레드를 깨웁니다."""
+        with self._wake_lock:
+            try:
+                self._wake_writer.send_bytes(b"1")
+            except (OSError, ValueError):
+                pass
+
+    def submit(self, job: ForecastJob, priority: int = INTERACTIVE, timeout: Optional[float] = None) -> ComputeTicket:
+        """
+        예측 작업을 제출합니다.
+
+        Args:
+            job: 예측 작업
+            priority: 우선순위 (INTERACTIVE 또는 BATCH, 작을수록 먼저)
+            timeout: 실행 제한 시간 (초, None이면 기본값)
+
+        Returns:
+            ComputeTicket: 결과 대기/취소용 티켓
+
+        Raises:
+            RuntimeError: 종료된 서비스인 경우
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("종료된 계산 서비스입니다.")
+            task_id = next(self._task_ids)
+            ticket = ComputeTicket(self, task_id, job, priority, timeout if timeout is not None else self.default_timeout)
+            heapq.heappush(self._heap, (priority, task_id, ticket))
+            self._stats["submitted"] += 1
+            self._ensure_started()
+        self._wake()
+        return ticket
+
+    def cancel(self, ticket: ComputeTicket) -> None:
+        """
+        작업을 취소합니다.
+
+        Args:
+            ticket: 취소할 작업의 티켓
+        """
+        with self._lock:
+            if ticket.future.done() or ticket.cancel_requested:
+                return
+            ticket.cancel_requested = True
+            # 아직 배정되지 않은 작업은 바로 취소 (힙에서는 꺼낼 때 건너뜀)
+            if ticket.future.cancel():
+                self._stats["cancelled"] += 1
+        self._wake()
+
+    def iter_results(self, jobs: List[ForecastJob], priority: int = INTERACTIVE,
+                     timeout: Optional[float] = None) -> Iterator[ForecastResult]:
+        """
+        작업들을 제출하고 끝나는 순서대로 결과를 돌려줍니다. 중간에 반복을 멈추면(세션 이동 등)
+        남은 작업은 취소됩니다.
+
+        Args:
+            jobs: 예측 작업 목록
+            priority: 우선순위
+            timeout: 작업당 실행 제한 시간 (초, None이면 기본값)
+
+        Returns:
+            Iterator[ForecastResult]: 완료 순서대로의 예측 결과
+        """
+        tickets = [self.submit(job, priority, timeout) for job in jobs]
+        by_future = {ticket.future: ticket for ticket in tickets}
+        try:
+            for future in as_completed(by_future):
+                yield by_future[future].result()
+        finally:
+            for ticket in tickets:
+                if not ticket.done():
+                    ticket.cancel()
+
+    def _run(self) -> None:
+        """감독 스레드 본체"""
+        limit_native_threads()
+        self._workers = [_Worker(self.context, self.warm_up) for _ in range(self.num_workers)]
+        logger.info(f"계산 작업자 {self.num_workers}개 시작")
+        while True:
+            with self._lock:
+                if self._closed:
+                    break
+            self._dispatch()
+            self._check_health()
+            busy = [worker for worker in self._workers if worker.busy]
+            deadlines = [deadline for worker in busy for deadline in (worker.deadline, worker.ping_deadline)
+                         if deadline is not None]
+            if self.health_check_interval > 0:
+                deadlines.append(self._next_health_check)
+            wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = wait([self._wake_reader] + [worker.conn for worker in busy], wait_timeout)
+            for conn in ready:
+                if conn is self._wake_reader:
+                    while self._wake_reader.poll():
+                        self._wake_reader.recv_bytes()
+                    continue
+                worker = next(worker for worker in busy if worker.conn is conn)
+                self._receive(worker)
+            self._check_running()
+
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+
+    def _dispatch(self) -> None:
+        """대기 중인 작업을 우선순위 순서대로 쉬는 작업자에 배정합니다."""
+        idle = [worker for worker in self._workers if not worker.busy]
+        while idle:
+            with self._lock:
+                if not self._heap:
+                    return
+                _, _, ticket = heapq.heappop(self._heap)
+                # 취소된 작업은 건너뜀
+                if not ticket.future.set_running_or_notify_cancel():
+                    continue
+            worker = idle.pop()
+            worker.ticket = ticket
+            worker.deadline = time.monotonic() + ticket.timeout if ticket.timeout else None
+            try:
+                worker.conn.send((ticket.task_id, ticket.job))
+            except (OSError, ValueError) as e:
+                self._restart(worker, ForecastResult(ticket.job, error=f"계산 작업자 오류: {e}"))
+
+    def _receive(self, worker: _Worker) -> None:
+        """작업자의 결과(또는 상태 확인 응답)를 받아 티켓을 완료합니다."""
+        ticket = worker.ticket
+        try:
+            task_id, result = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            # 작업자 프로세스가 죽은 경우
+            self._restart(worker, ForecastResult(ticket.job, error=f"계산 작업자가 종료되었습니다: {e}")
+                          if ticket is not None else None)
+            return
+        worker.last_seen = time.monotonic()
+        if task_id == PING:
+            worker.ping_deadline = None
+            return
+        worker.ticket = None
+        worker.deadline = None
+        worker.jobs_done += 1
+        if ticket is not None and task_id == ticket.task_id:
+            with self._lock:
+                self._stats["completed"] += 1
+            ticket.future.set_result(result)
+
+    def _check_health(self) -> None:
+        """응답하지 않거나 죽은 유휴 작업자를 새로 띄우고, 주기가 되면 유휴 작업자에 ping을 보냅니다."""
+        if self.health_check_interval <= 0:
+            return
+        now = time.monotonic()
+        for worker in list(self._workers):
+            if worker.ticket is not None:
+                continue
+            if not worker.process.is_alive() or (worker.ping_deadline is not None and now >= worker.ping_deadline):
+                with self._lock:
+                    self._stats["unhealthy"] += 1
+                logger.warning(f"계산 작업자 응답 없음, 다시 시작합니다 (pid {worker.process.pid})")
+                self._restart(worker, None)
+        if now < self._next_health_check:
+            return
+        self._next_health_check = now + self.health_check_interval
+        for worker in self._workers:
+            if worker.busy:
+                continue
+            try:
+                worker.conn.send((PING, None))
+            except (OSError, ValueError):
+                worker.ping_deadline = now
+                continue
+            worker.ping_deadline = now + self.health_check_timeout
+            with self._lock:
+                self._stats["health_checks"] += 1
+
+    def _check_running(self) -> None:
+        """제한 시간을 넘기거나 취소된 실행 중 작업의 작업자를 새로 띄웁니다."""
+        now = time.monotonic()
+        for worker in list(self._workers):
+            ticket = worker.ticket
+            if ticket is None:
+                continue
+            if ticket.cancel_requested:
+                with self._lock:
+                    self._stats["cancelled"] += 1
+                self._restart(worker, ForecastResult(ticket.job, error="예측 작업이 취소되었습니다."))
+            elif worker.deadline is not None and now >= worker.deadline:
+                with self._lock:
+                    self._stats["timeouts"] += 1
+                logger.warning(f"예측 작업 제한 시간 초과: {ticket.job.player_name} {ticket.job.metric}")
+                self._restart(worker, ForecastResult(ticket.job, error=f"예측 시간이 {ticket.timeout:g}초를 넘었습니다."))
+
+    def _restart(self, worker: _Worker, result: Optional[ForecastResult]) -> None:
+        """작업자를 종료하고 새로 띄운 뒤, 배정되어 있던 작업을 주어진 결과로 완료합니다."""
+        ticket = worker.ticket
+        worker.kill()
+        index = self._workers.index(worker)
+        self._workers[index] = _Worker(self.context, self.warm_up)
+        with self._lock:
+            self._stats["worker_restarts"] += 1
+        if ticket is not None and result is not None and not ticket.future.done():
+            ticket.future.set_result(result)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        서비스 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 제출/완료/제한 시간 초과/취소 작업 수, 작업자 재시작 수, 대기 작업 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["queued"] = sum(1 for _, _, ticket in self._heap if not ticket.future.done())
+        return stats
+
+    def workers(self) -> List[Dict[str, Any]]:
+        """
+        작업자별 상태를 반환합니다.
+
+        Returns:
+            List[Dict[str, Any]]: pid, 생존 여부, 실행 중 여부, 처리한 작업 수, 가동 시간과 마지막 응답 후 경과 시간 (초)
+        """
+        now = time.monotonic()
+        return [{
+            "pid": worker.process.pid,
+            "alive": worker.process.is_alive(),
+            "busy": worker.ticket is not None,
+            "jobs_done": worker.jobs_done,
+            "uptime": now - worker.started_at,
+            "last_seen": now - worker.last_seen,
+        } for worker in list(self._workers)]
+
+    def shutdown(self) -> None:
+        """서비스를 종료합니다. 대기 중인 작업은 취소됩니다."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending, self._heap = self._heap, []
+            thread = self._thread
+        for _, _, ticket in pending:
+            ticket.future.cancel()
+        self._wake()
+        if thread is not None:
+            thread.join(timeout=10)
+
+
+_service: Optional[ComputeService] = None
+_interactive_forecaster: Optional[BatchForecaster] = None
+_service_lock = threading.Lock()
+
+
+def get_compute_service() -> ComputeService:
+    """
+    프로세스 전역 계산 서비스를 반환합니다.
+
+    Returns:
+        ComputeService: 계산 서비스 싱글톤
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ComputeService()
+            # 첫 요청 전에 작업자 예열이 끝나도록 바로 시작
+            _service.start()
+            import atexit
+            atexit.register(_service.shutdown)
+        return _service
+
+
+def get_interactive_forecaster() -> BatchForecaster:
+    """
+    예측 페이지용 일괄 예측기를 반환합니다. (감쇠 추세 작업은 바로 적합하고, 나머지는
+    계산 서비스에 대화형 우선순위로 제출)
+
+    계산 서비스는 감쇠 추세가 아닌 작업이 처음 들어올 때 만들어지므로, 기본 백엔드('damped')만
+    쓰는 동안에는 작업자 프로세스를 시작하지 않습니다.
+
+    Returns:
+        BatchForecaster: 계산 서비스를 사용하는 일괄 예측기 싱글톤
+    """
+    global _interactive_forecaster
+    with _service_lock:
+        if _interactive_forecaster is None:
+            _interactive_forecaster = BatchForecaster(service_factory=get_compute_service)
+        return _interactive_forecaster
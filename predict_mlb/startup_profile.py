@@ -0,0 +1,163 @@
+"""
+시작 시간 프로파일 모듈: 모듈 import 비용을 측정하고 예산 초과 여부를 보고합니다.
+
+새 인터프리터에서 `python -X importtime`으로 대상 모듈을 import한 뒤, 모듈별 누적
+import 시간과 최상위 패키지별 합계를 출력합니다.
+
+사용 예:
+    python -m predict_mlb.startup_profile                 # app, search, trend, predict
+    python -m predict_mlb.startup_profile app --budget-ms 1000
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+# 기본 측정 대상 (앱 진입점과 페이지 모듈)
+DEFAULT_TARGETS = ["app", "search", "trend", "predict"]
+
+# 서버 시작 시 지연 로드되어야 하는 무거운 패키지
+HEAVY_PACKAGES = ["prophet", "cmdstanpy", "matplotlib", "seaborn", "plotly"]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class ImportRecord:
+    """모듈 하나의 import 측정값"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    `-X importtime` 출력을 파싱합니다.
+
+    Args:
+        output: 인터프리터의 stderr 출력
+
+    Returns:
+        List[ImportRecord]: 모듈별 측정값 (출력 순서)
+    """
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def measure_import(target: str) -> Tuple[List[ImportRecord], Set[str]]:
+    """
+    새 인터프리터에서 대상 모듈을 import하고 측정값을 반환합니다.
+
+    Args:
+        target: import할 모듈 이름
+
+    Returns:
+        Tuple[List[ImportRecord], Set[str]]: 모듈별 측정값, import 후 로드되어 있는 최상위 패키지
+
+    Raises:
+        RuntimeError: import에 실패한 경우
+    """
+    # importtime 출력에는 실패한 선택적 import 시도도 포함되므로, 실제 로드 여부는 sys.modules로 확인
+    code = f"import sys, {target}; print('\\n'.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    records = parse_importtime(proc.stderr)
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"{target} import 실패:\n" + "\n".join(errors[-5:]))
+    return records, set(proc.stdout.split())
+
+
+def summarize(records: List[ImportRecord], loaded: Set[str], target: str, top: int = 15) -> Dict[str, object]:
+    """
+    측정값을 요약합니다.
+
+    Args:
+        records: 모듈별 측정값
+        loaded: import 후 로드되어 있는 최상위 패키지
+        target: 측정 대상 모듈
+        top: 표시할 상위 모듈 수
+
+    Returns:
+        Dict[str, object]: 총 시간(ms), 상위 모듈, 패키지별 합계, 로드된 무거운 패키지
+    """
+    total_us = next((r.cumulative_us for r in records if r.module == target), 0)
+    by_package: Dict[str, int] = defaultdict(int)
+    for record in records:
+        by_package[record.module.split(".")[0]] += record.self_us
+
+    return {
+        "total_ms": total_us / 1000,
+        "top_modules": sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top],
+        "packages": sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top],
+        "heavy_loaded": [pkg for pkg in HEAVY_PACKAGES if pkg in loaded],
+    }
+
+
+def print_report(target: str, summary: Dict[str, object], budget_ms: Optional[float]) -> bool:
+    """
+    요약을 출력합니다.
+
+    Args:
+        target: 측정 대상 모듈
+        summary: summarize() 결과
+        budget_ms: 허용 import 시간 (밀리초, None이면 검사하지 않음)
+
+    Returns:
+        bool: 예산 이내이면 True
+    """
+    total_ms = summary["total_ms"]
+    within_budget = budget_ms is None or total_ms <= budget_ms
+    status = "" if budget_ms is None else (" (예산 이내)" if within_budget else f" (예산 {budget_ms:.0f} ms 초과)")
+
+    print(f"\n=== import {target}: {total_ms:,.1f} ms{status} ===")
+    print(f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+    for record in summary["top_modules"]:
+        print(f"{record.cumulative_us / 1000:>10.1f} {record.self_us / 1000:>10.1f}  {'  ' * record.depth}{record.module}")
+
+    print(f"\n{'자체 합계(ms)':>12}  최상위 패키지")
+    for package, self_us in summary["packages"]:
+        print(f"{self_us / 1000:>12.1f}  {package}")
+
+    heavy = summary["heavy_loaded"]
+    print(f"\n시작 시 로드된 무거운 패키지: {', '.join(heavy) if heavy else '없음'}")
+    return within_budget
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="모듈 import 시간 예산 보고서")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="측정할 모듈 (기본: app search trend predict)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="모듈별 허용 import 시간 (밀리초)")
+    parser.add_argument("--top", type=int, default=15, help="표시할 상위 모듈 수")
+    args = parser.parse_args(argv)
+
+    all_within_budget = True
+    for target in args.targets:
+        try:
+            records, loaded = measure_import(target)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            all_within_budget = False
+            continue
+        all_within_budget &= print_report(target, summarize(records, loaded, target, args.top), args.budget_ms)
+
+    return 0 if all_within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
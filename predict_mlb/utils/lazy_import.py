@@ -0,0 +1,100 @@
+"""
+지연 import 모듈: 무거운 의존성(Prophet, matplotlib, seaborn, plotly)을 실제로 사용할 때 로드합니다.
+
+`plt = lazy_import("matplotlib.pyplot")`처럼 모듈 수준에서 선언해 두면, 첫 속성 접근
+시점에 import가 일어나므로 서버 시작이나 페이지 모듈 import 비용에 포함되지 않습니다.
+"""
+import importlib
+import logging
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 지연 import가 실제로 일어난 시점의 소요 시간 (모듈명 → 초)
+_import_timings: Dict[str, float] = {}
+_import_lock = threading.Lock()
+
+
+class LazyModule:
+    """첫 속성 접근 시 실제 모듈을 import하는 모듈 프록시 클래스"""
+
+    def __init__(self, name: str):
+        """
+        LazyModule 클래스 초기화
+
+        Args:
+            name: import할 모듈 이름 (예: "matplotlib.pyplot")
+        """
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_module", None)
+
+    def _load(self) -> ModuleType:
+        """실제 모듈을 import해서 반환합니다. (프로세스당 한 번)"""
+        module = self._lazy_module
+        if module is None:
+            with _import_lock:
+                module = self._lazy_module
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._lazy_name)
+                    elapsed = time.perf_counter() - start
+                    _import_timings.setdefault(self._lazy_name, elapsed)
+                    logger.debug(f"지연 import: {self._lazy_name} ({elapsed * 1000:.1f} ms)")
+                    object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module '{self._lazy_name}' ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """
+    모듈을 지연 import합니다. 이미 로드된 모듈이면 그대로 반환합니다.
+
+    Args:
+        name: 모듈 이름
+
+    Returns:
+        Any: 모듈 또는 LazyModule 프록시
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    """
+    모듈이 현재 프로세스에 로드되어 있는지 확인합니다.
+
+    Args:
+        name: 모듈 이름
+
+    Returns:
+        bool: 로드 여부
+    """
+    return name in sys.modules
+
+
+def get_import_timings() -> Dict[str, float]:
+    """
+    지연 import가 실제로 일어난 모듈과 소요 시간을 반환합니다.
+
+    Returns:
+        Dict[str, float]: 모듈명 → 소요 시간(초)
+    """
+    return dict(_import_timings)
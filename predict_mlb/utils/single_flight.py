@@ -0,0 +1,170 @@
+"""
+단일 실행(single-flight) 모듈: 같은 키의 동시 요청을 하나의 계산으로 합칩니다.
+
+여러 Streamlit 세션이 같은 선수/지표 예측을 동시에 요청하면, 처음 요청한 스레드만 계산하고
+나머지는 그 계산이 끝나기를 기다려 같은 결과(또는 같은 예외)를 받습니다. 계산이 끝나면 키는
+바로 비워지므로 결과 보관은 캐시가 맡고, 이 계층은 동시에 진행 중인 중복 계산만 없앱니다.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class Flight:
+    """진행 중인 계산 하나 (대기자들이 결과를 공유)"""
+
+    def __init__(self):
+        """Flight 클래스 초기화"""
+        self._done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """
+        계산이 끝날 때까지 기다려 결과를 반환합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            Any: 계산 결과
+
+        Raises:
+            TimeoutError: 시간 안에 끝나지 않은 경우
+            BaseException: 계산에서 발생한 예외
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("진행 중인 계산을 기다리는 시간이 초과되었습니다.")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """키별 단일 실행 그룹 클래스"""
+
+    def __init__(self, name: str = "default"):
+        """
+        SingleFlight 클래스 초기화
+
+        Args:
+            name: 그룹 이름 (통계 표시용)
+        """
+        self.name = name
+        self._flights: Dict[Hashable, Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0}
+
+    def begin(self, key: Hashable) -> Tuple[Flight, bool]:
+        """
+        키의 계산에 참여합니다.
+
+        Args:
+            key: 요청 키
+
+        Returns:
+            Tuple[Flight, bool]: 진행 중인 계산과 선행자 여부 (True면 계산 후 finish()를 호출해야 함)
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self._stats["coalesced"] += 1
+                return flight, False
+            flight = self._flights[key] = Flight()
+            self._stats["executions"] += 1
+            return flight, True
+
+    def finish(self, key: Hashable, flight: Flight, result: Any = None,
+               error: Optional[BaseException] = None) -> None:
+        """
+        선행자가 계산 결과를 알리고 키를 비웁니다.
+
+        Args:
+            key: 요청 키
+            flight: begin()이 돌려준 계산
+            result: 계산 결과
+            error: 계산 중 발생한 예외 (대기자에게 그대로 전달)
+        """
+        flight.result = result
+        flight.error = error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if error is not None:
+                self._stats["errors"] += 1
+        flight._done.set()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        같은 키의 계산이 진행 중이면 기다려 결과를 공유하고, 없으면 직접 계산합니다.
+
+        Args:
+            key: 요청 키
+            fn: 계산 함수
+            timeout: 대기자의 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            Any: 계산 결과 (대기자들과 같은 객체)
+        """
+        flight, leader = self.begin(key)
+        if not leader:
+            return flight.wait(timeout)
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result)
+        return result
+
+    def in_flight(self) -> int:
+        """진행 중인 계산 수"""
+        with self._lock:
+            return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        단일 실행 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 요청 수, 실제 계산 수, 합쳐진 요청 수, 오류 수, 진행 중인 계산 수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._flights)
+        return stats
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    이름별 프로세스 전역 단일 실행 그룹을 반환합니다.
+
+    Args:
+        name: 그룹 이름 (예: "predict", "forecast_job")
+
+    Returns:
+        SingleFlight: 단일 실행 그룹
+    """
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = SingleFlight(name)
+        return group
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """
+    모든 단일 실행 그룹의 통계를 반환합니다.
+
+    Returns:
+        Dict[str, Dict[str, int]]: 그룹 이름 → 통계
+    """
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
@@ -7,8 +7,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
-import os
 from config import DATA_DIR, BATTER_STATS_FILE, PITCHER_STATS_FILE
+from predict_mlb.data.partitioned_store import upsert_dataset
 
 # pybaseball이 설치되어 있지 않은 경우를 대비한 import
 try:
@@ -146,54 +146,32 @@ class PyBaseballDataProcessor:
             logger.warning("수집된 투수 데이터가 없습니다.")
             return pd.DataFrame()
     
-    def merge_with_existing_data(self, new_data: pd.DataFrame, existing_file: str) -> pd.DataFrame:
-        """새 데이터를 기존 데이터와 병합"""
-        try:
-            if os.path.exists(existing_file):
-                existing_data = pd.read_csv(existing_file)
-                logger.info(f"기존 데이터: {len(existing_data)}개 레코드")
-                
-                # 중복 제거를 위해 PlayerID, Season 기준으로 병합
-                combined_data = pd.concat([existing_data, new_data], ignore_index=True)
-                
-                # PlayerID와 Season으로 중복 제거 (새 데이터 우선)
-                combined_data = combined_data.drop_duplicates(
-                    subset=['PlayerID', 'Season'], 
-                    keep='last'
-                ).sort_values(['PlayerName', 'Season'])
-                
-                logger.info(f"병합 후: {len(combined_data)}개 레코드")
-                return combined_data
-            else:
-                logger.info("기존 파일이 없습니다. 새 파일을 생성합니다.")
-                return new_data
-        except Exception as e:
-            logger.error(f"데이터 병합 실패: {e}")
-            return new_data
-    
-    def update_data(self, start_year: int = 2024, end_year: int = None):
-        """데이터 업데이트 실행"""
+    def update_data(self, start_year: int = 2024, end_year: int = None, export_csv: bool = False):
+        """
+        데이터 업데이트 실행
+        
+        새 데이터는 시즌 파티션 저장소에 병합되며, 새 데이터에 포함된 시즌 파일만 다시 씁니다.
+        
+        Args:
+            start_year: 시작 연도
+            end_year: 끝 연도
+            export_csv: 병합 후 단일 CSV 파일도 전체 재작성할지 여부 (CSV를 직접 읽는 도구용)
+        """
         logger.info(f"PyBaseball을 사용한 데이터 업데이트 시작")
         
         # 타자 데이터 수집 및 업데이트
         logger.info("=== 타자 데이터 업데이트 ===")
         new_batting_data = self.collect_batting_data(start_year, end_year)
         if not new_batting_data.empty:
-            updated_batting_data = self.merge_with_existing_data(
-                new_batting_data, BATTER_STATS_FILE
-            )
-            updated_batting_data.to_csv(BATTER_STATS_FILE, index=False)
-            logger.info(f"타자 데이터 저장 완료: {BATTER_STATS_FILE}")
+            seasons = upsert_dataset(new_batting_data, BATTER_STATS_FILE, export_csv=export_csv)
+            logger.info(f"타자 데이터 저장 완료: 시즌 {seasons}")
         
         # 투수 데이터 수집 및 업데이트
         logger.info("=== 투수 데이터 업데이트 ===")
         new_pitching_data = self.collect_pitching_data(start_year, end_year)
         if not new_pitching_data.empty:
-            updated_pitching_data = self.merge_with_existing_data(
-                new_pitching_data, PITCHER_STATS_FILE
-            )
-            updated_pitching_data.to_csv(PITCHER_STATS_FILE, index=False)
-            logger.info(f"투수 데이터 저장 완료: {PITCHER_STATS_FILE}")
+            seasons = upsert_dataset(new_pitching_data, PITCHER_STATS_FILE, export_csv=export_csv)
+            logger.info(f"투수 데이터 저장 완료: 시즌 {seasons}")
         
         logger.info("데이터 업데이트 완료!")
 
@@ -1,44 +1,39 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import matplotlib.font_manager as fm
 from streamlit_option_menu import option_menu
-from utils import load_data, load_pitcher_data
-from matplotlib.ticker import MaxNLocator
+from utils import load_batter_index, load_pitcher_index, load_aggregates
+from utils import set_chart_style, get_font_properties
 from i18n import get_text
+from predict_mlb.utils.lazy_import import lazy_import
+
+# 차트 라이브러리는 처음 차트를 그릴 때 로드
+plt = lazy_import("matplotlib.pyplot")
+sns = lazy_import("seaborn")
+ticker = lazy_import("matplotlib.ticker")
 
 path = 'font/H2GTRM.TTF'
-fontprop = fm.FontProperties(fname=path, size=12)
 
-df = load_data()
-df_pitchers = load_pitcher_data()
+# 타자와 투수의 리그 평균 지표
+batting_metrics = ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Hits', 'RBIs', 'HomeRuns', 'StolenBases', 'Walks', 'StrikeOuts']
+pitching_metrics = ['EarnedRunAverage', 'Whip', 'Wins', 'Losses', 'StrikeOuts', 'InningsPitched', 'Walks', 'HitsAllowed']
 
-# 리그 평균 계산 함수 추가
-def calculate_league_averages(df, metrics):
+def get_league_averages(player_type):
     """
-    시즌별 리그 평균을 계산하는 함수입니다.
+    선수 유형별 리그 평균을 반환합니다. 시즌 집계에서 바로 계산하므로 전체 데이터를 다시 훑지 않습니다.
     
     Args:
-        df: 분석할 데이터프레임
-        metrics: 계산할 지표들의 리스트
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
         
     Returns:
-        시즌별로 그룹화된 리그 평균 데이터프레임
+        시즌별 리그 평균 데이터프레임
     """
-    league_averages = df.groupby('Season')[metrics].mean().reset_index()
-    return league_averages
-
-# 타자와 투수의 리그 평균 계산
-batting_metrics = ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Hits', 'RBIs', 'HomeRuns', 'StolenBases', 'Walks', 'StrikeOuts']
-pitching_metrics = ['EarnedRunAverage', 'Whip', 'Wins', 'Losses', 'StrikeOuts', 'InningsPitched', 'Walks', 'HitsAllowed']
-
-batting_league_avg = calculate_league_averages(df, batting_metrics)
-pitching_league_avg = calculate_league_averages(df_pitchers, pitching_metrics)
+    metrics = batting_metrics if player_type == 'batter' else pitching_metrics
+    return load_aggregates(player_type).mean(metrics)
 
 def run_search(lang="ko"):
     """MLB 선수 기록을 조회하고 시각화하는 함수입니다."""
     st.title(get_text("search_title", lang))
+    set_chart_style()
 
     menu_options = {
         'ko': ['타자(선수기준)', '타자(시즌기준)', '투수(선수기준)', '투수(시즌기준)'],
@@ -63,16 +58,19 @@ def run_search(lang="ko"):
         }
     )
 
-    def view_player_stats(data, league_avg, player_type, metrics, season=None):
+    def view_player_stats(index, league_avg, player_type, metrics, season=None):
         if season:
-            data = data[data['Season'] == season]
             league_avg = league_avg[league_avg['Season'] == season]
-
-        player_names = [""] + sorted(data['PlayerName'].unique())
+            player_names = [""] + index.get_season_players(season)
+        else:
+            player_names = [""] + index.players
         player = st.selectbox(get_text('select_player', lang), player_names, index=0)
 
         if player:
-            player_data = data[data['PlayerName'] == player].sort_values(by='Season')
+            if season:
+                player_data = index.get_player_season(player, season)
+            else:
+                player_data = index.get_player(player).sort_values(by='Season')
             player_data_styled = player_data.style.format(precision=3)
 
             if player_type == '투수':
@@ -117,13 +115,13 @@ def run_search(lang="ko"):
                 for ax, metric in zip(axes.flatten(), metrics_to_display):
                     sns.lineplot(data=player_data, x='Season', y=metric, ax=ax, marker='o', label='Player')
                     sns.lineplot(data=league_avg, x='Season', y=metric, ax=ax, marker='o', color='red', label='League Average')
-                    ax.set_title(f"{player}의 시즌별 {metric} 변화", fontproperties=fontprop)
-                    ax.set_xlabel('Season', fontproperties=fontprop)
-                    ax.set_ylabel(metric, fontproperties=fontprop)
+                    ax.set_title(f"{player}의 시즌별 {metric} 변화", fontproperties=get_font_properties(path))
+                    ax.set_xlabel('Season', fontproperties=get_font_properties(path))
+                    ax.set_ylabel(metric, fontproperties=get_font_properties(path))
                     ax.set_xlim(min_year, max_year)
                     ax.legend()
                     ax.tick_params(axis='x', rotation=45)
-                    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+                    ax.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
 
                 for ax in axes.flatten()[len(metrics_to_display):]:
                     ax.axis('off')
@@ -134,12 +132,12 @@ def run_search(lang="ko"):
             else:
                 st.warning(f"해당 선수의 기록을 찾을 수 없습니다.")
 
-    def view_player_stats_by_season(data, league_avg, player_type, metrics, season):
-        player_names = [""] + sorted(data['PlayerName'].unique())
+    def view_player_stats_by_season(index, league_avg, player_type, metrics, season):
+        player_names = [""] + index.players
         player = st.selectbox('선수를 선택하세요:', player_names, index=0)
 
         if player and season:
-            player_data = data[(data['PlayerName'] == player) & (data['Season'] == season)]
+            player_data = index.get_player_season(player, season)
             league_data = league_avg[league_avg['Season'] == season]
 
             if not player_data.empty:
@@ -172,19 +170,20 @@ def run_search(lang="ko"):
 
                 fig, ax = plt.subplots(figsize=(15, 7))
                 bar_width = 0.35
-                index = range(len(metrics))
+                positions = range(len(metrics))
 
-                player_values = player_data[metrics].values.flatten()
-                league_values = league_data[metrics].mean().values.flatten()
+                # 스키마상 누적 기록(Int16)과 비율 기록(float32)이 섞여 있으므로 float로 통일
+                player_values = player_data[metrics].to_numpy(dtype=float).flatten()
+                league_values = league_data[metrics].mean().to_numpy(dtype=float).flatten()
 
-                bars1 = ax.bar(index, player_values, bar_width, label=player, color='b')
-                bars2 = ax.bar([i + bar_width for i in index], league_values, bar_width, label='League Average', color='r')
+                bars1 = ax.bar(positions, player_values, bar_width, label=player, color='b')
+                bars2 = ax.bar([i + bar_width for i in positions], league_values, bar_width, label='League Average', color='r')
 
-                ax.set_xlabel('Metrics', fontproperties=fontprop)
-                ax.set_ylabel('Values', fontproperties=fontprop)
-                ax.set_title(f'{player} vs League Average ({season})', fontproperties=fontprop)
-                ax.set_xticks([i + bar_width / 2 for i in index])
-                ax.set_xticklabels(metrics, fontproperties=fontprop, rotation=45)
+                ax.set_xlabel('Metrics', fontproperties=get_font_properties(path))
+                ax.set_ylabel('Values', fontproperties=get_font_properties(path))
+                ax.set_title(f'{player} vs League Average ({season})', fontproperties=get_font_properties(path))
+                ax.set_xticks([i + bar_width / 2 for i in positions])
+                ax.set_xticklabels(metrics, fontproperties=get_font_properties(path), rotation=45)
                 ax.legend()
 
                 plt.tight_layout()
@@ -192,27 +191,30 @@ def run_search(lang="ko"):
             else:
                 st.warning(f"해당 시즌에 대한 선수의 기록을 찾을 수 없습니다.")
 
+    batter_index = load_batter_index()
+    pitcher_index = load_pitcher_index()
+
     def view_bat_stats(season=None):
-        view_player_stats(df, batting_league_avg, "타자", batting_metrics, season)
+        view_player_stats(batter_index, get_league_averages('batter'), "타자", batting_metrics, season)
 
     def view_pit_stats(season=None):
-        view_player_stats(df_pitchers, pitching_league_avg, "투수", pitching_metrics, season)
+        view_player_stats(pitcher_index, get_league_averages('pitcher'), "투수", pitching_metrics, season)
 
     def view_bat_stats_by_season(season):
-        view_player_stats_by_season(df, batting_league_avg, "타자", batting_metrics, season)
+        view_player_stats_by_season(batter_index, get_league_averages('batter'), "타자", batting_metrics, season)
 
     def view_pit_stats_by_season(season):
-        view_player_stats_by_season(df_pitchers, pitching_league_avg, "투수", pitching_metrics, season)
+        view_player_stats_by_season(pitcher_index, get_league_averages('pitcher'), "투수", pitching_metrics, season)
 
     if selected == '타자(선수기준)':
         view_bat_stats()
     elif selected == '타자(시즌기준)':
-        season = st.selectbox("시즌을 선택하세요:", options=sorted(df['Season'].unique()))
+        season = st.selectbox("시즌을 선택하세요:", options=batter_index.seasons)
         view_bat_stats_by_season(season)
     elif selected == '투수(선수기준)':
         view_pit_stats()
     elif selected == '투수(시즌기준)':
-        season = st.selectbox("시즌을 선택하세요:", options=sorted(df_pitchers['Season'].unique()))
+        season = st.selectbox("시즌을 선택하세요:", options=pitcher_index.seasons)
         view_pit_stats_by_season(season)
 
 if __name__ == "__main__":
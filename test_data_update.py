@@ -5,8 +5,6 @@
 """
 
 import sys
-import os
-import pandas as pd
 from datetime import datetime
 import logging
 
@@ -92,10 +90,11 @@ def test_existing_data():
     
     try:
         from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+        from predict_mlb.data.partitioned_store import dataset_exists, read_dataset
         
         # 타자 데이터 확인
-        if os.path.exists(BATTER_STATS_FILE):
-            batter_df = pd.read_csv(BATTER_STATS_FILE)
+        if dataset_exists(BATTER_STATS_FILE):
+            batter_df = read_dataset(BATTER_STATS_FILE)
             logger.info(f"✅ 타자 데이터 파일 존재: {len(batter_df)}개 레코드")
             logger.info(f"   시즌 범위: {batter_df['Season'].min()} - {batter_df['Season'].max()}")
             logger.info(f"   컬럼: {list(batter_df.columns)}")
@@ -103,8 +102,8 @@ def test_existing_data():
             logger.warning(f"⚠️ 타자 데이터 파일 없음: {BATTER_STATS_FILE}")
         
         # 투수 데이터 확인
-        if os.path.exists(PITCHER_STATS_FILE):
-            pitcher_df = pd.read_csv(PITCHER_STATS_FILE)
+        if dataset_exists(PITCHER_STATS_FILE):
+            pitcher_df = read_dataset(PITCHER_STATS_FILE)
             logger.info(f"✅ 투수 데이터 파일 존재: {len(pitcher_df)}개 레코드")
             logger.info(f"   시즌 범위: {pitcher_df['Season'].min()} - {pitcher_df['Season'].max()}")
             logger.info(f"   컬럼: {list(pitcher_df.columns)}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+예측 모델 테스트 스크립트
+감쇠 추세 일괄 적합이 시계열별 단독 적합과 같은 예측을 내는지,
+Prophet 해석적 구간이 시뮬레이션 구간과 맞는지 테스트
+"""
+
+import sys
+import logging
+
+import numpy as np
+import pandas as pd
+
+from predict_mlb.models.forecasters import (DampedTrendForecaster, create_forecaster, forecast_series_batch,
+                                            prophet_analytic_intervals)
+
+# prophet이 설치되어 있지 않은 경우를 대비한 import
+try:
+    import prophet  # noqa: F401
+    PROPHET_AVAILABLE = True
+except ImportError:
+    PROPHET_AVAILABLE = False
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PERIODS = 5
+FORECAST_COLUMNS = ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+
+# 해석적 구간 폭 대비 시뮬레이션(1000개 경로) 구간 폭의 허용 오차 (시드 0~5 실측 ±12% 이내)
+INTERVAL_WIDTH_TOLERANCE = 0.15
+
+# 길이가 다르고 마지막 시즌도 다른 시계열 (빠진 시즌 포함) + 상수 시계열
+SERIES = [
+    (list(range(2010, 2024)), [0.251, 0.262, 0.270, 0.255, 0.281, 0.290, 0.276, 0.268, 0.284, 0.301,
+                               0.295, 0.288, 0.279, 0.283]),
+    ([2019, 2020, 2021], [12.0, 18.0, 15.0]),
+    ([2015, 2016, 2018, 2019, 2020, 2022], [0.710, 0.742, 0.695, 0.770, 0.731, 0.758]),
+    (list(range(2016, 2024)), [0.300] * 8),
+]
+
+def _fit_alone(seasons, values):
+    """시계열 하나를 DampedTrendForecaster로 단독 적합"""
+    model = DampedTrendForecaster().fit(pd.DataFrame({
+        'ds': pd.to_datetime([str(season) for season in seasons], format='%Y'),
+        'y': values,
+    }))
+    return model, model.predict(model.make_future_dataframe(periods=PERIODS, freq='Y'))
+
+def test_damped_batch_matches_single_fits():
+    """오른쪽 정렬 2차원 일괄 적합 == 시계열별 단독 적합"""
+    logger.info("=== 감쇠 추세 일괄 적합 테스트 ===")
+
+    batch = forecast_series_batch([values for _, values in SERIES], [seasons for seasons, _ in SERIES], PERIODS)
+    assert len(batch) == len(SERIES)
+
+    for (seasons, values), batch_forecast in zip(SERIES, batch):
+        _, alone = _fit_alone(seasons, values)
+        pd.testing.assert_frame_equal(batch_forecast[FORECAST_COLUMNS], alone[FORECAST_COLUMNS],
+                                      check_exact=False, rtol=1e-10, atol=1e-12)
+        logger.info(f"✅ {seasons[0]}-{seasons[-1]} ({len(seasons)}개 시즌) 일치")
+
+    # 상수 시계열은 같은 값을 예측하고 구간 폭이 0
+    constant = batch[-1]
+    assert np.allclose(constant['yhat'], 0.300)
+    assert np.allclose(constant['yhat_upper'] - constant['yhat_lower'], 0.0)
+    logger.info("✅ 상수 시계열 예측 확인")
+
+def test_damped_params_round_trip():
+    """to_params()/from_params() 복원 모델이 같은 예측을 내는지 확인"""
+    logger.info("=== 감쇠 추세 파라미터 저장/복원 테스트 ===")
+
+    for seasons, values in SERIES:
+        model, expected = _fit_alone(seasons, values)
+        restored = DampedTrendForecaster.from_params(model.to_params())
+        actual = restored.predict(restored.make_future_dataframe(periods=PERIODS, freq='Y'))
+        pd.testing.assert_frame_equal(actual[FORECAST_COLUMNS], expected[FORECAST_COLUMNS])
+        assert restored.interval_width == model.interval_width
+    logger.info("✅ 복원 모델 예측 일치")
+
+def test_prophet_analytic_intervals_match_sampled():
+    """Prophet 해석적 구간: yhat은 시뮬레이션과 같고, 구간 폭은 h=1, h=5에서 허용 오차 이내"""
+    logger.info("=== Prophet 해석적 구간 테스트 ===")
+    if not PROPHET_AVAILABLE:
+        logger.warning("⚠️ prophet이 설치되지 않아 건너뜁니다.")
+        return
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    # 상승 후 하락하는 시계열: 변화점 크기(delta)가 커서 미래 추세 분산이 구간 폭에 반영됨
+    rng = np.random.default_rng(0)
+    seasons = list(range(2004, 2024))
+    values = np.r_[np.linspace(0.24, 0.30, 10), np.linspace(0.30, 0.25, 10)] + rng.normal(0, 0.006, len(seasons))
+    model = create_forecaster('prophet', yearly_seasonality=False, uncertainty_samples=0)
+    model.fit(pd.DataFrame({'ds': pd.to_datetime([str(season) for season in seasons], format='%Y'), 'y': values}))
+    future = model.make_future_dataframe(periods=PERIODS, freq='Y')
+
+    analytic = prophet_analytic_intervals(model, model.predict(future))
+    np.random.seed(0)
+    model.uncertainty_samples = 1000
+    sampled = model.predict(future)
+
+    np.testing.assert_allclose(analytic['yhat'], sampled['yhat'], rtol=1e-12)
+    analytic_width = (analytic['yhat_upper'] - analytic['yhat_lower']).to_numpy()[-PERIODS:]
+    sampled_width = (sampled['yhat_upper'] - sampled['yhat_lower']).to_numpy()[-PERIODS:]
+    # 미래 구간은 기간이 길수록 넓어지고, 5년 뒤에는 추세 분산이 폭을 크게 늘림
+    assert np.all(np.diff(analytic_width) > 0), analytic_width
+    assert analytic_width[-1] > 1.5 * analytic_width[0], analytic_width
+    for h in (1, PERIODS):
+        ratio = sampled_width[h - 1] / analytic_width[h - 1]
+        assert abs(ratio - 1) <= INTERVAL_WIDTH_TOLERANCE, f"h={h}: 폭 비율 {ratio:.3f}"
+        logger.info(f"✅ h={h}: 시뮬레이션/해석적 구간 폭 비율 {ratio:.3f}")
+
+def main():
+    """전체 테스트 실행"""
+    logger.info("🧪 예측 모델 테스트 시작")
+    logger.info("=" * 50)
+
+    tests = [
+        ("감쇠 추세 일괄 적합", test_damped_batch_matches_single_fits),
+        ("감쇠 추세 저장/복원", test_damped_params_round_trip),
+        ("Prophet 해석적 구간", test_prophet_analytic_intervals_match_sampled),
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🔍 {test_name} 테스트 중...")
+        try:
+            test_func()
+            results[test_name] = True
+        except Exception as e:
+            logger.error(f"❌ {test_name} 테스트 실패: {e!r}")
+            results[test_name] = False
+
+    passed = sum(results.values())
+    for test_name, result in results.items():
+        logger.info(f"{test_name}: {'✅ 통과' if result else '❌ 실패'}")
+    logger.info(f"\n총 {passed}/{len(results)}개 테스트 통과")
+    return 0 if passed == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+시즌 파티션 저장소 테스트 스크립트
+업데이트 병합(upsert)이 파티션과 리그 집계를 올바르게 갱신하는지 임시 디렉토리에서 테스트
+"""
+
+import sys
+import os
+import tempfile
+import logging
+
+import numpy as np
+import pandas as pd
+
+from predict_mlb.data.columnar_cache import clean_stats_frame
+from predict_mlb.data.partitioned_store import PartitionedStore, read_dataset, upsert_dataset
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+METRICS = ['AtBats', 'BattingAverage', 'HomeRuns']
+
+def _sample_frame(seasons, players, seed):
+    """시즌 × 선수 샘플 타자 데이터"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for season in seasons:
+        for player_id in players:
+            rows.append({
+                'PlayerID': player_id,
+                'PlayerName': f"Player {player_id}",
+                'Season': season,
+                'Team': 'AAA',
+                'AtBats': int(rng.integers(50, 650)),
+                'BattingAverage': round(float(rng.uniform(0.180, 0.340)), 3),
+                'HomeRuns': int(rng.integers(0, 50)),
+            })
+    return pd.DataFrame(rows)
+
+def test_upsert_replaces_rows_and_adds_season():
+    """기존 시즌 행 교체 + 새 시즌 추가 후 파티션/매니페스트/집계 확인"""
+    logger.info("=== 파티션 병합 테스트 ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "batters.csv")
+        original = _sample_frame([2021, 2022, 2023], range(1, 21), seed=0)
+        original.to_csv(csv_path, index=False)
+
+        # 2023 시즌 일부 선수 교체(+ 새 선수) + 2024 새 시즌
+        replaced = _sample_frame([2023], range(15, 26), seed=1)
+        new_season = _sample_frame([2024], range(1, 11), seed=2)
+        touched = upsert_dataset(pd.concat([replaced, new_season], ignore_index=True), csv_path)
+
+        store = PartitionedStore.for_csv(csv_path)
+        assert touched == [2023, 2024], touched
+        # CSV에서 초기화(버전 1) 후 병합(버전 2)
+        assert store.version == 2, store.version
+        assert store.seasons() == [2021, 2022, 2023, 2024], store.seasons()
+        logger.info(f"✅ 다시 쓴 시즌: {touched}, 저장소 버전: {store.version}")
+
+        data = read_dataset(csv_path)
+        rows = data.groupby('Season').size().to_dict()
+        assert rows == {2021: 20, 2022: 20, 2023: 25, 2024: 10}, rows
+        assert not data.duplicated(subset=['PlayerID', 'Season']).any()
+        # 교체된 행은 새 값, 교체되지 않은 행은 기존 값
+        season_2023 = data[data['Season'] == 2023].set_index('PlayerID')
+        expected_new = replaced.set_index('PlayerID')
+        expected_old = original[original['Season'] == 2023].set_index('PlayerID')
+        pd.testing.assert_series_equal(season_2023.loc[expected_new.index, 'HomeRuns'], expected_new['HomeRuns'],
+                                       check_dtype=False)
+        pd.testing.assert_series_equal(season_2023.loc[range(1, 15), 'HomeRuns'],
+                                       expected_old.loc[range(1, 15), 'HomeRuns'], check_dtype=False)
+        # CSV는 다시 쓰지 않음 (export_csv=False)
+        assert pd.read_csv(csv_path)['Season'].max() == 2023
+        logger.info(f"✅ 시즌별 레코드: {rows}")
+
+        # 빼고 더해서 갱신한 집계 == 병합된 전체 데이터의 groupby
+        aggregates = store.load_aggregates()
+        assert aggregates is not None and aggregates.source_version == store.version
+        fresh = clean_stats_frame(data)
+        grouped = fresh.groupby('Season')[METRICS]
+        expected = {
+            'mean': grouped.mean(),
+            'std': grouped.std(),
+            'weighted_mean': pd.DataFrame({
+                metric: (fresh[metric] * fresh['AtBats']).groupby(fresh['Season']).sum()
+                / fresh['AtBats'].groupby(fresh['Season']).sum()
+                for metric in METRICS
+            }),
+        }
+        for name, frame in expected.items():
+            actual = getattr(aggregates, name)(METRICS).set_index('Season')
+            actual.columns.name = None
+            pd.testing.assert_frame_equal(actual, frame.astype('float64'), check_names=False,
+                                          check_index_type=False, rtol=1e-8, atol=1e-8)
+        logger.info("✅ 리그 집계 (mean/std/weighted_mean) 일치")
+
+def main():
+    """전체 테스트 실행"""
+    logger.info("🧪 시즌 파티션 저장소 테스트 시작")
+    logger.info("=" * 50)
+
+    tests = [
+        ("파티션 병합과 집계 갱신", test_upsert_replaces_rows_and_adds_season),
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🔍 {test_name} 테스트 중...")
+        try:
+            test_func()
+            results[test_name] = True
+        except Exception as e:
+            logger.error(f"❌ {test_name} 테스트 실패: {e!r}")
+            results[test_name] = False
+
+    passed = sum(results.values())
+    for test_name, result in results.items():
+        logger.info(f"{test_name}: {'✅ 통과' if result else '❌ 실패'}")
+    logger.info(f"\n총 {passed}/{len(results)}개 테스트 통과")
+    return 0 if passed == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
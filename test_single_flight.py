@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+단일 실행(single-flight) 테스트 스크립트
+같은 키의 동시 요청이 한 번의 계산으로 합쳐지고, 결과와 예외가 대기자에게 전달되는지 테스트
+"""
+
+import sys
+import time
+import threading
+import logging
+
+from predict_mlb.utils.single_flight import SingleFlight
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+THREADS = 8
+TIMEOUT = 10.0
+
+def _run_concurrently(group, fn):
+    """THREADS개 스레드가 같은 키로 group.do(key, fn)를 동시에 호출하고 (결과, 예외) 목록을 반환"""
+    start = threading.Barrier(THREADS)
+    outcomes = [None] * THREADS
+
+    def call(slot):
+        start.wait()
+        try:
+            outcomes[slot] = (group.do("player:1:OPS", fn, timeout=TIMEOUT), None)
+        except Exception as e:
+            outcomes[slot] = (None, e)
+
+    threads = [threading.Thread(target=call, args=(slot,)) for slot in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+    assert not any(thread.is_alive() for thread in threads), "스레드가 끝나지 않았습니다."
+    return outcomes
+
+def _slow(group, fn):
+    """나머지 스레드가 모두 같은 계산에 합류할 때까지 기다린 뒤 fn을 실행하는 계산 함수"""
+    calls = []
+
+    def compute():
+        calls.append(threading.get_ident())
+        deadline = time.monotonic() + TIMEOUT
+        while group.stats()["coalesced"] < THREADS - 1:
+            assert time.monotonic() < deadline, "대기자가 합류하지 않았습니다."
+            time.sleep(0.001)
+        return fn()
+
+    return compute, calls
+
+def test_concurrent_calls_share_one_result():
+    """동시 요청 N개 → 계산 1번, 대기자는 같은 결과 객체, coalesced == N-1"""
+    logger.info("=== 결과 공유 테스트 ===")
+    group = SingleFlight("test")
+    result = {"yhat": [0.801, 0.812]}
+    compute, calls = _slow(group, lambda: result)
+
+    outcomes = _run_concurrently(group, compute)
+
+    assert len(calls) == 1, calls
+    assert all(error is None and value is result for value, error in outcomes), outcomes
+    stats = group.stats()
+    assert stats == {"calls": THREADS, "executions": 1, "coalesced": THREADS - 1, "errors": 0, "in_flight": 0}, stats
+    logger.info(f"✅ {THREADS}개 요청 → 계산 1번, 통계: {stats}")
+
+def test_concurrent_calls_share_leader_error():
+    """선행자 계산이 실패하면 모든 대기자가 같은 예외를 받고, 키는 비워짐"""
+    logger.info("=== 예외 전달 테스트 ===")
+    group = SingleFlight("test")
+    error = ValueError("예측에 필요한 데이터가 부족합니다.")
+
+    def fail():
+        raise error
+
+    compute, calls = _slow(group, fail)
+    outcomes = _run_concurrently(group, compute)
+
+    assert len(calls) == 1, calls
+    assert all(value is None and raised is error for value, raised in outcomes), outcomes
+    stats = group.stats()
+    assert stats == {"calls": THREADS, "executions": 1, "coalesced": THREADS - 1, "errors": 1, "in_flight": 0}, stats
+
+    # 실패한 키는 남지 않으므로 다음 요청은 새로 계산
+    assert group.do("player:1:OPS", lambda: 42) == 42
+    assert group.stats()["executions"] == 2
+    logger.info(f"✅ {THREADS}개 요청이 같은 예외 수신, 통계: {stats}")
+
+def main():
+    """전체 테스트 실행"""
+    logger.info("🧪 단일 실행 테스트 시작")
+    logger.info("=" * 50)
+
+    tests = [
+        ("결과 공유", test_concurrent_calls_share_one_result),
+        ("예외 전달", test_concurrent_calls_share_leader_error),
+    ]
+
+    results = {}
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🔍 {test_name} 테스트 중...")
+        try:
+            test_func()
+            results[test_name] = True
+        except Exception as e:
+            logger.error(f"❌ {test_name} 테스트 실패: {e!r}")
+            results[test_name] = False
+
+    passed = sum(results.values())
+    for test_name, result in results.items():
+        logger.info(f"{test_name}: {'✅ 통과' if result else '❌ 실패'}")
+    logger.info(f"\n총 {passed}/{len(results)}개 테스트 통과")
+    return 0 if passed == len(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
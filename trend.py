@@ -1,67 +1,46 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import matplotlib.font_manager as fm
 from streamlit_option_menu import option_menu
-from utils import load_data, load_pitcher_data
+from utils import load_aggregates, get_data_version, set_chart_style, get_font_properties
 from i18n import get_text
 from config import FONT_PATH # 설정 파일에서 폰트 경로 가져오기
+from predict_mlb.data.rolling_views import RollingViews
+from predict_mlb.utils.lazy_import import lazy_import
 
-fontprop = fm.FontProperties(fname=FONT_PATH, size=12) # 경로 수정
+# 차트 라이브러리는 처음 차트를 그릴 때 로드
+plt = lazy_import("matplotlib.pyplot")
+sns = lazy_import("seaborn")
 
-# 리그 평균 계산 함수 추가
-def calculate_league_averages(df, metrics):
-    """
-    시즌별 리그 평균을 계산하는 함수입니다.
-    
-    Args:
-        df: 분석할 데이터프레임
-        metrics: 계산할 지표들의 리스트
-        
-    Returns:
-        시즌별로 그룹화된 리그 평균 데이터프레임
-    """
-    league_averages = df.groupby('Season')[metrics].mean().reset_index()
-    return league_averages
+# 타자와 투수의 리그 평균 지표
+batting_metrics = ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Hits', 'RBIs', 'HomeRuns', 'StolenBases', 'Walks', 'StrikeOuts']
+pitching_metrics = ['EarnedRunAverage', 'Whip', 'Wins', 'Losses', 'StrikeOuts', 'InningsPitched', 'Walks', 'HitsAllowed']
+
+# 이동평균 윈도우 크기 (년)
+MOVING_AVERAGE_WINDOWS = (5, 10, 20)
 
-# 이동평균 계산 함수 추가
-def calculate_moving_average(df, metrics, window):
+def get_league_trends(player_type):
     """
-    특정 윈도우 크기의 이동평균을 계산하는 함수입니다.
+    선수 유형별 리그 평균과 이동평균을 반환합니다.
+    페이지를 처음 열 때 계산하고, 이후에는 데이터 버전이 바뀔 때까지 재사용합니다.
     
     Args:
-        df: 분석할 데이터프레임
-        metrics: 계산할 지표들의 리스트
-        window: 이동평균 윈도우 크기
+        player_type: 선수 유형 ('batter' 또는 'pitcher')
         
     Returns:
-        이동평균이 계산된 데이터프레임
+        (리그 평균 데이터프레임, 이동평균 뷰) 튜플
     """
-    moving_avg = df.copy()
-    for metric in metrics:
-        moving_avg[metric] = moving_avg[metric].rolling(window=window, min_periods=1).mean()
-    return moving_avg
-
-# 타자와 투수의 리그 평균 계산
-batting_metrics = ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Hits', 'RBIs', 'HomeRuns', 'StolenBases', 'Walks', 'StrikeOuts']
-pitching_metrics = ['EarnedRunAverage', 'Whip', 'Wins', 'Losses', 'StrikeOuts', 'InningsPitched', 'Walks', 'HitsAllowed']
-
-df_batters = load_data()
-df_pitchers = load_pitcher_data()
-
-batting_league_avg = calculate_league_averages(df_batters, batting_metrics)
-pitching_league_avg = calculate_league_averages(df_pitchers, pitching_metrics)
-
-batting_moving_avg_5 = calculate_moving_average(batting_league_avg, batting_metrics, 5)
-batting_moving_avg_10 = calculate_moving_average(batting_league_avg, batting_metrics, 10)
-batting_moving_avg_20 = calculate_moving_average(batting_league_avg, batting_metrics, 20)
-
-pitching_moving_avg_5 = calculate_moving_average(pitching_league_avg, pitching_metrics, 5)
-pitching_moving_avg_10 = calculate_moving_average(pitching_league_avg, pitching_metrics, 10)
-pitching_moving_avg_20 = calculate_moving_average(pitching_league_avg, pitching_metrics, 20)
-
-def plot_metric(ax, metric, league_avg, moving_avg_5, moving_avg_10, moving_avg_20, lang="ko"):
+    return _compute_league_trends(player_type, get_data_version(player_type))
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _compute_league_trends(player_type, data_version):
+    """리그 평균/이동평균 계산 (캐시 키: 선수 유형, 데이터 버전)"""
+    metrics = batting_metrics if player_type == 'batter' else pitching_metrics
+    # 리그 평균은 시즌 집계에서 계산 (전체 데이터 groupby 없음)
+    league_avg = load_aggregates(player_type).mean(metrics)
+    # 모든 윈도우를 누적합으로 한 번에 계산 (윈도우별 프레임 복사 없음)
+    return league_avg, RollingViews(league_avg, metrics, MOVING_AVERAGE_WINDOWS)
+
+def plot_metric(ax, metric, league_avg, rolling_views, lang="ko"):
     """
     리그 평균 지표와 이동평균을 시각화하는 함수입니다.
     
@@ -69,9 +48,7 @@ def plot_metric(ax, metric, league_avg, moving_avg_5, moving_avg_10, moving_avg_
         ax: 그래프를 그릴 matplotlib 축
         metric: 시각화할 지표명
         league_avg: 리그 평균 데이터프레임
-        moving_avg_5: 5년 이동평균 데이터프레임
-        moving_avg_10: 10년 이동평균 데이터프레임
-        moving_avg_20: 20년 이동평균 데이터프레임
+        rolling_views: 5/10/20년 이동평균 뷰
         lang: 언어 코드 (기본값: 'ko')
     """
     # 다국어 레이블 정의
@@ -109,15 +86,13 @@ def plot_metric(ax, metric, league_avg, moving_avg_5, moving_avg_10, moving_avg_
     label_text = labels[lang]
     
     sns.lineplot(data=league_avg, x='Season', y=metric, ax=ax, marker='o', label=label_text['league_avg'])
-    sns.lineplot(data=moving_avg_5, x='Season', y=metric, ax=ax, linestyle='--', color='gray',
-                 label=label_text['moving_avg_5'])
-    sns.lineplot(data=moving_avg_10, x='Season', y=metric, ax=ax, linestyle='-.', color='blue',
-                 label=label_text['moving_avg_10'])
-    sns.lineplot(data=moving_avg_20, x='Season', y=metric, ax=ax, linestyle=':', color='red',
-                 label=label_text['moving_avg_20'])
-    ax.set_title(f"{label_text['title_prefix']} {metric} {get_text('trend_overview', lang).split(' ')[-1]}", fontproperties=fontprop)
-    ax.set_xlabel(label_text['season'], fontproperties=fontprop)
-    ax.set_ylabel(metric, fontproperties=fontprop)
+    for window, linestyle, color in [(5, '--', 'gray'), (10, '-.', 'blue'), (20, ':', 'red')]:
+        moving_avg = rolling_views.series(window, metric)
+        sns.lineplot(x=moving_avg.index, y=moving_avg.values, ax=ax, linestyle=linestyle, color=color,
+                     label=label_text[f'moving_avg_{window}'])
+    ax.set_title(f"{label_text['title_prefix']} {metric} {get_text('trend_overview', lang).split(' ')[-1]}", fontproperties=get_font_properties(FONT_PATH))
+    ax.set_xlabel(label_text['season'], fontproperties=get_font_properties(FONT_PATH))
+    ax.set_ylabel(metric, fontproperties=get_font_properties(FONT_PATH))
     ax.legend()
     ax.tick_params(axis='x', rotation=45)
 
@@ -125,6 +100,7 @@ def run_trend(lang="ko"):
     """MLB 리그 트렌드를 분석하고 시각화하는 함수입니다."""
 
     st.title(get_text("trend_title", lang))
+    set_chart_style()
 
     # 다국어 메뉴 옵션 정의
     menu_options = {
@@ -159,16 +135,10 @@ def run_trend(lang="ko"):
     
     if selected == batter_option:
         metrics = batting_metrics
-        league_avg = batting_league_avg
-        moving_avg_5 = batting_moving_avg_5
-        moving_avg_10 = batting_moving_avg_10
-        moving_avg_20 = batting_moving_avg_20
+        league_avg, rolling_views = get_league_trends('batter')
     else:
         metrics = pitching_metrics
-        league_avg = pitching_league_avg
-        moving_avg_5 = pitching_moving_avg_5
-        moving_avg_10 = pitching_moving_avg_10
-        moving_avg_20 = pitching_moving_avg_20
+        league_avg, rolling_views = get_league_trends('pitcher')
 
     # 언어에 따른 서브헤더 텍스트
     subheader_text = {
@@ -258,7 +228,7 @@ def run_trend(lang="ko"):
         for metric in metrics:
             st.markdown(f"#### 3.{metrics.index(metric) + 1}. {metric}")
             fig, ax = plt.subplots(figsize=(10, 5))
-            plot_metric(ax, metric, league_avg, moving_avg_5, moving_avg_10, moving_avg_20, lang)
+            plot_metric(ax, metric, league_avg, rolling_views, lang)
             st.pyplot(fig)
 
             # Moved and indented metric descriptions to be INSIDE the loop
@@ -376,7 +346,7 @@ def run_trend(lang="ko"):
         for metric in metrics:
             st.markdown(f"#### 3.{metrics.index(metric) + 1}. {metric}")
             fig, ax = plt.subplots(figsize=(10, 5))
-            plot_metric(ax, metric, league_avg, moving_avg_5, moving_avg_10, moving_avg_20, lang)
+            plot_metric(ax, metric, league_avg, rolling_views, lang)
             st.pyplot(fig)
 
             if metric == "EarnedRunAverage":
@@ -42,6 +42,22 @@ def update_with_mlb_api(start_year, end_year):
         logger.error(f"MLB API 업데이트 실패: {e}")
         return False
 
+def backup_dataset(csv_path, timestamp, label):
+    """데이터셋 백업 (시즌 파티션 저장소가 있으면 파티션 디렉토리, 없으면 CSV 파일)"""
+    import shutil
+    import os
+    from predict_mlb.data.partitioned_store import PartitionedStore
+    
+    store = PartitionedStore.for_csv(csv_path)
+    if store.exists():
+        backup_dir = f"{store.root_dir}_backup_{timestamp}"
+        shutil.copytree(store.root_dir, backup_dir)
+        logger.info(f"{label} 데이터 백업: {backup_dir}")
+    elif os.path.exists(csv_path):
+        backup_file = csv_path.replace('.csv', f'_backup_{timestamp}.csv')
+        shutil.copy2(csv_path, backup_file)
+        logger.info(f"{label} 데이터 백업: {backup_file}")
+
 def main():
     parser = argparse.ArgumentParser(description='MLB 데이터 업데이트 스크립트')
     parser.add_argument(
@@ -77,21 +93,11 @@ def main():
     # 백업 생성
     if args.backup:
         logger.info("기존 데이터 백업 생성...")
-        import shutil
-        import os
         from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if os.path.exists(BATTER_STATS_FILE):
-            backup_file = BATTER_STATS_FILE.replace('.csv', f'_backup_{timestamp}.csv')
-            shutil.copy2(BATTER_STATS_FILE, backup_file)
-            logger.info(f"타자 데이터 백업: {backup_file}")
-        
-        if os.path.exists(PITCHER_STATS_FILE):
-            backup_file = PITCHER_STATS_FILE.replace('.csv', f'_backup_{timestamp}.csv')
-            shutil.copy2(PITCHER_STATS_FILE, backup_file)
-            logger.info(f"투수 데이터 백업: {backup_file}")
+        backup_dataset(BATTER_STATS_FILE, timestamp, "타자")
+        backup_dataset(PITCHER_STATS_FILE, timestamp, "투수")
     
     # 데이터 업데이트 실행
     success = False
@@ -114,17 +120,17 @@ def main():
         
         # 간단한 통계 출력
         try:
-            import pandas as pd
-            import os
             from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
+            from predict_mlb.data.partitioned_store import dataset_exists, read_dataset
             
-            if os.path.exists(BATTER_STATS_FILE):
-                batter_df = pd.read_csv(BATTER_STATS_FILE)
+            # 업데이트는 시즌 파티션에 기록되므로 CSV가 아니라 파티션 기준으로 확인
+            if dataset_exists(BATTER_STATS_FILE):
+                batter_df = read_dataset(BATTER_STATS_FILE)
                 logger.info(f"타자 데이터: {len(batter_df)}개 레코드")
                 logger.info(f"시즌 범위: {batter_df['Season'].min()} - {batter_df['Season'].max()}")
             
-            if os.path.exists(PITCHER_STATS_FILE):
-                pitcher_df = pd.read_csv(PITCHER_STATS_FILE)
+            if dataset_exists(PITCHER_STATS_FILE):
+                pitcher_df = read_dataset(PITCHER_STATS_FILE)
                 logger.info(f"투수 데이터: {len(pitcher_df)}개 레코드")
                 logger.info(f"시즌 범위: {pitcher_df['Season'].min()} - {pitcher_df['Season'].max()}")
                 
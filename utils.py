@@ -3,20 +3,27 @@ import streamlit as st
 from PIL import Image
 import os
 import numpy as np
-from matplotlib import pyplot as plt
+from functools import lru_cache
 from config import BATTER_STATS_FILE, PITCHER_STATS_FILE, FONT_PATH, MLB_LOGO_PATH
+from predict_mlb.data.schema import BATTER_SCHEMA, PITCHER_SCHEMA
+from predict_mlb.data.aggregates import LeagueAggregateStore
+from predict_mlb.data.frame_index import FrameIndex
+from predict_mlb.data.registry import get_registry
+from predict_mlb.models.marcel import project_next_season
+from predict_mlb.config.settings import PREDICT_METRIC_RANGES
+from predict_mlb.utils.lazy_import import lazy_import
 
-# 데이터 캐싱 및 로드 기능 향상
-@st.cache_data(ttl=3600, show_spinner=True)  # 1시간 TTL 설정
+# 차트 라이브러리는 처음 차트를 그릴 때 로드
+plt = lazy_import("matplotlib.pyplot")
+fm = lazy_import("matplotlib.font_manager")
+sns = lazy_import("seaborn")
+
+# 데이터는 프로세스 전역 레지스트리에서 한 번만 로드해 모든 페이지/세션이 공유
+# (원본 CSV가 바뀌면 다음 호출 시 새 버전으로 교체됨)
 def load_data():
-    """타자 데이터를 로드합니다. 파일 경로를 config에서 가져옵니다."""
+    """타자 데이터를 로드합니다. 파일 경로를 config에서 가져옵니다. (반환된 프레임은 변경하지 마세요)"""
     try:
-        df = pd.read_csv(BATTER_STATS_FILE)
-        # 데이터 클리닝 또는 전처리 (예시)
-        df = df.rename(columns=lambda x: x.strip()) # 컬럼명 공백 제거
-        numeric_cols = df.select_dtypes(include=np.number).columns
-        df[numeric_cols] = df[numeric_cols].fillna(0) # 숫자형 컬럼 NaN 0으로 채우기
-        return df
+        return get_registry().get_frame(BATTER_STATS_FILE, BATTER_SCHEMA)
     except FileNotFoundError:
         st.error(f"타자 데이터 파일을 찾을 수 없습니다: {BATTER_STATS_FILE}")
         st.info("샘플 데이터를 대신 사용합니다.")
@@ -26,16 +33,10 @@ def load_data():
         st.info("샘플 데이터를 대신 사용합니다.")
         return _create_sample_batter_data()
 
-@st.cache_data(ttl=3600, show_spinner=True)  # 1시간 TTL 설정
 def load_pitcher_data():
-    """투수 데이터를 로드합니다. 파일 경로를 config에서 가져옵니다."""
+    """투수 데이터를 로드합니다. 파일 경로를 config에서 가져옵니다. (반환된 프레임은 변경하지 마세요)"""
     try:
-        df = pd.read_csv(PITCHER_STATS_FILE)
-        # 데이터 클리닝 또는 전처리 (예시)
-        df = df.rename(columns=lambda x: x.strip()) # 컬럼명 공백 제거
-        numeric_cols = df.select_dtypes(include=np.number).columns
-        df[numeric_cols] = df[numeric_cols].fillna(0) # 숫자형 컬럼 NaN 0으로 채우기
-        return df
+        return get_registry().get_frame(PITCHER_STATS_FILE, PITCHER_SCHEMA)
     except FileNotFoundError:
         st.error(f"투수 데이터 파일을 찾을 수 없습니다: {PITCHER_STATS_FILE}")
         st.info("샘플 데이터를 대신 사용합니다.")
@@ -45,6 +46,48 @@ def load_pitcher_data():
         st.info("샘플 데이터를 대신 사용합니다.")
         return _create_sample_pitcher_data()
 
+# 선수/시즌 인덱스도 레지스트리 항목에 붙어 데이터 버전과 함께 갱신
+def load_batter_index() -> FrameIndex:
+    """타자 데이터의 PlayerName/PlayerID/Season 인덱스를 반환합니다."""
+    try:
+        return get_registry().get_index(BATTER_STATS_FILE, BATTER_SCHEMA)
+    except Exception:
+        return FrameIndex(load_data())
+
+def load_pitcher_index() -> FrameIndex:
+    """투수 데이터의 PlayerName/PlayerID/Season 인덱스를 반환합니다."""
+    try:
+        return get_registry().get_index(PITCHER_STATS_FILE, PITCHER_SCHEMA)
+    except Exception:
+        return FrameIndex(load_pitcher_data())
+
+# 시즌별 리그 집계 (평균/표준편차를 전체 데이터 재집계 없이 계산)
+def load_aggregates(player_type='batter') -> LeagueAggregateStore:
+    """선수 유형별 시즌 리그 집계를 반환합니다."""
+    path, schema = (BATTER_STATS_FILE, BATTER_SCHEMA) if player_type == 'batter' else (PITCHER_STATS_FILE, PITCHER_SCHEMA)
+    try:
+        return get_registry().get_aggregates(path, schema)
+    except Exception:
+        return LeagueAggregateStore.from_frame(load_data() if player_type == 'batter' else load_pitcher_data())
+
+def get_data_version(player_type='batter'):
+    """데이터 버전을 반환합니다. 파생 데이터 메모이제이션 키로 사용합니다. (로드 실패 시 빈 문자열)"""
+    path, schema = (BATTER_STATS_FILE, BATTER_SCHEMA) if player_type == 'batter' else (PITCHER_STATS_FILE, PITCHER_SCHEMA)
+    try:
+        return get_registry().get(path, schema).version
+    except Exception:
+        return ""
+
+# Marcel 다음 시즌 예측 (리그 전체를 한 번에 계산, 데이터 버전별로 보관)
+@lru_cache(maxsize=4)
+def _marcel_projections(player_type, data_version):
+    data = load_data() if player_type == 'batter' else load_pitcher_data()
+    return project_next_season(data, list(PREDICT_METRIC_RANGES[player_type]), load_aggregates(player_type))
+
+def load_marcel_projections(player_type='batter') -> pd.DataFrame:
+    """선수 유형별 리그 전체 다음 시즌 Marcel 예측을 반환합니다. (반환된 프레임은 변경하지 마세요)"""
+    return _marcel_projections(player_type, get_data_version(player_type))
+
 def load_logo_image(image_path=MLB_LOGO_PATH): # 기본값을 config에서 가져오도록 수정
     """로고 이미지를 로드합니다."""
     try:
@@ -108,8 +151,14 @@ def _create_sample_pitcher_data():
     return pd.DataFrame(data)
 
 # 추가 유틸리티 함수
+_chart_style_applied = False
+
 def set_chart_style():
-    """차트 스타일을 설정합니다. 폰트 경로를 config에서 가져옵니다."""
+    """차트 스타일을 설정합니다. 폰트 경로를 config에서 가져옵니다. (프로세스당 한 번만 적용)"""
+    global _chart_style_applied
+    if _chart_style_applied:
+        return
+    _chart_style_applied = True
     plt.rcParams['font.family'] = 'sans-serif' # 기본 폰트 설정
     if os.path.exists(FONT_PATH):
         plt.rcParams['font.sans-serif'] = [fm.FontProperties(fname=FONT_PATH).get_name(), 'Malgun Gothic', 'AppleGothic', 'sans-serif']
@@ -132,9 +181,10 @@ def set_chart_style():
     plt.rcParams['ytick.labelsize'] = 12
     plt.rcParams['legend.fontsize'] = 12
 
-# matplotlib.font_manager 임포트 추가
-import matplotlib.font_manager as fm
-import seaborn as sns # seaborn 임포트 추가
+@lru_cache(maxsize=None)
+def get_font_properties(font_path=FONT_PATH, size=12):
+    """차트용 폰트 속성을 반환합니다. (처음 호출할 때 matplotlib 로드)"""
+    return fm.FontProperties(fname=font_path, size=size)
 
 def get_player_image_url(player_id):
     """선수의 프로필 이미지 URL을 생성합니다."""